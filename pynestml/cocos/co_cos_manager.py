@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Union
+from typing import Callable, Union
 
 from pynestml.cocos.co_co_all_variables_defined import CoCoAllVariablesDefined
 from pynestml.cocos.co_co_input_port_not_assigned_to import CoCoInputPortNotAssignedTo
@@ -62,6 +62,7 @@ from pynestml.cocos.co_co_function_argument_template_types_consistent import CoC
 from pynestml.cocos.co_co_priorities_correctly_specified import CoCoPrioritiesCorrectlySpecified
 from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.meta_model.ast_synapse import ASTSynapse
+from pynestml.utils.profiler import Profiler
 
 
 class CoCosManager:
@@ -374,41 +375,52 @@ class CoCosManager:
         Checks all context conditions.
         :param neuron: a single neuron object.
         """
-        cls.check_each_block_defined_at_most_once(neuron)
-        cls.check_function_defined(neuron)
-        cls.check_function_declared_and_correctly_typed(neuron)
-        cls.check_variables_unique_in_scope(neuron)
-        cls.check_state_variables_initialized(neuron)
-        cls.check_variables_defined_before_usage(neuron, after_ast_rewrite)
-        cls.check_inline_expressions_have_rhs(neuron)
-        cls.check_inline_has_max_one_lhs(neuron)
-        cls.check_input_ports_not_assigned_to(neuron)
-        cls.check_order_of_equations_correct(neuron)
-        cls.check_numerator_of_unit_is_one_if_numeric(neuron)
-        cls.check_no_nest_namespace_collisions(neuron)
-        cls.check_input_port_qualifier_unique(neuron)
-        cls.check_parameters_not_assigned_outside_parameters_block(neuron)
-        cls.check_continuous_input_ports_not_qualified(neuron)
-        cls.check_input_port_data_type(neuron)
-        cls.check_user_defined_function_correctly_built(neuron)
-        cls.check_initial_ode_initial_values(neuron)
-        cls.check_kernel_type(neuron)
-        cls.check_convolve_cond_curr_is_correct(neuron)
-        cls.check_output_port_defined_if_emit_call(neuron)
-        if not after_ast_rewrite:
-            # units might be incorrect due to e.g. refactoring convolve call (Real type assigned)
-            cls.check_odes_have_consistent_units(neuron)
-            cls.check_ode_functions_have_consistent_units(neuron)        # ODE functions have been removed at this point
-            cls.check_correct_usage_of_kernels(neuron)
-            cls.check_integrate_odes_called_if_equations_defined(neuron)
-        cls.check_invariant_type_correct(neuron)
-        cls.check_vector_in_non_vector_declaration_detected(neuron)
-        cls.check_sum_has_correct_parameter(neuron)
-        cls.check_expression_correct(neuron)
-        cls.check_simple_delta_function(neuron)
-        cls.check_function_argument_template_types_consistent(neuron)
-        cls.check_vector_parameter_declaration(neuron)
-        cls.check_vector_declaration_size(neuron)
-        cls.check_co_co_priorities_correctly_specified(neuron)
-        cls.check_resolution_func_legally_used(neuron)
-        cls.check_input_port_size_type(neuron)
+        with Profiler.timer("cocos", model=neuron.get_name()):
+            cls._run_check(cls.check_each_block_defined_at_most_once, neuron)
+            cls._run_check(cls.check_function_defined, neuron)
+            cls._run_check(cls.check_function_declared_and_correctly_typed, neuron)
+            cls._run_check(cls.check_variables_unique_in_scope, neuron)
+            cls._run_check(cls.check_state_variables_initialized, neuron)
+            cls._run_check(cls.check_variables_defined_before_usage, neuron, after_ast_rewrite)
+            cls._run_check(cls.check_inline_expressions_have_rhs, neuron)
+            cls._run_check(cls.check_inline_has_max_one_lhs, neuron)
+            cls._run_check(cls.check_input_ports_not_assigned_to, neuron)
+            cls._run_check(cls.check_order_of_equations_correct, neuron)
+            cls._run_check(cls.check_numerator_of_unit_is_one_if_numeric, neuron)
+            cls._run_check(cls.check_no_nest_namespace_collisions, neuron)
+            cls._run_check(cls.check_input_port_qualifier_unique, neuron)
+            cls._run_check(cls.check_parameters_not_assigned_outside_parameters_block, neuron)
+            cls._run_check(cls.check_continuous_input_ports_not_qualified, neuron)
+            cls._run_check(cls.check_input_port_data_type, neuron)
+            cls._run_check(cls.check_user_defined_function_correctly_built, neuron)
+            cls._run_check(cls.check_initial_ode_initial_values, neuron)
+            cls._run_check(cls.check_kernel_type, neuron)
+            cls._run_check(cls.check_convolve_cond_curr_is_correct, neuron)
+            cls._run_check(cls.check_output_port_defined_if_emit_call, neuron)
+            if not after_ast_rewrite:
+                # units might be incorrect due to e.g. refactoring convolve call (Real type assigned)
+                cls._run_check(cls.check_odes_have_consistent_units, neuron)
+                cls._run_check(cls.check_ode_functions_have_consistent_units, neuron)        # ODE functions have been removed at this point
+                cls._run_check(cls.check_correct_usage_of_kernels, neuron)
+                cls._run_check(cls.check_integrate_odes_called_if_equations_defined, neuron)
+            cls._run_check(cls.check_invariant_type_correct, neuron)
+            cls._run_check(cls.check_vector_in_non_vector_declaration_detected, neuron)
+            cls._run_check(cls.check_sum_has_correct_parameter, neuron)
+            cls._run_check(cls.check_expression_correct, neuron)
+            cls._run_check(cls.check_simple_delta_function, neuron)
+            cls._run_check(cls.check_function_argument_template_types_consistent, neuron)
+            cls._run_check(cls.check_vector_parameter_declaration, neuron)
+            cls._run_check(cls.check_vector_declaration_size, neuron)
+            cls._run_check(cls.check_co_co_priorities_correctly_specified, neuron)
+            cls._run_check(cls.check_resolution_func_legally_used, neuron)
+            cls._run_check(cls.check_input_port_size_type, neuron)
+
+    @classmethod
+    def _run_check(cls, check: Callable[..., None], neuron: Union[ASTNeuron, ASTSynapse], *args) -> None:
+        """
+        Runs a single context condition check, recording the time it takes if profiling is enabled.
+        :param check: the check, one of the methods of this class
+        :param neuron: a single neuron or synapse object
+        """
+        with Profiler.timer(check.__name__, category="coco", model=neuron.get_name()):
+            check(neuron, *args)
@@ -21,15 +21,18 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Mapping, List, Optional, Sequence, Union
+from typing import Any, Dict, Mapping, List, Optional, Sequence, Tuple, Union
 
 import glob
 import os
+import re
 
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
-from jinja2 import Environment, FileSystemLoader, Template, TemplateRuntimeError
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, TemplateRuntimeError
 
+from pynestml.codegeneration.printers.ast_printer import ASTPrinter
 from pynestml.exceptions.invalid_path_exception import InvalidPathException
 from pynestml.exceptions.invalid_target_exception import InvalidTargetException
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
@@ -39,12 +42,16 @@ from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
+from pynestml.utils.profiler import Profiler
 from pynestml.utils.with_options import WithOptions
 
 
 class CodeGenerator(WithOptions):
     _default_options: Mapping[str, Any] = {}
 
+    # jinja2 environments shared by all code generators in the process, keyed by the template directories
+    _template_envs: Dict[Tuple[str, ...], Environment] = {}
+
     def __init__(self, target, options: Optional[Mapping[str, Any]] = None):
         from pynestml.frontend.pynestml_frontend import get_known_targets
 
@@ -59,7 +66,8 @@ class CodeGenerator(WithOptions):
 
         self._init_templates_list()
 
-    def raise_helper(self, msg):
+    @staticmethod
+    def raise_helper(msg):
         raise TemplateRuntimeError(msg)
 
     def setup_template_env(self):
@@ -118,10 +126,7 @@ class CodeGenerator(WithOptions):
         _template_files = self._get_abs_template_paths(template_files, templates_root_dir)
         _template_dirs = set([os.path.dirname(_file) for _file in _template_files])
 
-        # Environment for neuron templates
-        env = Environment(loader=FileSystemLoader(_template_dirs))
-        env.globals["raise"] = self.raise_helper
-        env.globals["is_delta_kernel"] = ASTUtils.is_delta_kernel
+        env = self._get_template_env(_template_dirs)
 
         # Load all the templates
         _templates = list()
@@ -130,6 +135,28 @@ class CodeGenerator(WithOptions):
 
         return _templates
 
+    @classmethod
+    def _get_template_env(cls, template_dirs: Sequence[str]) -> Environment:
+        """
+        Returns the jinja2 template environment for the given template directories. The environment is created on first use, and then shared by all code generators in the process, so that each template is compiled at most once per process. Compiled templates are furthermore stored in a bytecode cache on disk, which is invalidated when the source of a template changes, so that subsequent processes do not have to compile the templates again.
+        :param template_dirs: the directories containing the templates
+        :return: the jinja2 template environment
+        """
+        key = tuple(sorted(template_dirs))
+        if key not in cls._template_envs:
+            try:
+                bytecode_cache = FileSystemBytecodeCache(pattern="pynestml_%s.cache")
+            except RuntimeError:
+                # no usable cache directory could be found; templates are compiled in each process
+                bytecode_cache = None
+
+            env = Environment(loader=FileSystemLoader(key), bytecode_cache=bytecode_cache)
+            env.globals["raise"] = cls.raise_helper
+            env.globals["is_delta_kernel"] = ASTUtils.is_delta_kernel
+            cls._template_envs[key] = env
+
+        return cls._template_envs[key]
+
     def _get_abs_template_paths(self, template_files: List[str], templates_root_dir: str) -> List[str]:
         """
         Resolve the directory paths and get the absolute paths of the jinja templates.
@@ -198,45 +225,92 @@ class CodeGenerator(WithOptions):
         if not os.path.isdir(FrontendConfiguration.get_target_path()):
             os.makedirs(FrontendConfiguration.get_target_path())
 
-        for _model_templ in model_templates:
-            templ_file_name = os.path.basename(_model_templ.filename)
-            if len(templ_file_name.split(".")) < 2:
-                raise Exception("Template file name \"" + templ_file_name + "\" should be of the form \"PREFIX@NEURON_NAME@SUFFIX.[FILE_EXTENSION.]jinja2\"")
-
-            if len(templ_file_name.split(".")) < 3:
-                file_extension = ""  # no extension, for instance if the template file name is "Makefile.jinja2"
+        # the rendered files are written by a background thread, while the next template is rendered
+        file_writer = ThreadPoolExecutor(max_workers=1)
+        file_writes = []
+
+        # the printed code for each (printer, node) pair is cached while the templates of this model are rendered
+        ASTPrinter.enable_print_cache()
+        try:
+            with Profiler.timer("render", model=model_name):
+                for _model_templ in model_templates:
+                    templ_file_name = os.path.basename(_model_templ.filename)
+                    if len(templ_file_name.split(".")) < 2:
+                        raise Exception("Template file name \"" + templ_file_name + "\" should be of the form \"PREFIX@NEURON_NAME@SUFFIX.[FILE_EXTENSION.]jinja2\"")
+
+                    if len(templ_file_name.split(".")) < 3:
+                        file_extension = ""  # no extension, for instance if the template file name is "Makefile.jinja2"
+                    else:
+                        file_extension = templ_file_name.split(".")[-2]  # for example, "cpp"
+
+                    templ_file_base_name = templ_file_name.split(".")[0]  # for example, "cm_main_@NEURON_NAME@" or "Makefile"
+                    templ_file_base_name = templ_file_base_name.replace(model_name_escape_string, model_name)
+
+                    if file_extension:
+                        templ_file_base_name = templ_file_base_name + "." + file_extension
+                    rendered_templ_file_name = os.path.join(FrontendConfiguration.get_target_path(),
+                                                            templ_file_base_name)
+                    with Profiler.timer(templ_file_name, category="template", model=model_name):
+                        _file = _model_templ.render(template_namespace)
+                    if Logger.is_enabled(LoggingLevel.INFO):
+                        Logger.log_message(message="Rendering template " + rendered_templ_file_name,
+                                           log_level=LoggingLevel.INFO)
+                    file_writes.append(file_writer.submit(self._write_file_if_changed, rendered_templ_file_name, str(_file),
+                                                          str(template_namespace["now"]) if "now" in template_namespace else None))
+        finally:
+            ASTPrinter.disable_print_cache()
+
+        file_writer.shutdown()
+        for file_write in file_writes:
+            file_write.result()    # raises any exception that occurred while writing the file
+
+    @staticmethod
+    def _write_file_if_changed(file_name: str, contents: str, timestamp: Optional[str] = None) -> bool:
+        """
+        Writes the contents to the file, unless the file already exists with the same contents. Files that are left untouched keep their modification time, so that they are not compiled again by the build system.
+        :param file_name: the name of the file
+        :param contents: the contents of the file
+        :param timestamp: the time of code generation as it appears in the contents, if any; a file that only differs in the time of code generation is considered unchanged
+        :return: True if the file was written, False if it was left untouched
+        """
+        if os.path.isfile(file_name):
+            with open(file_name, "r") as f:
+                old_contents = f.read()
+            if timestamp:
+                old_contents = re.sub(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d+)?", "@TIMESTAMP@", old_contents)
+                contents_without_timestamp = contents.replace(timestamp, "@TIMESTAMP@")
             else:
-                file_extension = templ_file_name.split(".")[-2]  # for example, "cpp"
+                contents_without_timestamp = contents
+            if old_contents == contents_without_timestamp:
+                return False
 
-            templ_file_base_name = templ_file_name.split(".")[0]  # for example, "cm_main_@NEURON_NAME@" or "Makefile"
-            templ_file_base_name = templ_file_base_name.replace(model_name_escape_string, model_name)
+        with open(file_name, "w") as f:
+            f.write(contents)
 
-            if file_extension:
-                templ_file_base_name = templ_file_base_name + "." + file_extension
-            rendered_templ_file_name = os.path.join(FrontendConfiguration.get_target_path(),
-                                                    templ_file_base_name)
-            _file = _model_templ.render(template_namespace)
-            Logger.log_message(message="Rendering template " + rendered_templ_file_name,
-                               log_level=LoggingLevel.INFO)
-            with open(rendered_templ_file_name, "w+") as f:
-                f.write(str(_file))
+        return True
 
     def generate_neuron_code(self, neuron: ASTNeuron) -> None:
+        with Profiler.timer("namespace", model=neuron.get_name()):
+            namespace = self._get_neuron_model_namespace(neuron)
         self.generate_model_code(neuron.get_name(),
                                  model_templates=self._model_templates["neuron"],
-                                 template_namespace=self._get_neuron_model_namespace(neuron),
+                                 template_namespace=namespace,
                                  model_name_escape_string="@NEURON_NAME@")
 
     def generate_synapse_code(self, synapse: ASTNeuron) -> None:
+        with Profiler.timer("namespace", model=synapse.get_name()):
+            namespace = self._get_synapse_model_namespace(synapse)
         self.generate_model_code(synapse.get_name(),
                                  model_templates=self._model_templates["synapse"],
-                                 template_namespace=self._get_synapse_model_namespace(synapse),
+                                 template_namespace=namespace,
                                  model_name_escape_string="@SYNAPSE_NAME@")
 
     def generate_module_code(self, neurons: Sequence[ASTNeuron], synapses: Sequence[ASTSynapse]) -> None:
+        with Profiler.timer("namespace", model=FrontendConfiguration.get_module_name()):
+            namespace = self._get_module_namespace(neurons, synapses)
         self.generate_model_code(FrontendConfiguration.get_module_name(),
                                  model_templates=self._module_templates,
-                                 template_namespace=self._get_module_namespace(neurons, synapses),
+                                 template_namespace=namespace,
                                  model_name_escape_string="@MODULE_NAME@")
         code, message = Messages.get_module_generated(FrontendConfiguration.get_target_path())
         Logger.log_message(None, code, message, None, LoggingLevel.INFO)
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+#
+# nest_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from typing import Any, Dict, Optional, Sequence
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+import pynestml
+
+
+class NESTBenchmark:
+    r"""Runtime benchmarks of neuron and synapse models that have been generated and built for NEST Simulator.
+
+    The following scenarios are available:
+
+    - ``population``: a population of unconnected neurons, each driven by an independent Poisson spike train.
+    - ``balanced``: a balanced network of excitatory (80 %) and inhibitory (20 %) neurons with random connectivity of fixed in-degree, driven by independent Poisson spike trains, after Brunel (2000) [1]_.
+    - ``stdp``: the balanced network, in which the connections between excitatory neurons use the given (plastic) synapse model. For synapses generated with NESTML, the neuron model is the one that was generated together with the synapse (for instance, ``iaf_psc_exp_nestml__with_stdp_nestml``).
+
+    The benchmarks require NEST 3. The network is simulated for a warm-up period, which is not measured, followed by the measured simulation. The following quantities are reported:
+
+    - ``real_time_factor``: wall-clock time divided by simulated (biological) time.
+    - ``ns_per_neuron_update``: time spent in updating the neurons per neuron and simulation step.
+    - ``ns_per_synaptic_event``: time spent in delivering spikes per spike delivered through a connection between neurons.
+    - ``memory_per_synapse``: increase in the resident memory of the process per connection between neurons, in bytes.
+
+    The time per neuron update and per synaptic event are taken from the ``time_update`` and ``time_deliver_spike_data`` kernel timers (see ``nest.GetKernelStatus()``), which are only available if NEST was built with detailed timers. Otherwise, the total wall-clock time of the simulation is used instead, so that these values are upper bounds. Quantities that cannot be determined (for instance, because a scenario has no connections between neurons, or the memory of the process cannot be measured on this platform) are reported as ``None``. The values of all kernel timers over the measured simulation are reported in ``kernel_timers``.
+
+    References
+    ----------
+    .. [1] Brunel N (2000). Dynamics of sparsely connected networks of excitatory and inhibitory spiking neurons. Journal of Computational Neuroscience 8(3):183-208.
+    """
+
+    scenarios = ["population", "balanced", "stdp"]
+
+    @classmethod
+    def run_scenario(cls, scenario: str, module_name: str, neuron_model: str, synapse_model: Optional[str] = None,
+                     n_neurons: int = 1000, sim_time: float = 1000., warmup_time: float = 100., resolution: float = .1,
+                     n_threads: int = 1, weight: float = 87.8, g: float = 5., epsilon: float = .1, delay: float = 1.5,
+                     poisson_rate: float = 5000., seed: int = 123) -> Dict[str, Any]:
+        r"""Simulate one scenario and measure its runtime.
+
+        Parameters
+        ----------
+        scenario
+            One of ``"population"``, ``"balanced"`` and ``"stdp"``.
+        module_name
+            Name of the NEST extension module containing the model(s). If ``None``, the models are assumed to be available in NEST already.
+        neuron_model
+            Name of the neuron model in NEST.
+        synapse_model
+            Name of the synapse model in NEST used for the excitatory-to-excitatory connections in the ``stdp`` scenario.
+        n_neurons
+            Number of neurons.
+        sim_time
+            Duration of the measured simulation [ms].
+        warmup_time
+            Duration of the simulation before the measurement starts [ms].
+        resolution
+            Simulation resolution [ms].
+        n_threads
+            Number of threads used by NEST.
+        weight
+            Weight of the excitatory connections (including the Poisson input); the weight of the inhibitory connections is ``-g * weight``.
+        g
+            Relative strength of inhibition.
+        epsilon
+            Connection probability: each neuron receives connections from ``epsilon`` times the number of excitatory, and of inhibitory neurons.
+        delay
+            Delay of the connections between neurons [ms].
+        poisson_rate
+            Rate of the Poisson spike train that drives each neuron [Hz].
+        seed
+            Seed of the random number generator of NEST.
+
+        Returns
+        -------
+        A dictionary of the parameters of the scenario and the measured quantities.
+        """
+        import nest
+
+        if scenario not in cls.scenarios:
+            raise Exception("Unknown benchmark scenario \"" + scenario + "\"; should be one of " + str(cls.scenarios))
+
+        if scenario == "stdp" and synapse_model is None:
+            raise Exception("The \"stdp\" benchmark scenario requires a synapse model")
+
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        if module_name is not None:
+            nest.Install(module_name)
+
+        nest.SetKernelStatus({"resolution": resolution,
+                              "local_num_threads": n_threads,
+                              "rng_seed": seed})
+
+        neurons = nest.Create(neuron_model, n_neurons)
+        noise = nest.Create("poisson_generator", params={"rate": poisson_rate})
+        nest.Connect(noise, neurons, syn_spec={"weight": weight, "delay": delay})
+        spike_recorder = nest.Create("spike_recorder")
+        nest.Connect(neurons, spike_recorder)
+
+        # connections between neurons
+        memory_before_connect = cls._get_resident_memory()
+        n_connections_before_connect = nest.GetKernelStatus("num_connections")
+        if scenario in ["balanced", "stdp"]:
+            n_neurons_exc = int(.8 * n_neurons)
+            neurons_exc = neurons[:n_neurons_exc]
+            neurons_inh = neurons[n_neurons_exc:]
+            conn_spec_exc = {"rule": "fixed_indegree", "indegree": max(1, int(epsilon * n_neurons_exc))}
+            conn_spec_inh = {"rule": "fixed_indegree", "indegree": max(1, int(epsilon * (n_neurons - n_neurons_exc)))}
+            syn_spec_exc = {"weight": weight, "delay": delay}
+            syn_spec_inh = {"weight": -g * weight, "delay": delay}
+
+            if scenario == "stdp":
+                nest.Connect(neurons_exc, neurons_exc, conn_spec_exc, dict(syn_spec_exc, synapse_model=synapse_model))
+                nest.Connect(neurons_exc, neurons_inh, conn_spec_exc, syn_spec_exc)
+            else:
+                nest.Connect(neurons_exc, neurons, conn_spec_exc, syn_spec_exc)
+
+            nest.Connect(neurons_inh, neurons, conn_spec_inh, syn_spec_inh)
+
+        n_synapses = nest.GetKernelStatus("num_connections") - n_connections_before_connect
+        memory_after_connect = cls._get_resident_memory()
+
+        # simulate
+        if warmup_time > 0.:
+            nest.Simulate(warmup_time)
+
+        kernel_timers_before = cls._get_kernel_timers()
+        n_spikes_before = nest.GetStatus(spike_recorder, "n_events")[0]
+        start_time = time.perf_counter()
+        nest.Simulate(sim_time)
+        wall_time = time.perf_counter() - start_time
+        n_spikes = nest.GetStatus(spike_recorder, "n_events")[0] - n_spikes_before
+        kernel_timers = {name: value - kernel_timers_before[name] for name, value in cls._get_kernel_timers().items() if name in kernel_timers_before.keys()}
+
+        # count the spikes delivered through connections between neurons
+        n_synaptic_events = 0
+        if n_synapses > 0:
+            senders = nest.GetStatus(spike_recorder, "events")[0]["senders"]
+            spike_counts = np.bincount(np.asarray(senders[len(senders) - n_spikes:], dtype=int), minlength=max(nest.GetStatus(neurons, "global_id")) + 1)
+            connections = nest.GetConnections(source=neurons, target=neurons)
+            sources = np.array(nest.GetStatus(connections, "source"), dtype=int)
+            n_synaptic_events = int(np.sum(spike_counts[sources]))
+
+        n_steps = int(round(sim_time / resolution))
+        update_time = kernel_timers.get("time_update") or wall_time
+        deliver_time = kernel_timers.get("time_deliver_spike_data") or wall_time
+
+        results = {"scenario": scenario,
+                   "neuron_model": neuron_model,
+                   "synapse_model": synapse_model,
+                   "n_neurons": n_neurons,
+                   "n_synapses": n_synapses,
+                   "n_threads": n_threads,
+                   "resolution": resolution,
+                   "sim_time": sim_time,
+                   "wall_time": wall_time,
+                   "n_spikes": int(n_spikes),
+                   "n_synaptic_events": n_synaptic_events,
+                   "real_time_factor": wall_time / (1E-3 * sim_time),
+                   "ns_per_neuron_update": 1E9 * update_time / (n_neurons * n_steps),
+                   "ns_per_synaptic_event": 1E9 * deliver_time / n_synaptic_events if n_synaptic_events > 0 else None,
+                   "memory_per_synapse": None,
+                   "kernel_timers": kernel_timers}
+
+        if n_synapses > 0 and memory_before_connect is not None and memory_after_connect is not None:
+            results["memory_per_synapse"] = (memory_after_connect - memory_before_connect) / n_synapses
+
+        return results
+
+    @classmethod
+    def _get_kernel_timers(cls) -> Dict[str, float]:
+        r"""Return the values of the kernel timers (the kernel status entries ``time_simulate``, ``time_update``, and so on) in seconds."""
+        import nest
+
+        return {name: value for name, value in nest.GetKernelStatus().items() if name.startswith("time_") and isinstance(value, (int, float))}
+
+    @classmethod
+    def _get_resident_memory(cls) -> Optional[int]:
+        r"""Return the resident memory of the process in bytes, or None if it cannot be determined on this platform."""
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+
+    @classmethod
+    def format_results(cls, results: Dict[str, Any]) -> str:
+        r"""Return a human-readable summary of the results of a scenario."""
+        def format_value(value: Optional[float], fmt: str) -> str:
+            return "n/a" if value is None else fmt.format(value)
+
+        return results["scenario"] + " (" + results["neuron_model"] + (", " + results["synapse_model"] if results["synapse_model"] else "") + "): " \
+            + str(results["n_neurons"]) + " neurons, " + str(results["n_synapses"]) + " synapses, " + str(results["n_spikes"]) + " spikes\n" \
+            + "  real-time factor:       " + format_value(results["real_time_factor"], "{:.3f}") + "\n" \
+            + "  time per neuron update: " + format_value(results["ns_per_neuron_update"], "{:.1f}") + " ns\n" \
+            + "  time per synaptic event: " + format_value(results["ns_per_synaptic_event"], "{:.1f}") + " ns\n" \
+            + "  memory per synapse:     " + format_value(results["memory_per_synapse"], "{:.1f}") + " B"
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    r"""
+    Entry point for the ``nestml-bench`` command-line application.
+
+    Returns
+    -------
+    The process exit code: 0 for success, > 0 for failure
+    """
+    argument_parser = argparse.ArgumentParser(description="Runtime benchmarks of neuron and synapse models that have been generated with NESTML and built for NEST Simulator.\n\n Version " + str(pynestml.__version__),
+                                              formatter_class=argparse.RawDescriptionHelpFormatter)
+    argument_parser.add_argument("--module_name", metavar="NAME", type=str, help="Name of the NEST extension module containing the models.")
+    argument_parser.add_argument("--neuron_model", metavar="NAME", type=str, required=True, help="Name of the neuron model in NEST.")
+    argument_parser.add_argument("--synapse_model", metavar="NAME", type=str, help="Name of the synapse model in NEST, used for the connections between excitatory neurons in the \"stdp\" scenario.")
+    argument_parser.add_argument("--scenario", choices=NESTBenchmark.scenarios, nargs="+", type=str, help="Scenario(s) to simulate. Standard is all scenarios if a synapse model is given, and all but \"stdp\" otherwise.")
+    argument_parser.add_argument("--n_neurons", metavar="N", type=int, default=1000, help="Number of neurons. Standard is 1000.")
+    argument_parser.add_argument("--sim_time", metavar="TIME", type=float, default=1000., help="Duration of the measured simulation in ms. Standard is 1000.")
+    argument_parser.add_argument("--warmup_time", metavar="TIME", type=float, default=100., help="Duration of the simulation before the measurement starts in ms. Standard is 100.")
+    argument_parser.add_argument("--resolution", metavar="TIME", type=float, default=.1, help="Simulation resolution in ms. Standard is 0.1.")
+    argument_parser.add_argument("--n_threads", metavar="N", type=int, default=1, help="Number of threads. Standard is 1.")
+    argument_parser.add_argument("--weight", metavar="WEIGHT", type=float, default=87.8, help="Weight of the excitatory connections; the weight of the inhibitory connections is -g times this value. Standard is 87.8.")
+    argument_parser.add_argument("--g", metavar="G", type=float, default=5., help="Relative strength of inhibition. Standard is 5.")
+    argument_parser.add_argument("--poisson_rate", metavar="RATE", type=float, default=5000., help="Rate of the Poisson spike train that drives each neuron in Hz. Standard is 5000.")
+    argument_parser.add_argument("--output", metavar="PATH", type=str, help="Path to a file in which the results are stored in JSON format.")
+    parsed_args = argument_parser.parse_args(args)
+
+    scenarios = parsed_args.scenario
+    if scenarios is None:
+        scenarios = [scenario for scenario in NESTBenchmark.scenarios if scenario != "stdp" or parsed_args.synapse_model is not None]
+
+    if "stdp" in scenarios and parsed_args.synapse_model is None:
+        argument_parser.error("the \"stdp\" scenario requires --synapse_model")
+
+    all_results = []
+    for scenario in scenarios:
+        results = NESTBenchmark.run_scenario(scenario,
+                                             module_name=parsed_args.module_name,
+                                             neuron_model=parsed_args.neuron_model,
+                                             synapse_model=parsed_args.synapse_model,
+                                             n_neurons=parsed_args.n_neurons,
+                                             sim_time=parsed_args.sim_time,
+                                             warmup_time=parsed_args.warmup_time,
+                                             resolution=parsed_args.resolution,
+                                             n_threads=parsed_args.n_threads,
+                                             weight=parsed_args.weight,
+                                             g=parsed_args.g,
+                                             poisson_rate=parsed_args.poisson_rate)
+        print(NESTBenchmark.format_results(results))
+        all_results.append(results)
+
+    if parsed_args.output:
+        with open(parsed_args.output, "w") as f:
+            json.dump({"pynestml_version": pynestml.__version__,
+                       "results": all_results}, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,6 +34,7 @@ from pynestml.exceptions.invalid_path_exception import InvalidPathException
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
+from pynestml.utils.profiler import Profiler
 
 
 def __add_library_to_sli(lib_path):
@@ -148,21 +149,24 @@ class NESTBuilder(Builder):
 
         # first call cmake with all the arguments
         try:
-            subprocess.check_call(cmake_cmd, stderr=subprocess.STDOUT, shell=shell,
-                                  cwd=str(os.path.join(target_path)))
+            with Profiler.timer("cmake", model=FrontendConfiguration.get_module_name()):
+                subprocess.check_call(cmake_cmd, stderr=subprocess.STDOUT, shell=shell,
+                                      cwd=str(os.path.join(target_path)))
         except subprocess.CalledProcessError as e:
             raise GeneratedCodeBuildException('Error occurred during \'cmake\'! More detailed error messages can be found in stdout.')
 
         # now execute make all
         try:
-            subprocess.check_call(make_all_cmd, stderr=subprocess.STDOUT, shell=shell,
-                                  cwd=str(os.path.join(target_path)))
+            with Profiler.timer("make", model=FrontendConfiguration.get_module_name()):
+                subprocess.check_call(make_all_cmd, stderr=subprocess.STDOUT, shell=shell,
+                                      cwd=str(os.path.join(target_path)))
         except subprocess.CalledProcessError as e:
             raise GeneratedCodeBuildException('Error occurred during \'make all\'! More detailed error messages can be found in stdout.')
 
         # finally execute make install
         try:
-            subprocess.check_call(make_install_cmd, stderr=subprocess.STDOUT, shell=shell,
-                                  cwd=str(os.path.join(target_path)))
+            with Profiler.timer("make_install", model=FrontendConfiguration.get_module_name()):
+                subprocess.check_call(make_install_cmd, stderr=subprocess.STDOUT, shell=shell,
+                                      cwd=str(os.path.join(target_path)))
         except subprocess.CalledProcessError as e:
             raise GeneratedCodeBuildException('Error occurred during \'make install\'! More detailed error messages can be found in stdout.')
@@ -19,12 +19,16 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
+import concurrent.futures
 import datetime
 
 import odetoolbox
+import odetoolbox.shapes
 import pynestml
+import sympy
+import sympy.parsing.sympy_parser
 
 from pynestml.cocos.co_co_nest_delay_decorator_specified import CoCoNESTDelayDecoratorSpecified
 from pynestml.codegeneration.code_generator import CodeGenerator
@@ -42,13 +46,18 @@ from pynestml.codegeneration.printers.nest_cpp_function_call_printer import NEST
 from pynestml.codegeneration.printers.nest_variable_printer import NESTVariablePrinter
 from pynestml.codegeneration.printers.nest2_cpp_function_call_printer import NEST2CppFunctionCallPrinter
 from pynestml.codegeneration.printers.nest_gsl_function_call_printer import NESTGSLFunctionCallPrinter
+from pynestml.codegeneration.printers.nest_population_function_call_printer import NESTPopulationFunctionCallPrinter
+from pynestml.codegeneration.printers.nest_population_variable_printer import NESTPopulationVariablePrinter
 from pynestml.codegeneration.printers.nest2_gsl_function_call_printer import NEST2GSLFunctionCallPrinter
 from pynestml.codegeneration.printers.ode_toolbox_expression_printer import ODEToolboxExpressionPrinter
 from pynestml.codegeneration.printers.ode_toolbox_function_call_printer import ODEToolboxFunctionCallPrinter
 from pynestml.codegeneration.printers.ode_toolbox_variable_printer import ODEToolboxVariablePrinter
 from pynestml.codegeneration.printers.unitless_cpp_simple_expression_printer import UnitlessCppSimpleExpressionPrinter
+from pynestml.exceptions.code_generator_options_exception import CodeGeneratorOptionsException
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.meta_model.ast_assignment import ASTAssignment
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.meta_model.ast_input_port import ASTInputPort
 from pynestml.meta_model.ast_kernel import ASTKernel
 from pynestml.meta_model.ast_neuron import ASTNeuron
@@ -56,16 +65,21 @@ from pynestml.meta_model.ast_neuron_or_synapse import ASTNeuronOrSynapse
 from pynestml.meta_model.ast_node_factory import ASTNodeFactory
 from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
 from pynestml.meta_model.ast_synapse import ASTSynapse
+from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.symbols.real_type_symbol import RealTypeSymbol
 from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.variable_symbol import BlockType, VariableSymbol, VariableType
 from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.model_parser import ModelParser
 from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+from pynestml.utils.profiler import Profiler
 from pynestml.visitors.ast_equations_with_delay_vars_visitor import ASTEquationsWithDelayVarsVisitor
 from pynestml.visitors.ast_equations_with_vector_variables import ASTEquationsWithVectorVariablesVisitor
 from pynestml.visitors.ast_mark_delay_vars_visitor import ASTMarkDelayVarsVisitor
@@ -83,15 +97,57 @@ def find_spiking_post_port(synapse, namespace):
     return None
 
 
+def ode_toolbox_analysis_worker(odetoolbox_indict: Dict[str, Any], disable_analytic_solver: bool, preserve_expressions: Union[bool, Sequence[str]],
+                                simplify_expression: str, log_level: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    r"""
+    Invoke ODE-toolbox analysis via its API, and return the analytic and the numeric solver (either of which can be None).
+
+    Both the input and the output are plain JSON-like dictionaries, so that this function can be run in a different process than the one that holds the model.
+    """
+    solver_result = odetoolbox.analysis(odetoolbox_indict,
+                                        disable_stiffness_check=True,
+                                        disable_analytic_solver=disable_analytic_solver,
+                                        preserve_expressions=preserve_expressions,
+                                        simplify_expression=simplify_expression,
+                                        log_level=log_level)
+    analytic_solver = None
+    analytic_solvers = [x for x in solver_result if x["solver"] == "analytical"]
+    assert len(analytic_solvers) <= 1, "More than one analytic solver not presently supported"
+    if len(analytic_solvers) > 0:
+        analytic_solver = analytic_solvers[0]
+
+    # if numeric solver is required, generate a stepping function that includes each state variable, including the analytic ones
+    numeric_solver = None
+    numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
+    if numeric_solvers:
+        if analytic_solver:
+            # previous solver_result contains both analytic and numeric solver; re-run ODE-toolbox generating only numeric solver
+            solver_result = odetoolbox.analysis(odetoolbox_indict,
+                                                disable_stiffness_check=True,
+                                                disable_analytic_solver=True,
+                                                preserve_expressions=preserve_expressions,
+                                                simplify_expression=simplify_expression,
+                                                log_level=log_level)
+        numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
+        assert len(numeric_solvers) <= 1, "More than one numeric solver not presently supported"
+        if len(numeric_solvers) > 0:
+            numeric_solver = numeric_solvers[0]
+
+    return analytic_solver, numeric_solver
+
+
 class NESTCodeGenerator(CodeGenerator):
     r"""
     Code generator for a NEST Simulator C++ extension module.
 
     Options:
 
+    - **common_subexpression_elimination**: Set to True to factor out the subexpressions that occur more than once in the right-hand sides of the ODEs that are integrated numerically (for instance, the rate functions of the gating variables of Hodgkin-Huxley type models). Each such subexpression is computed once per evaluation of the right-hand side, and stored in a temporary variable. Default: ``False``.
     - **neuron_parent_class**: The C++ class from which the generated NESTML neuron class inherits. Examples: ``"ArchivingNode"``, ``"StructuralPlasticityNode"``. Default: ``"ArchivingNode"``.
     - **neuron_parent_class_include**: The C++ header filename to include that contains **neuron_parent_class**. Default: ``"archiving_node.h"``.
     - **neuron_synapse_pairs**: List of pairs of (neuron, synapse) model names.
+    - **n_processes**: The number of processes in which the ODE-toolbox analyses of the models are run. The analyses of all neurons, and then of all synapses, are started together, and each process analyses one model at a time. As the analysis of a model with ODE-toolbox usually takes most of the time of code generation, setting this to the number of available CPU cores can make generating code for many models considerably faster. The generated code does not depend on this option. Default: ``1`` (all analyses are run one after another in the current process).
+    - **population_node**: Set to True to generate each neuron as a population node. All the neurons of a population node model that are simulated by the same thread store their parameters, state, internals and input buffers together, as one contiguous array for each variable, and are updated in a single loop over the members of the population, rather than by one call to ``update()`` for each neuron. Each neuron remains a separate node in NEST, with its own node ID, that can be connected to, recorded from and have its parameters and state set as usual. Only neurons whose ODEs are all solved analytically, with propagators that do not depend on state variables, and that have no vector variables, delay variables, user-defined functions or paired synapses, can be generated as population nodes; this is checked during code generation. Cannot be combined with the **simd_update** and **numeric_solver** options. Requires NEST 3. Default: ``False``.
     - **preserve_expressions**: Set to True, or a list of strings corresponding to individual variable names, to disable internal rewriting of expressions, and return same output as input expression where possible. Only applies to variables specified as first-order differential equations. (This parameter is passed to ODE-toolbox.)
     - **simplify_expression**: For all expressions ``expr`` that are rewritten by ODE-toolbox: the contents of this parameter string are ``eval()``ed in Python to obtain the final output expression. Override for custom expression simplification steps. Example: ``sympy.simplify(expr)``. Default: ``"sympy.logcombine(sympy.powsimp(sympy.expand(expr)))"``. (This parameter is passed to ODE-toolbox.)
     - **templates**: Path containing jinja templates used to generate code for NEST simulator.
@@ -101,13 +157,20 @@ class NESTCodeGenerator(CodeGenerator):
             - **synapse**: A list of synapse model jinja templates.
         - **module_templates**: A list of the jinja templates or a relative path to a directory containing the templates related to generating the NEST module.
     - **nest_version**: A string identifying the version of NEST Simulator to generate code for. The string corresponds to the NEST Simulator git repository tag or git branch name, for instance, ``"v2.20.2"`` or ``"master"``. The default is the empty string, which causes the NEST version to be automatically identified from the ``nest`` Python module.
+    - **numeric_solver**: A string identifying the method used to integrate the ODEs that are not solved analytically. ``"rkf45"``: adaptive Runge-Kutta-Fehlberg (4, 5) method with error control (see the ``gsl_error_tol`` parameter of the generated model). ``"rk4"``: classical fourth-order Runge-Kutta method, making a single step per simulation timestep. ``"rk4imp"``: adaptive implicit fourth-order Runge-Kutta method at Gaussian points; the implicit equations are solved by fixed-point iteration rather than with the Jacobian, so for stiff systems, ``"bsimp"`` should be used instead. ``"bsimp"``: adaptive implicit Bulirsch-Stoer method of Bader and Deuflhard, for stiff systems; the Jacobian of the system is derived symbolically from the ODEs, or approximated by finite differences if this is not possible. ``"exponential_euler"``: exponential Euler method, making a single step per simulation timestep. Each state variable ``x`` whose ODE is of the form ``x' = a * x + b``, where ``a`` and ``b`` may depend on the other state variables but not on ``x`` itself (as for the gating variables of Hodgkin-Huxley type models), is propagated exactly over the timestep, with ``a`` and ``b`` evaluated at the start of the step. This is also known as the Rush-Larsen method. All other state variables are integrated with the forward Euler method, and a warning is issued for them during code generation. This includes the membrane potential of models with currents that depend non-linearly on it, for instance through instantaneous gating variables (like ``terub_stn``, ``terub_gpe``, ``hill_tononi`` and ``traub_cond_multisyn``) or an exponential spike current (like ``aeif_cond_exp``); the membrane potential of models such as ``hh_psc_alpha`` and ``hh_cond_exp_traub`` is propagated exactly. The methods that make a single step per simulation timestep have a fixed computational cost, but their accuracy depends on the simulation resolution. Default: ``"rkf45"``.
     - **solver**: A string identifying the preferred ODE solver. ``"analytic"`` for propagator solver preferred; fallback to numeric solver in case ODEs are not analytically solvable. Use ``"numeric"`` to disable analytic solver.
+    - **simd_update**: Set to True to generate an ``update()`` function for neurons that is easier for the C++ compiler to vectorise. The spike input buffers of all receptors are stored in one contiguous array, so that the inputs for the current timestep are read and cleared in a single ``#pragma omp simd`` loop over the receptors, rather than one ring buffer at a time. Internals that are not assigned to anywhere in the model (such as the propagators of the analytic solver) are copied into local variables before the loop over the timesteps, so that they do not have to be reloaded from memory in every timestep. The results of the simulation are identical to those obtained without this option. Default: ``False``.
+    - **synapse_propagator_table_size**: If greater than zero, synapses look up the values of the internals that depend on the timestep (such as the propagators of the analytic solver) in a table, rather than evaluating them (and the exponential functions they contain) each time a synapse is updated over the interval between two spikes. The table holds the values for intervals of 1, 2, ..., **synapse_propagator_table_size** times the simulation resolution; each thread has one table per synapse model and combination of parameter values, which is filled on demand. Up to 64 different combinations of parameter values are tabulated per thread; connections with further combinations evaluate their internals directly, as do synapses that assign to an internal in the model. Intervals that are longer than the table, or that are not within 1E-6 resolution steps of a multiple of the resolution (for instance, when using precise spike times), are evaluated directly. As intervals are rounded to the nearest multiple of the resolution, the absolute error in a propagator ``P(h)`` is at most ``1E-6 * resolution * max|dP/dh|``; for a propagator ``exp(-h / tau)``, this is a relative error of at most ``1E-6 * resolution / tau``. Default: ``0`` (disabled).
+    - **synapse_state_type**: The C++ type used to store the real-valued state variables of synapses (such as weights and traces) in each connection. Use ``"float"`` to halve the memory used by these variables; all computations are still carried out in double precision. State variables that are integrated numerically, or that appear in the arguments of ``min()``, ``max()`` or ``clip()``, are always stored as ``"double"``. Default: ``"double"``.
     """
 
     _default_options = {
+        "common_subexpression_elimination": False,
         "neuron_parent_class": "ArchivingNode",
         "neuron_parent_class_include": "archiving_node.h",
         "neuron_synapse_pairs": [],
+        "n_processes": 1,
+        "population_node": False,
         "preserve_expressions": False,
         "simplify_expression": "sympy.logcombine(sympy.powsimp(sympy.expand(expr)))",
         "templates": {
@@ -119,9 +182,37 @@ class NESTCodeGenerator(CodeGenerator):
             "module_templates": ["setup"]
         },
         "nest_version": "",
-        "solver": "analytic"
+        "numeric_solver": "rkf45",
+        "solver": "analytic",
+        "simd_update": False,
+        "synapse_propagator_table_size": 0,
+        "synapse_state_type": "double"
     }
 
+    # functions that always return the same value when called with the same arguments
+    _connection_invariant_function_calls = [PredefinedFunctions.EXP,
+                                            PredefinedFunctions.EXPM1,
+                                            PredefinedFunctions.LN,
+                                            PredefinedFunctions.LOG10,
+                                            PredefinedFunctions.COSH,
+                                            PredefinedFunctions.SINH,
+                                            PredefinedFunctions.TANH,
+                                            PredefinedFunctions.POW,
+                                            PredefinedFunctions.MAX,
+                                            PredefinedFunctions.MIN,
+                                            PredefinedFunctions.CLIP,
+                                            PredefinedFunctions.ABS]
+
+    # methods that can be selected with the "numeric_solver" option
+    _numeric_solvers = ["rkf45", "rk4", "rk4imp", "bsimp", "exponential_euler"]
+
+    # approximate storage size in bytes of the C++ types used for model variables
+    _cpp_type_sizes = {"double": 8,
+                       "float": 4,
+                       "long": 8,
+                       "int": 4,
+                       "bool": 1}
+
     def __init__(self, options: Optional[Mapping[str, Any]] = None):
         super().__init__("NEST", options)
 
@@ -170,6 +261,30 @@ class NESTCodeGenerator(CodeGenerator):
         self._nest_variable_printer_no_origin._expression_printer = self._printer_no_origin
         self._nest_function_call_printer_no_origin._expression_printer = self._printer_no_origin
 
+        # printers for the update loop of neurons generated with the "simd_update" option, which read loop-invariant internals from local variables
+        self._nest_variable_printer_update_loop = NESTVariablePrinter(expression_printer=None, with_origin=True, with_vector_parameter=True)
+        if self.option_exists("nest_version") and (self.get_option("nest_version").startswith("2") or self.get_option("nest_version").startswith("v2")):
+            self._nest_function_call_printer_update_loop = NEST2CppFunctionCallPrinter(None)
+        else:
+            self._nest_function_call_printer_update_loop = NESTCppFunctionCallPrinter(None)
+
+        self._printer_update_loop = CppExpressionPrinter(simple_expression_printer=CppSimpleExpressionPrinter(variable_printer=self._nest_variable_printer_update_loop,
+                                                                                                              constant_printer=self._constant_printer,
+                                                                                                              function_call_printer=self._nest_function_call_printer_update_loop))
+        self._nest_variable_printer_update_loop._expression_printer = self._printer_update_loop
+        self._nest_function_call_printer_update_loop._expression_printer = self._printer_update_loop
+        self._nest_printer_update_loop = CppPrinter(expression_printer=self._printer_update_loop)
+
+        # printers for the update loop of population nodes, which address the variables of the member ``__i`` of the population ``pop``
+        self._nest_variable_printer_population = NESTPopulationVariablePrinter(expression_printer=None, with_origin=True, with_vector_parameter=False)
+        self._nest_function_call_printer_population = NESTPopulationFunctionCallPrinter(None)
+        self._printer_population = CppExpressionPrinter(simple_expression_printer=CppSimpleExpressionPrinter(variable_printer=self._nest_variable_printer_population,
+                                                                                                             constant_printer=self._constant_printer,
+                                                                                                             function_call_printer=self._nest_function_call_printer_population))
+        self._nest_variable_printer_population._expression_printer = self._printer_population
+        self._nest_function_call_printer_population._expression_printer = self._printer_population
+        self._nest_printer_population = CppPrinter(expression_printer=self._printer_population)
+
         # GSL printers
         self._gsl_variable_printer = GSLVariablePrinter(None)
         if self.option_exists("nest_version") and (self.get_option("nest_version").startswith("2") or self.get_option("nest_version").startswith("v2")):
@@ -201,6 +316,20 @@ class NESTCodeGenerator(CodeGenerator):
         ret = super().set_options(options)
         self.setup_template_env()
 
+        if self.option_exists("numeric_solver") and self.get_option("numeric_solver") not in self._numeric_solvers:
+            raise CodeGeneratorOptionsException("Unknown value for the code generator option \"numeric_solver\": \"" + str(self.get_option("numeric_solver")) + "\" (should be one of: " + ", ".join(["\"" + s + "\"" for s in self._numeric_solvers]) + ")")
+
+        if self.option_exists("synapse_state_type") and self.get_option("synapse_state_type") not in ["double", "float"]:
+            raise CodeGeneratorOptionsException("Unknown value for the code generator option \"synapse_state_type\": \"" + str(self.get_option("synapse_state_type")) + "\" (should be \"double\" or \"float\")")
+
+        if self.option_exists("synapse_propagator_table_size") \
+           and (not isinstance(self.get_option("synapse_propagator_table_size"), int) or self.get_option("synapse_propagator_table_size") < 0):
+            raise CodeGeneratorOptionsException("The code generator option \"synapse_propagator_table_size\" should be a non-negative integer (got: \"" + str(self.get_option("synapse_propagator_table_size")) + "\")")
+
+        if self.option_exists("n_processes") \
+           and (not isinstance(self.get_option("n_processes"), int) or self.get_option("n_processes") < 1):
+            raise CodeGeneratorOptionsException("The code generator option \"n_processes\" should be a positive integer (got: \"" + str(self.get_option("n_processes")) + "\")")
+
         return ret
 
     def run_nest_target_specific_cocos(self, neurons: Sequence[ASTNeuron], synapses: Sequence[ASTSynapse]):
@@ -215,6 +344,9 @@ class NESTCodeGenerator(CodeGenerator):
         self.run_nest_target_specific_cocos(neurons, synapses)
         self.analyse_transform_neurons(neurons)
         self.analyse_transform_synapses(synapses)
+        if self.option_exists("population_node") and self.get_option("population_node"):
+            for neuron in neurons:
+                self._check_population_node(neuron)
         self.generate_neurons(neurons)
         self.generate_synapses(synapses)
         self.generate_module_code(neurons, synapses)
@@ -223,6 +355,44 @@ class NESTCodeGenerator(CodeGenerator):
             if Logger.has_errors(astnode):
                 raise Exception("Error(s) occurred during code generation")
 
+    def _check_population_node(self, neuron: ASTNeuron) -> None:
+        r"""
+        Check that a neuron can be generated as a population node (see the ``population_node`` code generator option), and log an error for each restriction that is violated.
+        :param neuron: a single neuron instance, after analysis and transformation
+        """
+        reasons = []
+        if self.get_option("nest_version").startswith("2") or self.get_option("nest_version").startswith("v2"):
+            reasons.append("population nodes require NEST 3")
+
+        if self.option_exists("simd_update") and self.get_option("simd_update"):
+            reasons.append("the \"simd_update\" option cannot be combined with population nodes, which always update their members in a single loop")
+
+        if self.option_exists("numeric_solver") and self.get_option("numeric_solver") != self._default_options["numeric_solver"]:
+            reasons.append("the \"numeric_solver\" option is not supported, as all ODEs of a population node have to be solved analytically")
+
+        if self.numeric_solver.get(neuron.get_name()) is not None:
+            reasons.append("all ODEs have to be solved analytically, as population nodes do not support the GSL integrator")
+        elif self.analytic_solver.get(neuron.get_name()) is not None and self._propagators_are_state_dependent(neuron):
+            reasons.append("propagators that depend on state variables are not supported")
+
+        if neuron.get_vector_state_symbols() \
+           or any([sym.has_vector_parameter() for sym in neuron.get_parameter_symbols() + neuron.get_internal_symbols()]) \
+           or any([port.has_vector_parameter() for port in neuron.get_spike_input_ports() + neuron.get_continuous_input_ports()]):
+            reasons.append("vector variables and input ports are not supported")
+
+        if neuron.has_delay_variables():
+            reasons.append("delay variables are not supported")
+
+        if neuron.get_functions():
+            reasons.append("user-defined functions are not supported")
+
+        if "paired_synapse" in dir(neuron):
+            reasons.append("neurons that are paired with a synapse are not supported")
+
+        for reason in reasons:
+            code, message = Messages.get_population_node_not_supported(neuron.get_name(), reason)
+            Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.ERROR)
+
     def _get_module_namespace(self, neurons: List[ASTNeuron], synapses: List[ASTSynapse]) -> Dict:
         """
         Creates a namespace for generating NEST extension module code
@@ -240,10 +410,18 @@ class NESTCodeGenerator(CodeGenerator):
         Analyse and transform a list of neurons.
         :param neurons: a list of neurons.
         """
+        analyses = {}
         for neuron in neurons:
             code, message = Messages.get_analysing_transforming_neuron(neuron.get_name())
             Logger.log_message(None, code, message, None, LoggingLevel.INFO)
-            spike_updates, post_spike_updates, equations_with_delay_vars, equations_with_vector_vars = self.analyse_neuron(neuron)
+            with Profiler.timer("analysis", model=neuron.get_name()):
+                analyses[neuron.get_name()] = self._prepare_neuron_analysis(neuron)
+
+        solvers = self._run_ode_toolbox_analyses(analyses)
+
+        for neuron in neurons:
+            with Profiler.timer("analysis", model=neuron.get_name()):
+                spike_updates, post_spike_updates, equations_with_delay_vars, equations_with_vector_vars = self._finish_neuron_analysis(neuron, analyses[neuron.get_name()], *solvers[neuron.get_name()])
             neuron.spike_updates = spike_updates
             neuron.post_spike_updates = post_spike_updates
             neuron.equations_with_delay_vars = equations_with_delay_vars
@@ -254,9 +432,17 @@ class NESTCodeGenerator(CodeGenerator):
         Analyse and transform a list of synapses.
         :param synapses: a list of synapses.
         """
+        analyses = {}
         for synapse in synapses:
             Logger.log_message(None, None, "Analysing/transforming synapse {}.".format(synapse.get_name()), None, LoggingLevel.INFO)
-            spike_updates = self.analyse_synapse(synapse)
+            with Profiler.timer("analysis", model=synapse.get_name()):
+                analyses[synapse.get_name()] = self._prepare_synapse_analysis(synapse)
+
+        solvers = self._run_ode_toolbox_analyses(analyses)
+
+        for synapse in synapses:
+            with Profiler.timer("analysis", model=synapse.get_name()):
+                spike_updates = self._finish_synapse_analysis(synapse, analyses[synapse.get_name()], *solvers[synapse.get_name()])
             synapse.spike_updates = spike_updates
 
     def analyse_neuron(self, neuron: ASTNeuron) -> Tuple[Dict[str, ASTAssignment], Dict[str, ASTAssignment],
@@ -268,6 +454,17 @@ class NESTCodeGenerator(CodeGenerator):
         :return: post_spike_updates: list of post-synaptic spike update expressions
         :return: equations_with_delay_vars: list of equations containing delay variables
         """
+        analysis = self._prepare_neuron_analysis(neuron)
+        solvers = self._run_ode_toolbox_analyses({neuron.get_name(): analysis})
+
+        return self._finish_neuron_analysis(neuron, analysis, *solvers[neuron.get_name()])
+
+    def _prepare_neuron_analysis(self, neuron: ASTNeuron) -> Optional[Dict[str, Any]]:
+        """
+        First part of the analysis of a single neuron: transform the equations, and prepare the input for ODE-toolbox.
+        :param neuron: a single neuron.
+        :return: a dictionary with the intermediate results, or None if the neuron has no equations block.
+        """
         code, message = Messages.get_start_processing_model(neuron.get_name())
         Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
 
@@ -277,7 +474,7 @@ class NESTCodeGenerator(CodeGenerator):
             self.non_equations_state_variables[neuron.get_name()].extend(
                 ASTUtils.all_variables_defined_in_block(neuron.get_state_blocks()))
 
-            return [], [], [], []
+            return None
 
         if len(neuron.get_equations_blocks()) > 1:
             raise Exception("Only one equations block per model supported for now")
@@ -301,10 +498,34 @@ class NESTCodeGenerator(CodeGenerator):
         neuron.accept(eqns_with_vector_vars_visitor)
         equations_with_vector_vars = eqns_with_vector_vars_visitor.equations
 
-        analytic_solver, numeric_solver = self.ode_toolbox_analysis(neuron, kernel_buffers)
+        return {"delta_factors": delta_factors,
+                "kernel_buffers": kernel_buffers,
+                "equations_with_delay_vars": equations_with_delay_vars,
+                "equations_with_vector_vars": equations_with_vector_vars,
+                "ode_toolbox_input": self._get_ode_toolbox_input(neuron, kernel_buffers)}
+
+    def _finish_neuron_analysis(self, neuron: ASTNeuron, analysis: Optional[Dict[str, Any]], analytic_solver: Optional[Dict[str, Any]],
+                                numeric_solver: Optional[Dict[str, Any]]) -> Tuple[Dict[str, ASTAssignment], Dict[str, ASTAssignment],
+                                                                                   List[ASTOdeEquation]]:
+        """
+        Second part of the analysis of a single neuron: transform the neuron according to the results of ODE-toolbox.
+        :param neuron: a single neuron.
+        :param analysis: the intermediate results returned by _prepare_neuron_analysis().
+        :param analytic_solver: the analytic solver returned by ODE-toolbox, if any.
+        :param numeric_solver: the numeric solver returned by ODE-toolbox, if any.
+        :return: see analyse_neuron().
+        """
+        if analysis is None:
+            return {}, {}, [], []
+
         self.analytic_solver[neuron.get_name()] = analytic_solver
         self.numeric_solver[neuron.get_name()] = numeric_solver
 
+        delta_factors = analysis["delta_factors"]
+        kernel_buffers = analysis["kernel_buffers"]
+        equations_with_delay_vars = analysis["equations_with_delay_vars"]
+        equations_with_vector_vars = analysis["equations_with_vector_vars"]
+
         self.non_equations_state_variables[neuron.get_name()] = []
         for block in neuron.get_state_blocks():
             for decl in block.get_declarations():
@@ -353,24 +574,54 @@ class NESTCodeGenerator(CodeGenerator):
         Analyse and transform a single synapse.
         :param synapse: a single synapse.
         """
+        analysis = self._prepare_synapse_analysis(synapse)
+        solvers = self._run_ode_toolbox_analyses({synapse.get_name(): analysis})
+
+        return self._finish_synapse_analysis(synapse, analysis, *solvers[synapse.get_name()])
+
+    def _prepare_synapse_analysis(self, synapse: ASTSynapse) -> Optional[Dict[str, Any]]:
+        """
+        First part of the analysis of a single synapse: transform the equations, and prepare the input for ODE-toolbox.
+        :param synapse: a single synapse.
+        :return: a dictionary with the intermediate results, or None if the synapse has no equations block.
+        """
         code, message = Messages.get_start_processing_model(synapse.get_name())
         Logger.log_message(synapse, code, message, synapse.get_source_position(), LoggingLevel.INFO)
 
-        spike_updates = {}
-        if synapse.get_equations_blocks():
-            if len(synapse.get_equations_blocks()) > 1:
-                raise Exception("Only one equations block per model supported for now")
+        if not synapse.get_equations_blocks():
+            return None
 
-            equations_block = synapse.get_equations_blocks()[0]
+        if len(synapse.get_equations_blocks()) > 1:
+            raise Exception("Only one equations block per model supported for now")
 
-            delta_factors = ASTUtils.get_delta_factors_(synapse, equations_block)
-            kernel_buffers = ASTUtils.generate_kernel_buffers_(synapse, equations_block)
-            ASTUtils.replace_convolve_calls_with_buffers_(synapse, equations_block)
-            ASTUtils.make_inline_expressions_self_contained(equations_block.get_inline_expressions())
-            ASTUtils.replace_inline_expressions_through_defining_expressions(
-                equations_block.get_ode_equations(), equations_block.get_inline_expressions())
+        equations_block = synapse.get_equations_blocks()[0]
+
+        delta_factors = ASTUtils.get_delta_factors_(synapse, equations_block)
+        kernel_buffers = ASTUtils.generate_kernel_buffers_(synapse, equations_block)
+        ASTUtils.replace_convolve_calls_with_buffers_(synapse, equations_block)
+        ASTUtils.make_inline_expressions_self_contained(equations_block.get_inline_expressions())
+        ASTUtils.replace_inline_expressions_through_defining_expressions(
+            equations_block.get_ode_equations(), equations_block.get_inline_expressions())
+
+        return {"delta_factors": delta_factors,
+                "kernel_buffers": kernel_buffers,
+                "ode_toolbox_input": self._get_ode_toolbox_input(synapse, kernel_buffers)}
+
+    def _finish_synapse_analysis(self, synapse: ASTSynapse, analysis: Optional[Dict[str, Any]], analytic_solver: Optional[Dict[str, Any]],
+                                 numeric_solver: Optional[Dict[str, Any]]) -> Dict[str, ASTAssignment]:
+        """
+        Second part of the analysis of a single synapse: transform the synapse according to the results of ODE-toolbox.
+        :param synapse: a single synapse.
+        :param analysis: the intermediate results returned by _prepare_synapse_analysis().
+        :param analytic_solver: the analytic solver returned by ODE-toolbox, if any.
+        :param numeric_solver: the numeric solver returned by ODE-toolbox, if any.
+        :return: the spike update expressions.
+        """
+        spike_updates = {}
+        if analysis is not None:
+            delta_factors = analysis["delta_factors"]
+            kernel_buffers = analysis["kernel_buffers"]
 
-            analytic_solver, numeric_solver = self.ode_toolbox_analysis(synapse, kernel_buffers)
             self.analytic_solver[synapse.get_name()] = analytic_solver
             self.numeric_solver[synapse.get_name()] = numeric_solver
 
@@ -394,6 +645,9 @@ class NESTCodeGenerator(CodeGenerator):
             ASTUtils.add_timestep_symbol(synapse)
 
         ASTUtils.update_blocktype_for_common_parameters(synapse)
+        for internal_name in self._get_connection_invariant_internals(synapse):
+            symbol = synapse.get_scope().resolve_to_symbol(internal_name, SymbolKind.VARIABLE)
+            symbol.block_type = BlockType.COMMON_INTERNALS
 
         return spike_updates
 
@@ -419,6 +673,8 @@ class NESTCodeGenerator(CodeGenerator):
         # printers
         namespace["printer"] = self._nest_printer
         namespace["printer_no_origin"] = self._printer_no_origin
+        namespace["update_loop_printer"] = self._nest_printer_update_loop
+        namespace["population_printer"] = self._nest_printer_population
         namespace["gsl_printer"] = self._gsl_printer
         namespace["nestml_printer"] = NESTMLPrinter()
         namespace["type_symbol_printer"] = self._type_symbol_printer
@@ -536,8 +792,199 @@ class NESTCodeGenerator(CodeGenerator):
 
         namespace["spike_updates"] = synapse.spike_updates
 
+        namespace["common_internals"] = []
+        for internals_block in synapse.get_internals_blocks():
+            for decl in internals_block.get_declarations():
+                for variable in decl.get_variables():
+                    symbol = synapse.get_scope().resolve_to_symbol(variable.get_complete_name(), SymbolKind.VARIABLE)
+                    if symbol.block_type == BlockType.COMMON_INTERNALS:
+                        namespace["common_internals"].append(symbol)
+
+        namespace["single_precision_state_variables"] = self._get_single_precision_state_variables(synapse, namespace)
+
+        namespace["recompute_timestep_dependent_internals_only"] = self._internals_depend_only_on_timestep_and_parameters(synapse)
+        namespace["timestep_dependent_internals"] = []
+        namespace["propagator_table_key"] = []
+        namespace["propagator_table_size"] = 0
+        if namespace["recompute_timestep_dependent_internals_only"]:
+            namespace["timestep_dependent_internals"] = self._get_timestep_dependent_internals(synapse)
+            if namespace["timestep_dependent_internals"] \
+               and not any([synapse.get_scope().resolve_to_symbol(name, SymbolKind.VARIABLE).has_vector_parameter() for name in namespace["timestep_dependent_internals"]]):
+                namespace["propagator_table_key"] = self._get_propagator_table_key(synapse, namespace["timestep_dependent_internals"])
+                namespace["propagator_table_size"] = self.get_option("synapse_propagator_table_size")
+
+        connection_size, common_size = self._get_synapse_memory_footprint(synapse, namespace)
+        common_variable_names = [sym.get_symbol_name() for sym in synapse.get_parameter_symbols() if sym.block_type == BlockType.COMMON_PARAMETERS] \
+            + [sym.get_symbol_name() for sym in namespace["common_internals"]]
+        if namespace["uses_numeric_solver"]:
+            common_variable_names.append("gsl_error_tol")
+        code, message = Messages.get_synapse_memory_footprint(synapse.get_name(), connection_size, common_size, common_variable_names, namespace["single_precision_state_variables"])
+        Logger.log_message(synapse, code, message, synapse.get_source_position(), LoggingLevel.INFO)
+
         return namespace
 
+    def _get_connection_invariant_internals(self, synapse: ASTSynapse) -> List[str]:
+        r"""
+        Returns the names of the internals of a synapse that provably have the same value for every connection, so that they can be stored once in the common properties of the synapse instead of in each connection. These are the internals that are computed only from homogeneous parameters, constants and other such internals, and that are never assigned to. Internals that are referenced from the equations block, from user-defined functions or from the remaining (per-connection) internals are excluded, as the common properties are not available in these places.
+        :param synapse: a single synapse instance
+        :return: a list of internal variable names, in declaration order
+        """
+        if synapse.get_name() in self.numeric_solver.keys() and self.numeric_solver[synapse.get_name()] is not None:
+            # the right-hand side of the ODEs is evaluated outside of the synapse class, without access to the common properties
+            return []
+
+        internals = []
+        for internals_block in synapse.get_internals_blocks():
+            for decl in internals_block.get_declarations():
+                for variable in decl.get_variables():
+                    internals.append((variable, decl.get_expression()))
+
+        internal_names = [variable.get_complete_name() for variable, _ in internals]
+        assigned_names = set([assignment.get_variable().get_complete_name() for assignment in ASTUtils.get_all(synapse, ASTAssignment)])
+
+        invariant_names = []
+        for variable, expr in internals:
+            name = variable.get_complete_name()
+            if name == "__h" or expr is None or name in assigned_names or variable.has_vector_parameter():
+                continue
+
+            if any([function_call.get_name() not in self._connection_invariant_function_calls for function_call in ASTUtils.get_all(expr, ASTFunctionCall)]):
+                continue
+
+            if all([self._is_connection_invariant_variable(var, invariant_names) for var in ASTUtils.get_all(expr, ASTVariable)]):
+                invariant_names.append(name)
+
+        while True:
+            nodes = [expr for variable, expr in internals if variable.get_complete_name() not in invariant_names and expr is not None]
+            nodes.extend(synapse.get_equations_blocks())
+            nodes.extend(synapse.get_functions())
+            needed_names = set([var.get_complete_name() for node in nodes for var in ASTUtils.get_all(node, ASTVariable)])
+
+            remaining_names = []
+            for variable, expr in internals:
+                name = variable.get_complete_name()
+                if name in invariant_names and name not in needed_names \
+                   and all([var.get_complete_name() in remaining_names or var.get_complete_name() not in internal_names for var in ASTUtils.get_all(expr, ASTVariable)]):
+                    remaining_names.append(name)
+
+            if remaining_names == invariant_names:
+                return invariant_names
+
+            invariant_names = remaining_names
+
+    def _is_connection_invariant_variable(self, variable: ASTVariable, invariant_internal_names: List[str]) -> bool:
+        symbol = variable.get_scope().resolve_to_symbol(variable.get_complete_name(), SymbolKind.VARIABLE)
+        if symbol is None or symbol.variable_type == VariableType.TYPE:
+            # physical unit
+            return True
+
+        if symbol.is_predefined:
+            return symbol.get_symbol_name() == PredefinedVariables.E_CONSTANT
+
+        return symbol.block_type == BlockType.COMMON_PARAMETERS or variable.get_complete_name() in invariant_internal_names
+
+    def _internals_depend_only_on_timestep_and_parameters(self, synapse: ASTSynapse) -> bool:
+        r"""
+        Returns True if the value of every internal of a synapse is determined by the parameters and the timestep ``__h`` alone, that is, if no internal depends on a state variable, on the current time or on random numbers, and no internal is assigned to in the model. If this is the case, the internals that do not depend on the timestep never have to be recomputed during the simulation, and the internals that do can be saved and restored (or looked up in a table) rather than recomputed.
+        :param synapse: a single synapse instance
+        :return: True if all internals depend on parameters and the timestep only
+        """
+        assigned_variable_names = set([assignment.get_variable().get_complete_name() for assignment in ASTUtils.get_all(synapse, ASTAssignment)])
+        for internals_block in synapse.get_internals_blocks():
+            for decl in internals_block.get_declarations():
+                if any([variable.get_complete_name() in assigned_variable_names for variable in decl.get_variables()]):
+                    # the value assigned in the model is reset by recompute_internal_variables() after each update
+                    return False
+
+                if decl.get_expression() is None:
+                    continue
+
+                if any([function_call.get_name() in [PredefinedFunctions.RANDOM_NORMAL, PredefinedFunctions.RANDOM_UNIFORM] for function_call in ASTUtils.get_all(decl.get_expression(), ASTFunctionCall)]):
+                    return False
+
+                for var in ASTUtils.get_all(decl.get_expression(), ASTVariable):
+                    symbol = var.get_scope().resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE)
+                    if symbol is not None and symbol.block_type in [BlockType.STATE, BlockType.EQUATION] \
+                       and not (symbol.is_predefined and symbol.get_symbol_name() == PredefinedVariables.E_CONSTANT):
+                        return False
+
+        return True
+
+    def _get_propagator_table_key(self, synapse: ASTSynapse, timestep_dependent_internals: List[str]) -> List[ASTVariable]:
+        r"""
+        Returns the parameters and internals (other than the timestep ``__h``) that the given timestep-dependent internals depend on. Tabulated values of the timestep-dependent internals are only valid for a connection if these variables have the same values as when the table was filled.
+        :param synapse: a single synapse instance
+        :param timestep_dependent_internals: names of the internals that depend on the timestep
+        :return: a list of variables, without duplicates
+        """
+        key = {}
+        for internals_block in synapse.get_internals_blocks():
+            for decl in internals_block.get_declarations():
+                if not any([variable.get_complete_name() in timestep_dependent_internals for variable in decl.get_variables()]):
+                    continue
+
+                for var in ASTUtils.get_all(decl.get_expression(), ASTVariable):
+                    if var.get_complete_name() == "__h" or var.get_complete_name() in timestep_dependent_internals or var.get_complete_name() in key.keys():
+                        continue
+
+                    symbol = var.get_scope().resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE)
+                    if symbol is not None and symbol.block_type in [BlockType.PARAMETERS, BlockType.COMMON_PARAMETERS, BlockType.INTERNALS, BlockType.COMMON_INTERNALS]:
+                        key[var.get_complete_name()] = var
+
+        return list(key.values())
+
+    def _get_single_precision_state_variables(self, synapse: ASTSynapse, namespace: Mapping[str, Any]) -> List[str]:
+        r"""
+        Returns the names of the state variables of a synapse that are stored in single precision, according to the ``synapse_state_type`` option. Variables that appear in the arguments of ``min()``, ``max()`` or ``clip()`` are excluded, as ``std::min()`` and ``std::max()`` cannot be called with a mix of ``float`` and ``double`` arguments.
+        :param synapse: a single synapse instance
+        :param namespace: the namespace for the synapse
+        :return: a list of state variable names
+        """
+        if self.get_option("synapse_state_type") == "double" or namespace["uses_numeric_solver"]:
+            return []
+
+        excluded_names = set()
+        for function_call in ASTUtils.get_all(synapse, ASTFunctionCall):
+            if function_call.get_name() in [PredefinedFunctions.MIN, PredefinedFunctions.MAX, PredefinedFunctions.CLIP]:
+                for arg in function_call.get_args():
+                    excluded_names |= set([var.get_complete_name() for var in ASTUtils.get_all(arg, ASTVariable)])
+
+        return [sym.get_symbol_name() for sym in synapse.get_state_symbols()
+                if namespace["declarations"].print_variable_type(sym) == "double"
+                and not sym.has_vector_parameter()
+                and sym.get_symbol_name() not in excluded_names]
+
+    def _get_synapse_memory_footprint(self, synapse: ASTSynapse, namespace: Mapping[str, Any]) -> Tuple[int, int]:
+        r"""
+        Estimates the memory used by a synapse, excluding alignment padding and the members of the NEST base classes other than the target and the delay of each connection. The estimate is only logged for information: it is not used during code generation, and can differ from ``sizeof()`` of the generated class.
+        :param synapse: a single synapse instance
+        :param namespace: the namespace for the synapse
+        :return: the number of bytes used by each connection, and the number of bytes in the common properties that are shared by all connections
+        """
+        def size_of(symbol: VariableSymbol) -> int:
+            if symbol.has_vector_parameter():
+                return 24    # std::vector
+            if symbol.get_symbol_name() in namespace["single_precision_state_variables"]:
+                return self._cpp_type_sizes["float"]
+            return self._cpp_type_sizes.get(namespace["declarations"].print_variable_type(symbol), 8)
+
+        connection_size = 16    # target and delay, stored in the NEST ``Connection`` base class
+        connection_size += 8    # t_lastspike_
+        if namespace.get("vt_ports"):
+            connection_size += 16    # t_last_update_ and vt_spikes_idx_
+        connection_size += sum([size_of(sym) for sym in synapse.get_state_symbols()])
+        connection_size += sum([size_of(sym) for sym in synapse.get_parameter_symbols() if sym.block_type == BlockType.PARAMETERS])
+        connection_size += sum([size_of(sym) for sym in synapse.get_internal_symbols() if sym.block_type == BlockType.INTERNALS])
+        if namespace["uses_numeric_solver"]:
+            connection_size += 8 * len(namespace["numeric_state_variables"])    # ode_state
+
+        common_size = sum([size_of(sym) for sym in synapse.get_parameter_symbols() if sym.block_type == BlockType.COMMON_PARAMETERS])
+        common_size += sum([size_of(sym) for sym in namespace["common_internals"]])
+        if namespace["uses_numeric_solver"]:
+            common_size += 8    # gsl_error_tol
+
+        return connection_size, common_size
+
     def _get_neuron_model_namespace(self, neuron: ASTNeuron) -> Dict:
         """
         Returns a standard namespace with often required functionality.
@@ -636,13 +1083,9 @@ class NESTCodeGenerator(CodeGenerator):
 
             namespace["propagators"] = self.analytic_solver[neuron.get_name()]["propagators"]
 
-            namespace["propagators_are_state_dependent"] = False
-            for prop_name, prop_expr in namespace["propagators"].items():
-                prop_expr_ast = ModelParser.parse_expression(prop_expr)
-
-                for var_sym in neuron.get_state_symbols():
-                    if var_sym.get_symbol_name() in [var.get_name() for var in prop_expr_ast.get_variables()]:
-                        namespace["propagators_are_state_dependent"] = True
+            namespace["propagators_are_state_dependent"] = self._propagators_are_state_dependent(neuron)
+            if namespace["propagators_are_state_dependent"]:
+                namespace["state_dependent_internals"] = self._get_state_dependent_internals(neuron)
 
         # convert variables from ASTVariable instances to strings
         _names = self.non_equations_state_variables[neuron.get_name()]
@@ -697,6 +1140,19 @@ class NESTCodeGenerator(CodeGenerator):
                     marks_delay_vars_visitor = ASTMarkDelayVarsVisitor()
                     expr_ast.accept(marks_delay_vars_visitor)
 
+            # keep the expressions as they were before common subexpression elimination: after it, internals can be referenced only from the temporaries
+            numeric_update_expressions_before_cse = dict(namespace["numeric_update_expressions"])
+
+            namespace["numeric_update_temporaries"] = []
+            if self.option_exists("common_subexpression_elimination") and self.get_option("common_subexpression_elimination") and not neuron.has_delay_variables():
+                namespace["numeric_update_temporaries"], namespace["numeric_update_expressions"] = self._eliminate_common_subexpressions(neuron, namespace["numeric_state_variables"] + namespace["numeric_state_variables_moved"], namespace["numeric_update_expressions"])
+
+            namespace["numeric_solver"] = self.get_option("numeric_solver") if self.option_exists("numeric_solver") else "rkf45"
+            if namespace["numeric_solver"] == "exponential_euler":
+                namespace["exponential_euler_coefficients"] = self._get_exponential_euler_coefficients(neuron, namespace["numeric_state_variables"] + namespace["numeric_state_variables_moved"])
+            elif namespace["numeric_solver"] == "bsimp":
+                namespace["numeric_jacobian"] = self._get_numeric_jacobian(neuron, namespace)
+
             if namespace["uses_numeric_solver"]:
                 if "analytic_state_variables_moved" in namespace.keys():
                     namespace["purely_numeric_state_variables_moved"] = list(
@@ -705,6 +1161,11 @@ class NESTCodeGenerator(CodeGenerator):
                 else:
                     namespace["purely_numeric_state_variables_moved"] = namespace["numeric_state_variables_moved"]
 
+        if "paired_synapse" in dir(neuron):
+            moved_update_expressions = [namespace["update_expressions"][sym] for sym in namespace.get("analytic_state_variables_moved", [])] \
+                + [numeric_update_expressions_before_cse[sym] for sym in namespace.get("numeric_state_variables_moved", [])]
+            namespace["moved_propagators"] = self._get_timestep_dependent_internals(neuron, moved_update_expressions)
+
         namespace["spike_updates"] = neuron.spike_updates
 
         namespace["recordable_state_variables"] = []
@@ -738,58 +1199,321 @@ class NESTCodeGenerator(CodeGenerator):
             if "analytic_state_variables_moved" in namespace.keys():
                 self._nest_variable_printer._state_symbols.extend(namespace["analytic_state_variables_moved"])
         self._gsl_variable_printer._state_symbols = self._nest_variable_printer._state_symbols
+        self._gsl_variable_printer._temporary_symbols = [name for name, _ in namespace.get("numeric_update_temporaries", [])]
         self._nest_variable_printer_no_origin._state_symbols = self._nest_variable_printer._state_symbols
         namespace["numerical_state_symbols"] = self._nest_variable_printer._state_symbols
 
+        namespace["simd_update"] = self.option_exists("simd_update") and self.get_option("simd_update")
+        if namespace["simd_update"]:
+            namespace["update_loop_invariant_internals"] = self._get_update_loop_invariant_internals(neuron, namespace)
+        else:
+            namespace["update_loop_invariant_internals"] = []
+        self._nest_variable_printer_update_loop._state_symbols = self._nest_variable_printer._state_symbols
+        self._nest_variable_printer_update_loop._hoisted_symbols = [sym.get_symbol_name() for sym in namespace["update_loop_invariant_internals"]]
+
+        namespace["population_node"] = self.option_exists("population_node") and self.get_option("population_node")
+
         return namespace
 
+    def _get_update_loop_invariant_internals(self, neuron: ASTNeuron, namespace: Mapping[str, Any]) -> List[VariableSymbol]:
+        r"""
+        Returns the symbols of the scalar internals that are used in the update loop of the neuron, but not assigned to anywhere in the model. Their values do not change during a call to the ``update()`` function of the neuron, so that they can be copied into local variables before the loop over the lags. Unlike members of the neuron object, local variables can be kept in registers across the calls to the NEST kernel inside the loop (for instance, to send spikes), and do not prevent the compiler from vectorising the propagator arithmetic.
+        :param neuron: a single neuron instance
+        :param namespace: the namespace of the neuron
+        :return: a list of variable symbols, in declaration order
+        """
+        assigned_names = set([assignment.get_variable().get_complete_name() for assignment in ASTUtils.get_all(neuron, ASTAssignment)])
+
+        nodes = neuron.get_update_blocks() + [namespace["update_expressions"][sym] for sym in namespace.get("analytic_state_variables", [])]
+        for spike_updates_for_port in namespace["spike_updates"].values():
+            nodes.extend(spike_updates_for_port)
+        used_names = set([var.get_complete_name() for node in nodes for var in ASTUtils.get_all(node, ASTVariable)])
+
+        symbols = []
+        for internals_block in neuron.get_internals_blocks():
+            for decl in internals_block.get_declarations():
+                for variable in decl.get_variables():
+                    symbol = variable.get_scope().resolve_to_symbol(variable.get_complete_name(), SymbolKind.VARIABLE)
+                    if symbol is None or symbol.has_vector_parameter() or symbol.get_symbol_name() in assigned_names \
+                       or symbol.get_symbol_name() not in used_names:
+                        continue
+
+                    symbols.append(symbol)
+
+        return symbols
+
+    def _get_numeric_update_expression_derivative(self, neuron: ASTNeuron, var_name: str, wrt_var_name: str) -> Optional[sympy.Expr]:
+        r"""
+        Differentiate the right-hand side of the ODE for a numerically integrated state variable, as generated by ODE-toolbox, with respect to a state variable.
+        :param neuron: a single neuron instance
+        :param var_name: the name of the state variable whose ODE is differentiated
+        :param wrt_var_name: the name of the state variable with respect to which the derivative is taken
+        :return: the derivative as a sympy expression, or None if it could not be computed symbolically
+        """
+        expr_str = self.numeric_solver[neuron.get_name()]["update_expressions"][var_name]
+        try:
+            derivative = sympy.diff(sympy.parsing.sympy_parser.parse_expr(expr_str, global_dict=odetoolbox.shapes.Shape._sympy_globals), sympy.Symbol(wrt_var_name))
+        except Exception:
+            return None
+
+        if derivative.has(sympy.Derivative, sympy.DiracDelta, sympy.Subs):
+            return None
+
+        return derivative
+
+    def _simplify_sympy_expression(self, expr: sympy.Expr) -> sympy.Expr:
+        r"""
+        Simplify a sympy expression in the same way as ODE-toolbox simplifies its output, according to the ``simplify_expression`` option.
+        :param expr: the sympy expression
+        :return: the simplified expression, or the original expression if it could not be simplified
+        """
+        try:
+            return eval(self.get_option("simplify_expression"), {"sympy": sympy}, {"expr": expr})
+        except Exception:
+            return expr
+
+    def _sympy_expression_to_ast(self, neuron: ASTNeuron, expr: sympy.Expr) -> ASTExpression:
+        r"""
+        Convert a sympy expression in terms of the variables of the ``equations`` block into a NESTML expression.
+        :param neuron: a single neuron instance
+        :param expr: the sympy expression
+        :return: the NESTML expression, with its scope set to that of the ``equations`` block
+        """
+        expr_str = ODEToolboxUtils._print_sympy_expression(expr)
+        expr_ast = ModelParser.parse_expression(expr_str)
+        expr_ast.update_scope(neuron.get_equations_blocks()[0].get_scope())
+        expr_ast.accept(ASTSymbolTableVisitor())
+
+        return expr_ast
+
+    def _eliminate_common_subexpressions(self, neuron: ASTNeuron, state_variable_names: List[str], update_expressions: Dict[str, ASTExpression]) -> Tuple[List[Tuple[str, ASTExpression]], Dict[str, ASTExpression]]:
+        r"""
+        Find the subexpressions that occur more than once in the right-hand sides of the ODEs of the given state variables, as generated by ODE-toolbox, using ``sympy.cse()``.
+        :param neuron: a single neuron instance
+        :param state_variable_names: the names of the state variables that are integrated numerically
+        :param update_expressions: a map from state variable name to the right-hand side of its ODE, which is returned unchanged if the right-hand sides could not be processed with sympy
+        :return: a list of (name, expression) pairs for the temporary variables, in the order in which they have to be computed, and a map from state variable name to the right-hand side of its ODE in terms of the temporary variables
+        """
+        try:
+            exprs = [sympy.parsing.sympy_parser.parse_expr(self.numeric_solver[neuron.get_name()]["update_expressions"][var_name], global_dict=odetoolbox.shapes.Shape._sympy_globals)
+                     for var_name in state_variable_names]
+        except Exception:
+            return [], update_expressions
+
+        replacements, reduced_exprs = sympy.cse(exprs, symbols=sympy.numbered_symbols("__cse_"))
+        temporaries = [(str(sym), self._sympy_expression_to_ast(neuron, expr)) for sym, expr in replacements]
+        reduced_update_expressions = {var_name: self._sympy_expression_to_ast(neuron, expr) for var_name, expr in zip(state_variable_names, reduced_exprs)}
+
+        return temporaries, reduced_update_expressions
+
+    def _get_exponential_euler_coefficients(self, neuron: ASTNeuron, state_variable_names: List[str]) -> Dict[str, ASTExpression]:
+        r"""
+        For each of the given state variables ``x`` whose ODE ``x' = f`` is linear in ``x`` itself, that is, ``f = a * x + b`` where ``a`` and ``b`` may depend on other state variables but not on ``x``, returns the coefficient ``a = df/dx``. The derivative is computed with sympy from the right-hand side of the ODE generated by ODE-toolbox. A warning is issued for the variables with a right-hand side that is not linear in the variable, which are integrated with the forward Euler method instead.
+        :param neuron: a single neuron instance
+        :param state_variable_names: the names of the state variables that are integrated numerically
+        :return: a map from state variable name to the expression for the coefficient ``a``
+        """
+        coefficients = {}
+        not_linear_names = []
+        for var_name in state_variable_names:
+            coefficient = self._get_numeric_update_expression_derivative(neuron, var_name, var_name)
+            if coefficient is None or sympy.Symbol(var_name) in coefficient.free_symbols:
+                not_linear_names.append(var_name)
+                continue
+
+            if coefficient == 0:
+                # the ODE does not depend on the variable itself; use the forward Euler method
+                continue
+
+            coefficients[var_name] = self._sympy_expression_to_ast(neuron, self._simplify_sympy_expression(coefficient))
+
+        if not_linear_names:
+            code, message = Messages.get_exponential_euler_not_linear(neuron.get_name(), not_linear_names)
+            Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.WARNING)
+
+        return coefficients
+
+    def _get_numeric_jacobian(self, neuron: ASTNeuron, namespace: Dict[str, Any]) -> Optional[List[Tuple[str, str, ASTExpression]]]:
+        r"""
+        Compute the Jacobian of the system of ODEs that is integrated numerically, for use by implicit GSL stepping functions.
+
+        The rows of the Jacobian correspond to the numerically integrated state variables, and the columns to all state variables in the ODE state vector (including those that are solved analytically, on which the numeric ODEs may depend). The rows of the analytically solved state variables are zero, as their values are replaced by the analytic solution after each integration step.
+
+        :param neuron: a single neuron instance
+        :param namespace: the namespace of the neuron
+        :return: a list of (row variable name, column variable name, expression) tuples for the nonzero entries, or None if the Jacobian could not be computed symbolically
+        """
+        numeric_state_variables = namespace["numeric_state_variables"] + namespace["numeric_state_variables_moved"]
+        state_variables = numeric_state_variables + [sym for sym in namespace.get("analytic_state_variables", []) + namespace.get("analytic_state_variables_moved", [])
+                                                     if sym not in numeric_state_variables]
+        jacobian = []
+        for var_name in numeric_state_variables:
+            for wrt_var_name in state_variables:
+                derivative = self._get_numeric_update_expression_derivative(neuron, var_name, wrt_var_name)
+                if derivative is None:
+                    code, message = Messages.get_analytic_jacobian_not_available(neuron.get_name(), var_name)
+                    Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
+                    return None
+
+                if derivative == 0:
+                    continue
+
+                jacobian.append((var_name, wrt_var_name, self._sympy_expression_to_ast(neuron, derivative)))
+
+        return jacobian
+
+    def _get_internals(self, neuron: ASTNeuronOrSynapse) -> List[Tuple[str, Optional[ASTExpression]]]:
+        r"""
+        Returns the internals of a model, with their declaring expressions.
+        :param neuron: a single neuron or synapse instance
+        :return: a list of (variable name, declaring expression) pairs, in declaration order
+        """
+        internals = []
+        for internals_block in neuron.get_internals_blocks():
+            for decl in internals_block.get_declarations():
+                for variable in decl.get_variables():
+                    internals.append((variable.get_complete_name(), decl.get_expression()))
+
+        return internals
+
+    def _get_internals_depending_on(self, neuron: ASTNeuronOrSynapse, names: Set[str]) -> Set[str]:
+        r"""
+        Returns the names of the internals whose declaring expressions depend on any of the variables with the given names, directly or through other internals.
+        :param neuron: a single neuron or synapse instance
+        :param names: a set of variable names
+        :return: a set of internal variable names
+        """
+        dependent_names = set()
+        for name, expr in self._get_internals(neuron):
+            if name in names or expr is None:
+                continue
+
+            if any([var.get_complete_name() in names or var.get_complete_name() in dependent_names for var in ASTUtils.get_all(expr, ASTVariable)]):
+                dependent_names.add(name)
+
+        return dependent_names
+
+    def _propagators_are_state_dependent(self, neuron: ASTNeuron) -> bool:
+        r"""
+        Returns whether any of the propagators of the analytic solver depends on a state variable, so that the propagators have to be recomputed in each call to the ``update()`` function of the neuron.
+        :param neuron: a single neuron instance, for which an analytic solver was found
+        :return: True if a propagator depends on a state variable
+        """
+        state_names = [var_sym.get_symbol_name() for var_sym in neuron.get_state_symbols()]
+        for prop_expr in self.analytic_solver[neuron.get_name()]["propagators"].values():
+            prop_expr_ast = ModelParser.parse_expression(prop_expr)
+            if any([var.get_name() in state_names for var in prop_expr_ast.get_variables()]):
+                return True
+
+        return False
+
+    def _get_state_dependent_internals(self, neuron: ASTNeuron) -> List[str]:
+        r"""
+        Returns the names of the internals that have to be recomputed in each call to the ``update()`` function of a neuron with state-dependent propagators.
+
+        The internals of a neuron fall into three classes: those that depend only on the simulation resolution (such as ``__h``), those that depend on parameters (and possibly the resolution), and those that depend on state variables. The first two classes only change when the resolution or the parameters are changed, after which all internals are recomputed. Only the internals in the third class change during the simulation. Internals that are assigned to in the model, or that draw random numbers, are also included, so that they are reset to their declaring expression as before.
+
+        :param neuron: a single neuron instance
+        :return: a list of internal variable names, in declaration order
+        """
+        internals = self._get_internals(neuron)
+        assigned_names = set([assignment.get_variable().get_complete_name() for assignment in ASTUtils.get_all(neuron, ASTAssignment)])
+        state_names = set([sym.get_symbol_name() for sym in neuron.get_state_symbols()])
+
+        names = set()
+        for name, expr in internals:
+            if name in assigned_names or (expr is not None and any([function_call.get_name().startswith("random") for function_call in ASTUtils.get_all(expr, ASTFunctionCall)])):
+                names.add(name)
+
+        names |= self._get_internals_depending_on(neuron, state_names | names)
+
+        return [name for name, _ in internals if name in names]
+
+    def _get_timestep_dependent_internals(self, neuron: ASTNeuronOrSynapse, exprs: Optional[List[ASTExpression]] = None) -> List[str]:
+        r"""
+        Returns the names of the internals that depend on the timestep ``__h`` (such as propagators), directly or through other internals, and that are needed to evaluate the given expressions. This allows a model to propagate (a subset of) its state variables over an arbitrary interval by recomputing only these internals, rather than all of them.
+        :param neuron: a single neuron or synapse instance
+        :param exprs: a list of expressions. If None, all internals that depend on the timestep are returned.
+        :return: a list of internal variable names, in declaration order
+        """
+        internals = self._get_internals(neuron)
+        timestep_dependent_names = self._get_internals_depending_on(neuron, set(["__h"]))
+
+        if exprs is None:
+            return [name for name, _ in internals if name in timestep_dependent_names]
+
+        needed_names = set([var.get_complete_name() for expr in exprs for var in ASTUtils.get_all(expr, ASTVariable)])
+        for name, expr in reversed(internals):
+            if name in needed_names and name in timestep_dependent_names:
+                needed_names |= set([var.get_complete_name() for var in ASTUtils.get_all(expr, ASTVariable)])
+
+        return [name for name, _ in internals if name in timestep_dependent_names and name in needed_names]
+
     def ode_toolbox_analysis(self, neuron: ASTNeuron, kernel_buffers: Mapping[ASTKernel, ASTInputPort]):
         """
         Prepare data for ODE-toolbox input format, invoke ODE-toolbox analysis via its API, and return the output.
         """
+        odetoolbox_indict = self._get_ode_toolbox_input(neuron, kernel_buffers)
+        if odetoolbox_indict is None:
+            # no equations defined -> no changes to the neuron
+            return None, None
+
+        with Profiler.timer("ode_toolbox", model=neuron.get_name()):
+            return ode_toolbox_analysis_worker(odetoolbox_indict, **self._get_ode_toolbox_options())
+
+    def _get_ode_toolbox_input(self, neuron: ASTNeuronOrSynapse, kernel_buffers: Mapping[ASTKernel, ASTInputPort]) -> Optional[Dict[str, Any]]:
+        """
+        Prepare data for ODE-toolbox input format.
+        :return: the input for ODE-toolbox, or None if there are no equations to analyse.
+        """
         assert len(neuron.get_equations_blocks()) <= 1, "Only one equations block supported for now."
         assert len(neuron.get_parameters_blocks()) <= 1, "Only one parameters block supported for now."
 
         equations_block = neuron.get_equations_blocks()[0]
 
         if len(equations_block.get_kernels()) == 0 and len(equations_block.get_ode_equations()) == 0:
-            # no equations defined -> no changes to the neuron
-            return None, None
+            return None
 
         odetoolbox_indict = ASTUtils.transform_ode_and_kernels_to_json(neuron, neuron.get_parameters_blocks(), kernel_buffers, printer=self._ode_toolbox_printer)
         odetoolbox_indict["options"] = {}
         odetoolbox_indict["options"]["output_timestep_symbol"] = "__h"
-        disable_analytic_solver = self.get_option("solver") != "analytic"
-        solver_result = odetoolbox.analysis(odetoolbox_indict,
-                                            disable_stiffness_check=True,
-                                            disable_analytic_solver=disable_analytic_solver,
-                                            preserve_expressions=self.get_option("preserve_expressions"),
-                                            simplify_expression=self.get_option("simplify_expression"),
-                                            log_level=FrontendConfiguration.logging_level)
-        analytic_solver = None
-        analytic_solvers = [x for x in solver_result if x["solver"] == "analytical"]
-        assert len(analytic_solvers) <= 1, "More than one analytic solver not presently supported"
-        if len(analytic_solvers) > 0:
-            analytic_solver = analytic_solvers[0]
-
-        # if numeric solver is required, generate a stepping function that includes each state variable, including the analytic ones
-        numeric_solver = None
-        numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
-        if numeric_solvers:
-            if analytic_solver:
-                # previous solver_result contains both analytic and numeric solver; re-run ODE-toolbox generating only numeric solver
-                solver_result = odetoolbox.analysis(odetoolbox_indict,
-                                                    disable_stiffness_check=True,
-                                                    disable_analytic_solver=True,
-                                                    preserve_expressions=self.get_option("preserve_expressions"),
-                                                    simplify_expression=self.get_option("simplify_expression"),
-                                                    log_level=FrontendConfiguration.logging_level)
-            numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
-            assert len(numeric_solvers) <= 1, "More than one numeric solver not presently supported"
-            if len(numeric_solvers) > 0:
-                numeric_solver = numeric_solvers[0]
-
-        return analytic_solver, numeric_solver
+
+        return odetoolbox_indict
+
+    def _get_ode_toolbox_options(self) -> Dict[str, Any]:
+        """
+        Return the keyword arguments of ode_toolbox_analysis_worker() other than the input.
+        """
+        return {"disable_analytic_solver": self.get_option("solver") != "analytic",
+                "preserve_expressions": self.get_option("preserve_expressions"),
+                "simplify_expression": self.get_option("simplify_expression"),
+                "log_level": FrontendConfiguration.logging_level}
+
+    def _run_ode_toolbox_analyses(self, analyses: Mapping[str, Optional[Dict[str, Any]]]) -> Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """
+        Run the ODE-toolbox analyses of several models, in parallel if the ``n_processes`` code generator option is greater than one.
+        :param analyses: for each model name, the intermediate results returned by _prepare_neuron_analysis() or _prepare_synapse_analysis().
+        :return: for each model name, the analytic and the numeric solver (either of which can be None).
+        """
+        solvers = {model_name: (None, None) for model_name in analyses.keys()}
+        odetoolbox_indicts = {model_name: analysis["ode_toolbox_input"] for model_name, analysis in analyses.items()
+                              if analysis is not None and analysis["ode_toolbox_input"] is not None}
+        options = self._get_ode_toolbox_options()
+
+        n_processes = min(self.get_option("n_processes"), len(odetoolbox_indicts))
+        if n_processes > 1:
+            with Profiler.timer("ode_toolbox"):
+                with concurrent.futures.ProcessPoolExecutor(max_workers=n_processes) as executor:
+                    futures = {model_name: executor.submit(ode_toolbox_analysis_worker, odetoolbox_indict, **options)
+                               for model_name, odetoolbox_indict in odetoolbox_indicts.items()}
+                    for model_name, future in futures.items():
+                        solvers[model_name] = future.result()
+        else:
+            for model_name, odetoolbox_indict in odetoolbox_indicts.items():
+                with Profiler.timer("ode_toolbox", model=model_name):
+                    solvers[model_name] = ode_toolbox_analysis_worker(odetoolbox_indict, **options)
+
+        return solvers
 
     def update_symbol_table(self, neuron) -> None:
         """
@@ -869,7 +1593,8 @@ class NESTCodeGenerator(CodeGenerator):
                         # this case covers variables that were moved from synapse to the neuron
                         post_spike_updates[kernel_var.get_name()] = ast_assignment
                     elif "_is_post_port" in dir(spike_input_port.get_variable()) and spike_input_port.get_variable()._is_post_port:
-                        Logger.log_message(None, None, "Adding post assignment string: " + str(ast_assignment), None, LoggingLevel.INFO)
+                        if Logger.is_enabled(LoggingLevel.INFO):
+                            Logger.log_message(None, None, "Adding post assignment string: " + str(ast_assignment), None, LoggingLevel.INFO)
                         spike_updates[str(spike_input_port)].append(ast_assignment)
                     else:
                         spike_updates[str(spike_input_port)].append(ast_assignment)
@@ -41,7 +41,7 @@ class NESTCodeGeneratorUtils:
         if variable_symbol.block_type == BlockType.PARAMETERS:
             return 'P_.%s'
 
-        if variable_symbol.block_type == BlockType.COMMON_PARAMETERS:
+        if variable_symbol.block_type in [BlockType.COMMON_PARAMETERS, BlockType.COMMON_INTERNALS]:
             return 'cp.%s'
 
         if variable_symbol.block_type == BlockType.INTERNALS:
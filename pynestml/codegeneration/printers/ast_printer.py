@@ -19,11 +19,43 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional, Tuple
+
 from abc import ABCMeta, abstractmethod
 
+import functools
+
 from pynestml.meta_model.ast_node import ASTNode
 
 
+def memoise_print(print_func: Callable[[ASTPrinter, ASTNode], str]) -> Callable[[ASTPrinter, ASTNode], str]:
+    r"""
+    Decorator for the ``print()`` method of a printer. While the print cache is enabled (see ``ASTPrinter.enable_print_cache()``), the string printed for a node is stored, and returned without printing the node again, until the AST is modified.
+    """
+    @functools.wraps(print_func)
+    def wrapper(self: ASTPrinter, node: ASTNode) -> str:
+        cache = ASTPrinter._print_cache
+        if cache is None:
+            return print_func(self, node)
+
+        key = (id(self), id(node))
+        entry = cache.get(key)
+        version = ASTNode.get_version()
+        if entry is not None and entry[0] is node and entry[1] == version:
+            return entry[2]
+
+        s = print_func(self, node)
+
+        # the entry keeps a reference to the node, so that its id cannot be reused by another node while the cache is in use
+        cache[key] = (node, version, s)
+
+        return s
+
+    return wrapper
+
+
 class ASTPrinter(metaclass=ABCMeta):
     r"""
     Printer for ``ASTNode``s.
@@ -31,11 +63,29 @@ class ASTPrinter(metaclass=ABCMeta):
     Printers are instantiated rather than having only static methods. This is the "compositionality over inheritance" pattern, chosen because "lower" grammar elements need to be printed in different ways (for instance, references to variables which could live in different data structures depending on the context) while the "higher" grammar element printers stay the same (for instance, printing a composite expression).
 
     Some printers have internal parameters/settings, like the ``with_vector_parameter`` attribute of the ``NESTVariablePrinter``.
+
+    The same (sub-)expressions are typically printed many times while rendering the templates for a model. While rendering, the code generator enables a cache that maps each (printer, node) pair to the printed string. As the settings of a printer are not changed while the templates are being rendered, the printer instance identifies the configuration it prints with. Cache entries are invalidated as soon as any node in the AST is modified (see ``ASTNode.get_version()``).
     """
 
+    _print_cache: Optional[Dict[Tuple[int, int], Tuple[ASTNode, int, str]]] = None
+
     def __init__(self):
         pass
 
     @abstractmethod
     def print(self, node: ASTNode) -> str:
         raise Exception("Cannot call abstract method")
+
+    @classmethod
+    def enable_print_cache(cls) -> None:
+        r"""
+        Enable the print cache for all printers, starting from an empty cache.
+        """
+        ASTPrinter._print_cache = {}
+
+    @classmethod
+    def disable_print_cache(cls) -> None:
+        r"""
+        Disable the print cache for all printers, and release the cached strings.
+        """
+        ASTPrinter._print_cache = None
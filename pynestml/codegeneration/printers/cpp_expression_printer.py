@@ -19,6 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from pynestml.codegeneration.printers.ast_printer import memoise_print
 from pynestml.codegeneration.printers.expression_printer import ExpressionPrinter
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
 from pynestml.meta_model.ast_bit_operator import ASTBitOperator
@@ -37,6 +38,7 @@ class CppExpressionPrinter(ExpressionPrinter):
     Printer for ``ASTExpression`` nodes in C++ syntax.
     """
 
+    @memoise_print
     def print(self, node: ASTNode) -> str:
         if isinstance(node, ASTExpression):
             if node.get_implicit_conversion_factor() and not node.get_implicit_conversion_factor() == 1:
@@ -69,22 +69,18 @@ class CppPrinter(ModelPrinter):
         raise Exception("Could not print node: " + str(node))
 
     def print_assignment(self, node: ASTAssignment) -> str:
-        ret = self._expression_printer.print(node.lhs)
-        ret += ' '
         if node.is_compound_quotient:
-            ret += '/='
+            operator = "/="
         elif node.is_compound_product:
-            ret += '*='
+            operator = "*="
         elif node.is_compound_minus:
-            ret += '-='
+            operator = "-="
         elif node.is_compound_sum:
-            ret += '+='
+            operator = "+="
         else:
-            ret += '='
+            operator = "="
 
-        ret += ' ' + self.print(node.rhs)
-
-        return ret
+        return " ".join([self._expression_printer.print(node.lhs), operator, self.print(node.rhs)])
 
     def print_delay_parameter(self, variable: VariableSymbol) -> str:
         """
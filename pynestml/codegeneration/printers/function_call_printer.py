@@ -25,7 +25,7 @@ from typing import TYPE_CHECKING
 
 from abc import ABCMeta, abstractmethod
 
-from pynestml.codegeneration.printers.ast_printer import ASTPrinter
+from pynestml.codegeneration.printers.ast_printer import ASTPrinter, memoise_print
 from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.meta_model.ast_node import ASTNode
 
@@ -60,6 +60,7 @@ class FunctionCallPrinter(ASTPrinter, metaclass=ABCMeta):
         """
         return ""
 
+    @memoise_print
     def print(self, node: ASTNode) -> str:
         assert isinstance(node, ASTFunctionCall)
         return self.print_function_call(node)
@@ -34,6 +34,7 @@ class GSLVariablePrinter(CppVariablePrinter):
     def __init__(self, expression_printer: ExpressionPrinter) -> None:
         super().__init__(expression_printer)
         self._state_symbols = []
+        self._temporary_symbols = []
 
     def print_variable(self, node: ASTVariable) -> str:
         """
@@ -42,6 +43,10 @@ class GSLVariablePrinter(CppVariablePrinter):
         :return: a gsl processable format of the variable
         """
         assert isinstance(node, ASTVariable)
+
+        if node.get_complete_name() in self._temporary_symbols:
+            # local variable of the stepping function
+            return node.get_complete_name()
         symbol = node.get_scope().resolve_to_symbol(node.get_complete_name(), SymbolKind.VARIABLE)
 
         if node.is_delay_variable():
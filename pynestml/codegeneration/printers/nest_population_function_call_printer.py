@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+#
+# nest_population_function_call_printer.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from pynestml.codegeneration.printers.nest_cpp_function_call_printer import NESTCppFunctionCallPrinter
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+
+
+class NESTPopulationFunctionCallPrinter(NESTCppFunctionCallPrinter):
+    r"""
+    Printer for ASTFunctionCall in C++ syntax, for the update loop of population nodes. Spikes are emitted on behalf of the member with index ``__i`` in the population ``pop``, rather than by the node that runs the loop.
+    """
+
+    def _print_function_call_format_string(self, function_call: ASTFunctionCall) -> str:
+        function_name = function_call.get_name()
+
+        if function_name == PredefinedFunctions.EMIT_SPIKE:
+            return 'pop.members_[__i]->set_spiketime(nest::Time::step(origin.get_steps()+lag+1));\n' \
+                   'nest::SpikeEvent se;\n' \
+                   'nest::kernel().event_delivery_manager.send(*pop.members_[__i], se, lag)'
+
+        return super()._print_function_call_format_string(function_call)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# nest_population_variable_printer.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from pynestml.codegeneration.nest_code_generator_utils import NESTCodeGeneratorUtils
+from pynestml.codegeneration.nest_unit_converter import NESTUnitConverter
+from pynestml.codegeneration.printers.cpp_variable_printer import CppVariablePrinter
+from pynestml.codegeneration.printers.nest_variable_printer import NESTVariablePrinter
+from pynestml.meta_model.ast_external_variable import ASTExternalVariable
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+
+
+class NESTPopulationVariablePrinter(NESTVariablePrinter):
+    r"""
+    Variable printer for population nodes, which store the variables of all the members of a population in contiguous arrays. The variables of the member with index ``__i`` in the population ``pop`` are printed as, for instance, ``pop.S_.V_m[__i]``; the template is responsible for defining ``pop`` and ``__i``.
+
+    Inline expressions are printed as their (parenthesised) defining expression, rather than as a call to the getter function of the node.
+    """
+
+    def print_variable(self, variable: ASTVariable) -> str:
+        assert isinstance(variable, ASTVariable)
+
+        if isinstance(variable, ASTExternalVariable) or variable.get_name() == PredefinedVariables.E_CONSTANT:
+            return super().print_variable(variable)
+
+        symbol = variable.get_scope().resolve_to_symbol(variable.get_complete_name(), SymbolKind.VARIABLE)
+        if symbol is None:
+            return super().print_variable(variable)
+
+        if symbol.is_buffer():
+            if isinstance(symbol.get_type_symbol(), UnitTypeSymbol):
+                units_conversion_factor = NESTUnitConverter.get_factor(symbol.get_type_symbol().unit.unit)
+            else:
+                units_conversion_factor = 1
+            s = "pop.B_." + self._print_buffer_value(variable) + "[__i]"
+            if not units_conversion_factor == 1:
+                s = "(" + str(units_conversion_factor) + " * " + s + ")"
+            return s
+
+        if symbol.is_inline_expression:
+            return "(" + self._expression_printer.print(symbol.get_declaring_expression()) + ")"
+
+        return super().print_variable(variable)
+
+    def _print(self, variable: ASTVariable, symbol, with_origin: bool = True) -> str:
+        variable_name = CppVariablePrinter._print_cpp_name(variable.get_complete_name())
+
+        if symbol.is_local() or not with_origin:
+            return variable_name
+
+        return "pop." + NESTCodeGeneratorUtils.print_symbol_origin(symbol) % variable_name + "[__i]"
@@ -48,6 +48,7 @@ class NESTVariablePrinter(CppVariablePrinter):
         self.with_origin = with_origin
         self.with_vector_parameter = with_vector_parameter
         self._state_symbols = []
+        self._hoisted_symbols = []
 
     def print_variable(self, variable: ASTVariable) -> str:
         """
@@ -165,6 +166,10 @@ class NESTVariablePrinter(CppVariablePrinter):
         if variable.is_delay_variable():
             return self._print_delay_variable(variable)
 
+        if with_origin and symbol.block_type == BlockType.INTERNALS and variable_name in self._hoisted_symbols:
+            # loop-invariant internal that has been copied into a local variable
+            return "__V_" + variable_name
+
         if with_origin:
             return NESTCodeGeneratorUtils.print_symbol_origin(symbol, numerical_state_symbols=self._state_symbols) % variable_name
 
@@ -21,6 +21,7 @@
 
 from typing import Tuple
 
+from pynestml.codegeneration.printers.ast_printer import memoise_print
 from pynestml.codegeneration.printers.function_call_printer import FunctionCallPrinter
 from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.symbols.predefined_functions import PredefinedFunctions
@@ -33,6 +34,7 @@ class ODEToolboxFunctionCallPrinter(FunctionCallPrinter):
     Printer for ASTFunctionCall in sympy syntax.
     """
 
+    @memoise_print
     def print(self, node: ASTNode) -> str:
         assert isinstance(node, ASTFunctionCall)
 
@@ -23,6 +23,7 @@ from typing import Tuple
 
 import re
 
+from pynestml.codegeneration.printers.ast_printer import memoise_print
 from pynestml.codegeneration.printers.function_call_printer import FunctionCallPrinter
 from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.symbol_table.scope import Scope
@@ -36,6 +37,7 @@ class PythonFunctionCallPrinter(FunctionCallPrinter):
     r"""
     Printer for ASTFunctionCall in Python syntax.
     """
+    @memoise_print
     def print(self, node: ASTNode) -> str:
         assert isinstance(node, ASTFunctionCall)
 
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+#
+# python_numba_function_call_printer.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from pynestml.codegeneration.printers.python_function_call_printer import PythonFunctionCallPrinter
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+
+
+class PythonNumbaFunctionCallPrinter(PythonFunctionCallPrinter):
+    r"""
+    Printer for ASTFunctionCall in Python syntax, in the context of a nopython-compatible (numba) kernel.
+
+    The kernel has no access to the neuron instance, so the simulation timestep is passed as the ``timestep`` argument, and spike emission is signalled back to the caller through the ``spike_emitted`` flag.
+    """
+
+    def _print_function_call_format_string(self, function_call: ASTFunctionCall) -> str:
+        if function_call.get_name() == PredefinedFunctions.TIME_STEPS:
+            return "int(math.ceil({!s} / timestep))"
+
+        if function_call.get_name() == PredefinedFunctions.TIME_RESOLUTION:
+            return "timestep"
+
+        if function_call.get_name() == PredefinedFunctions.EMIT_SPIKE:
+            return "spike_emitted = True"
+
+        return super()._print_function_call_format_string(function_call)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# python_numba_stepping_function_variable_printer.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from pynestml.codegeneration.printers.python_variable_printer import PythonVariablePrinter
+from pynestml.codegeneration.printers.variable_printer import VariablePrinter
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.symbols.symbol import SymbolKind
+
+
+class PythonNumbaSteppingFunctionVariablePrinter(VariablePrinter):
+    r"""
+    Printer for variables in Python syntax, in the context of a nopython-compatible (numba) ODE right-hand side kernel.
+    """
+
+    def __init__(self, expression_printer) -> None:
+        super().__init__(expression_printer)
+        self._state_symbols = []
+        self._temporary_symbols = []
+
+    def print_variable(self, node: ASTVariable) -> str:
+        """
+        Print a variable.
+        :param node: the variable to be printed
+        :return: the string representation
+        """
+        assert isinstance(node, ASTVariable)
+
+        if node.get_complete_name() in self._temporary_symbols:
+            # local variable of the right-hand side kernel
+            return node.get_complete_name()
+
+        if node.get_name() == PredefinedVariables.E_CONSTANT:
+            return "np.e"
+
+        symbol = node.get_scope().resolve_to_symbol(node.get_complete_name(), SymbolKind.VARIABLE)
+        variable_name = PythonVariablePrinter._print_python_name(node.get_complete_name())
+
+        if symbol.is_state() and not symbol.is_inline_expression:
+            if node.get_complete_name() in self._state_symbols:
+                # ode_state[] here is---and must be---the state vector supplied by the integrator, not the state vector in the node
+                return "ode_state[_ODE_" + variable_name + "]"
+
+            # non-ODE state symbol
+            return "S[_S_" + variable_name + "]"
+
+        if symbol.is_parameters():
+            return "P[_P_" + variable_name + "]"
+
+        if symbol.is_internals():
+            return "V[_V_" + variable_name + "]"
+
+        if symbol.is_input():
+            return "B[_B_" + variable_name + "]"
+
+        raise Exception("Unknown node type")
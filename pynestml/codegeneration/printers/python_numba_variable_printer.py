@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+#
+# python_numba_variable_printer.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from pynestml.codegeneration.printers.python_variable_printer import PythonVariablePrinter
+from pynestml.codegeneration.python_code_generator_utils import PythonCodeGeneratorUtils
+
+
+class PythonNumbaVariablePrinter(PythonVariablePrinter):
+    r"""
+    Variable printer for Python syntax, in the context of a nopython-compatible (numba) kernel.
+
+    Instead of attribute access on the neuron instance (such as ``self.S_.V_m``), variables are printed as indexing into the flat arrays ``S``, ``P``, ``V`` and ``B`` that are passed to the kernel, using the index constants that are generated at module level (such as ``S[_S_V_m]``).
+    """
+
+    def _print(self, variable, symbol, with_origin: bool = True) -> str:
+        variable_name = PythonVariablePrinter._print_python_name(variable.get_complete_name())
+
+        if symbol.is_local():
+            return variable_name
+
+        if variable.is_delay_variable():
+            raise Exception("Delay variables are not supported in JIT-compiled kernels")
+
+        return PythonCodeGeneratorUtils.print_symbol_origin_array(symbol) % variable_name
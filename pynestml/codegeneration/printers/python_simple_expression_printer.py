@@ -19,6 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from pynestml.codegeneration.printers.ast_printer import memoise_print
 from pynestml.codegeneration.printers.simple_expression_printer import SimpleExpressionPrinter
 from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.meta_model.ast_node import ASTNode
@@ -74,6 +75,7 @@ class PythonSimpleExpressionPrinter(SimpleExpressionPrinter):
 
         return self.print_simple_expression(node)
 
+    @memoise_print
     def print(self, node: ASTNode) -> str:
         if node.get_implicit_conversion_factor() and not node.get_implicit_conversion_factor() == 1:
             return "(" + str(node.get_implicit_conversion_factor()) + " * (" + self._print(node) + "))"
@@ -31,6 +31,10 @@ class PythonSteppingFunctionVariablePrinter(VariablePrinter):
     Printer for variables in Python syntax and in the context of an ODE solver stepping function.
     """
 
+    def __init__(self, expression_printer) -> None:
+        super().__init__(expression_printer)
+        self._temporary_symbols = []
+
     def print_variable(self, node: ASTVariable) -> str:
         """
         Print a variable.
@@ -39,6 +43,10 @@ class PythonSteppingFunctionVariablePrinter(VariablePrinter):
         """
         assert isinstance(node, ASTVariable)
 
+        if node.get_complete_name() in self._temporary_symbols:
+            # local variable of the stepping function
+            return node.get_complete_name()
+
         if node.get_name() == PredefinedVariables.E_CONSTANT:
             return "np.e"
 
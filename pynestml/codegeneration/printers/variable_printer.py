@@ -23,7 +23,7 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 
-from pynestml.codegeneration.printers.ast_printer import ASTPrinter
+from pynestml.codegeneration.printers.ast_printer import ASTPrinter, memoise_print
 from pynestml.codegeneration.printers.expression_printer import ExpressionPrinter
 from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.meta_model.ast_node import ASTNode
@@ -39,6 +39,7 @@ class VariablePrinter(ASTPrinter, metaclass=ABCMeta):
     def __init__(self, expression_printer: ExpressionPrinter):
         self._expression_printer = expression_printer
 
+    @memoise_print
     def print(self, node: ASTNode) -> str:
         assert isinstance(node, ASTVariable)
 
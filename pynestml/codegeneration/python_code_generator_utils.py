@@ -51,3 +51,24 @@ class PythonCodeGeneratorUtils:
             return 'self.B_.%s'
 
         return ''
+
+    @classmethod
+    def print_symbol_origin_array(cls, variable_symbol: VariableSymbol) -> str:
+        """
+        Returns the flat array element corresponding to the origin of the variable symbol, for use inside JIT-compiled kernels.
+        :param variable_symbol: a single variable symbol.
+        :return: the corresponding array element
+        """
+        if variable_symbol.block_type in [BlockType.STATE, BlockType.EQUATION]:
+            return 'S[_S_%s]'
+
+        if variable_symbol.block_type in [BlockType.PARAMETERS, BlockType.COMMON_PARAMETERS]:
+            return 'P[_P_%s]'
+
+        if variable_symbol.block_type == BlockType.INTERNALS:
+            return 'V[_V_%s]'
+
+        if variable_symbol.block_type == BlockType.INPUT:
+            return 'B[_B_%s]'
+
+        return ''
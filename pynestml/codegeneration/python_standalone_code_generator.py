@@ -19,15 +19,21 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, Mapping, Optional, Sequence, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
 import os
 
 from pynestml.codegeneration.printers.constant_printer import ConstantPrinter
 from pynestml.codegeneration.printers.python_expression_printer import PythonExpressionPrinter
+from pynestml.codegeneration.printers.python_numba_function_call_printer import PythonNumbaFunctionCallPrinter
+from pynestml.codegeneration.printers.python_numba_stepping_function_variable_printer import PythonNumbaSteppingFunctionVariablePrinter
+from pynestml.codegeneration.printers.python_numba_variable_printer import PythonNumbaVariablePrinter
 from pynestml.codegeneration.printers.python_stepping_function_function_call_printer import PythonSteppingFunctionFunctionCallPrinter
 from pynestml.codegeneration.printers.python_stepping_function_variable_printer import PythonSteppingFunctionVariablePrinter
 from pynestml.codegeneration.python_code_generator_utils import PythonCodeGeneratorUtils
+from pynestml.exceptions.code_generator_options_exception import CodeGeneratorOptionsException
+from pynestml.meta_model.ast_assignment import ASTAssignment
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.meta_model.ast_neuron_or_synapse import ASTNeuronOrSynapse
 from pynestml.meta_model.ast_synapse import ASTSynapse
@@ -37,6 +43,15 @@ from pynestml.codegeneration.printers.python_standalone_printer import PythonSta
 from pynestml.codegeneration.printers.python_function_call_printer import PythonFunctionCallPrinter
 from pynestml.codegeneration.printers.python_variable_printer import PythonVariablePrinter
 from pynestml.codegeneration.printers.python_simple_expression_printer import PythonSimpleExpressionPrinter
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.variable_symbol import BlockType, VariableSymbol
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import Messages
 
 
 class PythonStandaloneCodeGenerator(NESTCodeGenerator):
@@ -45,6 +60,8 @@ class PythonStandaloneCodeGenerator(NESTCodeGenerator):
 
     Options:
 
+    - **common_subexpression_elimination**: Set to True to factor out the subexpressions that occur more than once in the right-hand sides of the ODEs that are integrated numerically. Each such subexpression is computed once per evaluation of the right-hand side, and stored in a temporary variable. Default: ``False``.
+    - **n_processes**: The number of processes in which the ODE-toolbox analyses of the models are run. The generated code does not depend on this option. Default: ``1``.
     - **preserve_expressions**: Set to True, or a list of strings corresponding to individual variable names, to disable internal rewriting of expressions, and return same output as input expression where possible. Only applies to variables specified as first-order differential equations. (This parameter is passed to ODE-toolbox.)
     - **simplify_expression**: For all expressions ``expr`` that are rewritten by ODE-toolbox: the contents of this parameter string are ``eval()``ed in Python to obtain the final output expression. Override for custom expression simplification steps. Example: ``sympy.simplify(expr)``. Default: ``"sympy.logcombine(sympy.powsimp(sympy.expand(expr)))"``. (This parameter is passed to ODE-toolbox.)
     - **templates**: Path containing jinja templates used to generate code.
@@ -53,17 +70,37 @@ class PythonStandaloneCodeGenerator(NESTCodeGenerator):
             - **neuron**: A list of neuron model jinja templates.
         - **module_templates**: A list of the jinja templates or a relative path to a directory containing the templates related to generating the module/package.
     - **solver**: A string identifying the preferred ODE solver. ``"analytic"`` for propagator solver preferred; fallback to numeric solver in case ODEs are not analytically solvable. Use ``"numeric"`` to disable analytic solver.
+    - **state_export**: Set to True to store the state variables of each neuron in a flat NumPy array of double precision numbers, so that the state can be exported and imported in bulk with ``get_state()`` and ``set_state()``, and a ``Population`` of neurons can share a single state array. Integer and boolean state variables are then stored, and read back, as floating point numbers. Models that use vector variables, vector input ports or delay variables keep their state in member variables. Default: ``False``.
+    - **jit**: Set to ``"numba"`` to generate code in which the model state is stored in flat NumPy arrays, and in which the update block, the analytic propagator step, the spike buffer updates and the ODE right-hand side are emitted as module-level functions that are compiled just-in-time by Numba in ``nopython`` mode. If Numba cannot be imported at runtime, the same functions run as plain Python. Models that use features which cannot be compiled (such as vectors, delay variables, user-defined functions or random number generation in the update block) fall back, fully or partially, to the plain Python code. Default: ``None`` (no just-in-time compilation).
     """
 
+    _jit_supported_function_calls = [PredefinedFunctions.TIME_STEPS,
+                                     PredefinedFunctions.TIME_RESOLUTION,
+                                     PredefinedFunctions.EMIT_SPIKE,
+                                     PredefinedFunctions.INTEGRATE_ODES,
+                                     PredefinedFunctions.EXP,
+                                     PredefinedFunctions.COSH,
+                                     PredefinedFunctions.SINH,
+                                     PredefinedFunctions.TANH,
+                                     PredefinedFunctions.POW,
+                                     PredefinedFunctions.MAX,
+                                     PredefinedFunctions.MIN,
+                                     PredefinedFunctions.ABS]
+
     _default_options = {
+        "common_subexpression_elimination": False,
+        "n_processes": 1,
         "preserve_expressions": False,
+        "solver": "analytic",
+        "jit": None,
+        "state_export": False,
         "simplify_expression": "sympy.logcombine(sympy.powsimp(sympy.expand(expr)))",
         "templates": {
             "path": "point_neuron",
             "model_templates": {
                 "neuron": ["@NEURON_NAME@.py.jinja2"]
             },
-            "module_templates": ["simulator.py.jinja2", "test_python_standalone_module.py.jinja2", "neuron.py.jinja2", "spike_generator.py.jinja2", "utils.py.jinja2"]
+            "module_templates": ["simulator.py.jinja2", "test_python_standalone_module.py.jinja2", "neuron.py.jinja2", "spike_generator.py.jinja2", "synapse.py.jinja2", "sharded_simulator.py.jinja2", "population.py.jinja2", "utils.py.jinja2"]
         }
     }
 
@@ -114,9 +151,217 @@ class PythonStandaloneCodeGenerator(NESTCodeGenerator):
         self._gsl_function_call_printer._expression_printer = self._gsl_printer
         self._gsl_variable_printer._expression_printer = self._gsl_printer
 
+        # printers for JIT-compiled kernels: variables are elements of flat arrays that are passed to the kernel
+        self._jit_variable_printer = PythonNumbaVariablePrinter(None, with_origin=True, with_vector_parameter=False)
+        self._jit_function_call_printer = PythonNumbaFunctionCallPrinter(None)
+        self._jit_expression_printer = PythonExpressionPrinter(simple_expression_printer=PythonSimpleExpressionPrinter(variable_printer=self._jit_variable_printer,
+                                                                                                                       constant_printer=self._constant_printer,
+                                                                                                                       function_call_printer=self._jit_function_call_printer))
+        self._jit_variable_printer._expression_printer = self._jit_expression_printer
+        self._jit_function_call_printer._expression_printer = self._jit_expression_printer
+        self._jit_printer = PythonStandalonePrinter(expression_printer=self._jit_expression_printer)
+
+        self._jit_gsl_variable_printer = PythonNumbaSteppingFunctionVariablePrinter(None)
+        self._jit_gsl_function_call_printer = PythonNumbaFunctionCallPrinter(None)
+        self._jit_gsl_printer = PythonExpressionPrinter(simple_expression_printer=PythonSimpleExpressionPrinter(variable_printer=self._jit_gsl_variable_printer,
+                                                                                                                constant_printer=self._constant_printer,
+                                                                                                                function_call_printer=self._jit_gsl_function_call_printer))
+        self._jit_gsl_variable_printer._expression_printer = self._jit_gsl_printer
+        self._jit_gsl_function_call_printer._expression_printer = self._jit_gsl_printer
+
+    def set_options(self, options: Mapping[str, Any]) -> Mapping[str, Any]:
+        ret = super().set_options(options)
+
+        if self.get_option("jit") not in [None, "numba"]:
+            raise CodeGeneratorOptionsException("Unknown value for the code generator option \"jit\": \"" + str(self.get_option("jit")) + "\" (should be None or \"numba\")")
+
+        return ret
+
+    def generate_code(self, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> None:
+        if self.get_option("jit") == "numba":
+            try:
+                import numba
+            except ImportError:
+                code, message = Messages.get_jit_not_available(self.get_option("jit"))
+                Logger.log_message(None, code, message, None, LoggingLevel.WARNING)
+
+        super().generate_code(models)
+
+    def _get_module_namespace(self, neurons: List[ASTNeuron], synapses: List[ASTSynapse]) -> Dict:
+        namespace = super()._get_module_namespace(neurons, synapses)
+        namespace["jit"] = self.get_option("jit")
+
+        return namespace
+
     def _get_model_namespace(self, astnode: ASTNeuronOrSynapse) -> Dict:
         namespace = super()._get_model_namespace(astnode)
         namespace["python_codegen_utils"] = PythonCodeGeneratorUtils
         namespace["gsl_printer"] = self._gsl_printer
 
         return namespace
+
+    def _get_neuron_model_namespace(self, neuron: ASTNeuron) -> Dict:
+        namespace = super()._get_neuron_model_namespace(neuron)
+
+        namespace["cached_internal_symbols"] = self._get_cached_internal_symbols(neuron)
+        namespace["cached_internal_names"] = [sym.get_symbol_name() for sym in namespace["cached_internal_symbols"]]
+        namespace["cached_internal_parameter_names"] = self._get_cached_internal_parameter_names(neuron, namespace["cached_internal_symbols"])
+
+        reason = self._get_array_layout_unsupported_reason(neuron)
+        namespace["array_backed_state"] = reason is None and (self.get_option("state_export") or self.get_option("jit") is not None)
+        if self.get_option("state_export") and reason is not None:
+            code, message = Messages.get_state_export_not_supported_for_model(neuron.get_name(), reason)
+            Logger.log_message(neuron, code, message, None, LoggingLevel.WARNING)
+
+        if namespace["array_backed_state"]:
+            namespace.update(self._get_array_layout_namespace(neuron, namespace))
+
+        namespace["jit"] = None
+        namespace["jit_kernel"] = False
+        if self.get_option("jit") is not None:
+            if reason is None:
+                namespace["jit"] = self.get_option("jit")
+                namespace.update(self._get_jit_namespace(neuron, namespace))
+            else:
+                code, message = Messages.get_jit_not_supported_for_model(neuron.get_name(), reason)
+                Logger.log_message(neuron, code, message, None, LoggingLevel.WARNING)
+
+        return namespace
+
+    def _get_cached_internal_symbols(self, neuron: ASTNeuron) -> List[VariableSymbol]:
+        r"""
+        Returns the internals whose value only depends on the parameters and the simulation timestep. These are computed once per unique combination of the values of the parameters they depend on and the timestep, and shared between all instances of the neuron.
+
+        An internal qualifies if it is not assigned to anywhere in the model, and its declaring expression only refers to parameters, other qualifying internals, physical units and constants, and calls only predefined functions that do not have side effects.
+        :param neuron: a single neuron instance
+        :return: a list of internal variable symbols, in declaration order
+        """
+        if neuron.get_vector_symbols():
+            # vector parameters cannot be used as part of the cache key
+            return []
+
+        assigned_variable_names = set([assignment.get_variable().get_complete_name() for assignment in ASTUtils.get_all(neuron, ASTAssignment)])
+        uncacheable_function_names = [PredefinedFunctions.RANDOM_NORMAL,
+                                      PredefinedFunctions.RANDOM_UNIFORM,
+                                      PredefinedFunctions.PRINT,
+                                      PredefinedFunctions.PRINTLN,
+                                      PredefinedFunctions.EMIT_SPIKE,
+                                      PredefinedFunctions.DELIVER_SPIKE]
+
+        cached_internal_symbols = []
+        for internal_symbol in neuron.get_internal_symbols():
+            if internal_symbol.get_symbol_name() in assigned_variable_names or not internal_symbol.has_declaring_expression():
+                continue
+
+            expr = internal_symbol.get_declaring_expression()
+            cacheable = True
+            for function_call in ASTUtils.get_all(expr, ASTFunctionCall):
+                if function_call.get_name() not in PredefinedFunctions.get_function_symbols().keys() \
+                   or function_call.get_name() in uncacheable_function_names:
+                    cacheable = False
+
+            for variable in ASTUtils.get_all(expr, ASTVariable):
+                symbol = variable.get_scope().resolve_to_symbol(variable.get_complete_name(), SymbolKind.VARIABLE)
+                if symbol is None:
+                    cacheable &= PredefinedUnits.is_unit(variable.get_complete_name())
+                elif symbol.block_type == BlockType.PREDEFINED:
+                    cacheable &= variable.get_name() == PredefinedVariables.E_CONSTANT
+                elif symbol.block_type == BlockType.INTERNALS:
+                    cacheable &= symbol.get_symbol_name() in [sym.get_symbol_name() for sym in cached_internal_symbols]
+                else:
+                    cacheable &= symbol.block_type in [BlockType.PARAMETERS, BlockType.COMMON_PARAMETERS]
+
+            if cacheable:
+                cached_internal_symbols.append(internal_symbol)
+
+        return cached_internal_symbols
+
+    def _get_cached_internal_parameter_names(self, neuron: ASTNeuron, cached_internal_symbols: List[VariableSymbol]) -> List[str]:
+        r"""
+        Returns the names of the parameters that the cached internals depend on. Together with the simulation timestep, their values form the key of the cache, so that instances which differ only in other parameters share their cached internals.
+        :param neuron: a single neuron instance
+        :param cached_internal_symbols: the cached internals, as returned by _get_cached_internal_symbols()
+        :return: a list of parameter names, in declaration order
+        """
+        referenced_names = set()
+        for internal_symbol in cached_internal_symbols:
+            for variable in ASTUtils.get_all(internal_symbol.get_declaring_expression(), ASTVariable):
+                symbol = variable.get_scope().resolve_to_symbol(variable.get_complete_name(), SymbolKind.VARIABLE)
+                if symbol is not None and symbol.block_type in [BlockType.PARAMETERS, BlockType.COMMON_PARAMETERS]:
+                    referenced_names.add(symbol.get_symbol_name())
+
+        return [sym.get_symbol_name() for sym in neuron.get_parameter_symbols() if sym.get_symbol_name() in referenced_names]
+
+    def _get_array_layout_unsupported_reason(self, neuron: ASTNeuron) -> Optional[str]:
+        r"""
+        Check whether the state of the neuron can be stored in flat arrays of floating point numbers. This is required for just-in-time compilation and for the state export/import API.
+        :param neuron: a single neuron instance
+        :return: None if the flat array layout is supported for this neuron, otherwise a string describing the reason why not
+        """
+        if neuron.get_vector_symbols() or neuron.has_vector_port():
+            return "vector variables or vector input ports are used"
+
+        if neuron.has_delay_variables():
+            return "delay variables are used"
+
+        return None
+
+    def _update_block_supports_jit(self, neuron: ASTNeuron, namespace: Mapping[str, Any]) -> bool:
+        r"""
+        Check whether the update block of the neuron can be compiled into a single ``nopython`` kernel.
+
+        The numeric (scipy) solver, user-defined functions, inline expressions (which are evaluated by getter methods on the neuron instance) and predefined functions that are not supported by Numba (such as ``print()`` and random number generation) are only available to the plain Python update block.
+        """
+        if namespace["uses_numeric_solver"] or neuron.get_functions():
+            return False
+
+        for update_block in neuron.get_update_blocks():
+            for function_call in ASTUtils.get_all(update_block, ASTFunctionCall):
+                if function_call.get_name() not in self._jit_supported_function_calls:
+                    return False
+
+            for variable in ASTUtils.get_all(update_block, ASTVariable):
+                symbol = variable.get_scope().resolve_to_symbol(variable.get_complete_name(), SymbolKind.VARIABLE)
+                if symbol is not None and symbol.is_inline_expression:
+                    return False
+
+        return True
+
+    def _get_array_layout_namespace(self, neuron: ASTNeuron, namespace: Mapping[str, Any]) -> Dict:
+        r"""
+        Returns the namespace entries that describe the layout of the flat state, parameter, internal and buffer arrays. The state array is used if the ``state_export`` or ``jit`` option is set and the neuron supports it (see :py:meth:`_get_array_layout_unsupported_reason`); the other arrays are only used by neurons that are generated with the ``jit`` option.
+        :param neuron: a single neuron instance
+        :param namespace: the neuron model namespace
+        :return: a map from name to functionality.
+        """
+        numeric_state_variables = namespace["numeric_state_variables"] if namespace["uses_numeric_solver"] else []
+        state_variable_names = [sym.get_symbol_name() for sym in neuron.get_state_symbols()]
+
+        # numerically integrated state variables are stored contiguously at the end of the state array, so that they can be passed to the integrator as a slice
+        state_variable_names = [name for name in state_variable_names if name not in numeric_state_variables] + list(numeric_state_variables)
+
+        # spike buffers are stored at the start of the buffer array, so that they can be cleared as a slice
+        buffer_names = [port.get_symbol_name() for port in neuron.get_spike_input_ports()] \
+            + [port.get_symbol_name() for port in neuron.get_continuous_input_ports()]
+
+        return {"state_variable_names": [PythonVariablePrinter._print_python_name(name) for name in state_variable_names],
+                "ode_state_variable_names": [PythonVariablePrinter._print_python_name(name) for name in numeric_state_variables],
+                "parameter_names": [PythonVariablePrinter._print_python_name(sym.get_symbol_name()) for sym in neuron.get_parameter_symbols()],
+                "internal_names": [PythonVariablePrinter._print_python_name(sym.get_symbol_name()) for sym in neuron.get_internal_symbols()],
+                "buffer_names": [PythonVariablePrinter._print_python_name(name) for name in buffer_names],
+                "n_spike_buffers": len(neuron.get_spike_input_ports())}
+
+    def _get_jit_namespace(self, neuron: ASTNeuron, namespace: Mapping[str, Any]) -> Dict:
+        r"""
+        Returns the namespace entries that are used to generate the JIT-compiled kernels.
+        :param neuron: a single neuron instance
+        :param namespace: the neuron model namespace
+        :return: a map from name to functionality.
+        """
+        self._jit_variable_printer._state_symbols = self._nest_variable_printer._state_symbols
+        self._jit_gsl_variable_printer._state_symbols = self._nest_variable_printer._state_symbols
+        self._jit_gsl_variable_printer._temporary_symbols = self._gsl_variable_printer._temporary_symbols
+
+        return {"jit_printer": self._jit_printer,
+                "jit_gsl_printer": self._jit_gsl_printer,
+                "jit_update_kernel": self._update_block_supports_jit(neuron, namespace)}
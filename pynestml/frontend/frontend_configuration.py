@@ -42,6 +42,8 @@ help_module = 'Indicates the name of the module. Optional. If not indicated, the
 help_log = 'Indicates whether a log file containing all messages shall be stored. Standard is NO.'
 help_suffix = 'A suffix string that will be appended to the name of all generated models.'
 help_dev = 'Enable development mode: extra information is rendered in the generated code, like the name of the template that generates the code.'
+help_profile = 'Record the wall-clock and CPU time spent in each phase of the toolchain, and store it in the report directory as JSON and in the Chrome trace event format. Standard is NO.'
+help_cprofile = 'In addition to --profile, store cProfile statistics for each phase of the toolchain in the report directory. Standard is NO.'
 help_codegen_opts = 'Path to a JSON file containing additional options for the target platform code generator.'
 
 qualifier_input_path_arg = '--input_path'
@@ -54,6 +56,8 @@ qualifier_store_log_arg = '--store_log'
 qualifier_suffix_arg = '--suffix'
 qualifier_dev_arg = '--dev'
 qualifier_codegen_opts_arg = '--codegen_opts'
+qualifier_profile_arg = '--profile'
+qualifier_cprofile_arg = '--cprofile'
 
 
 class FrontendConfiguration:
@@ -76,6 +80,8 @@ class FrontendConfiguration:
     store_log = False
     suffix = ""
     is_dev = False
+    profile = False
+    cprofile = False
     codegen_opts = {}  # type: Mapping[str, Any]
     codegen_opts_fn = ""
 
@@ -109,6 +115,8 @@ appropriate numeric solver otherwise.
         cls.argument_parser.add_argument(qualifier_store_log_arg, action='store_true', help=help_log)
         cls.argument_parser.add_argument(qualifier_suffix_arg, metavar='SUFFIX', type=str, help=help_suffix, default='')
         cls.argument_parser.add_argument(qualifier_dev_arg, action='store_true', help=help_dev)
+        cls.argument_parser.add_argument(qualifier_profile_arg, action='store_true', help=help_profile)
+        cls.argument_parser.add_argument(qualifier_cprofile_arg, action='store_true', help=help_cprofile)
         cls.argument_parser.add_argument(qualifier_codegen_opts_arg, metavar='PATH', type=str, help=help_codegen_opts, default='', dest='codegen_opts_fn')
         parsed_args = cls.argument_parser.parse_args(args)
 
@@ -126,6 +134,8 @@ appropriate numeric solver otherwise.
         cls.store_log = parsed_args.store_log
         cls.suffix = parsed_args.suffix
         cls.is_dev = parsed_args.dev
+        cls.cprofile = parsed_args.cprofile
+        cls.profile = parsed_args.profile or parsed_args.cprofile
 
     @classmethod
     def get_provided_input_path(cls) -> Sequence[str]:
@@ -196,6 +206,22 @@ appropriate numeric solver otherwise.
         """
         return cls.is_dev
 
+    @classmethod
+    def get_profile(cls) -> bool:
+        """
+        Returns whether the time spent in each phase of the toolchain should be recorded.
+        :return: True if profiling is enabled, otherwise False.
+        """
+        return cls.profile
+
+    @classmethod
+    def get_cprofile(cls) -> bool:
+        """
+        Returns whether cProfile statistics should be stored for each phase of the toolchain.
+        :return: True if cProfile statistics should be stored, otherwise False.
+        """
+        return cls.cprofile
+
     @classmethod
     def get_codegen_opts(cls):
         """Get the code generator options dictionary"""
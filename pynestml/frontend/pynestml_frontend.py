@@ -31,7 +31,7 @@ from pynestml.exceptions.code_generator_options_exception import CodeGeneratorOp
 from pynestml.frontend.frontend_configuration import FrontendConfiguration, InvalidPathException, \
     qualifier_store_log_arg, qualifier_module_name_arg, qualifier_logging_level_arg, \
     qualifier_target_platform_arg, qualifier_target_path_arg, qualifier_input_path_arg, qualifier_suffix_arg, \
-    qualifier_dev_arg, qualifier_install_path_arg
+    qualifier_dev_arg, qualifier_install_path_arg, qualifier_profile_arg, qualifier_cprofile_arg
 from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.meta_model.ast_synapse import ASTSynapse
 from pynestml.symbols.predefined_functions import PredefinedFunctions
@@ -42,6 +42,7 @@ from pynestml.transformers.transformer import Transformer
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.profiler import Profiler
 
 
 def get_known_targets():
@@ -126,7 +127,8 @@ def builder_from_target_name(target_name: str, options: Optional[Mapping[str, An
 
 def generate_target(input_path: Union[str, Sequence[str]], target_platform: str, target_path=None,
                     install_path: str = None, logging_level="ERROR", module_name=None, store_log=False, suffix="",
-                    dev=False, codegen_opts: Optional[Mapping[str, Any]] = None):
+                    dev=False, codegen_opts: Optional[Mapping[str, Any]] = None, profile: bool = False,
+                    cprofile: bool = False):
     r"""Generate and build code for the given target platform.
 
     Parameters
@@ -151,6 +153,10 @@ def generate_target(input_path: Union[str, Sequence[str]], target_platform: str,
         Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.
     codegen_opts : Optional[Mapping[str, Any]]
         A dictionary containing additional options for the target code generator.
+    profile : bool, optional (default: False)
+        Record the wall-clock and CPU time spent in each phase of the toolchain, for each model, context condition and template. The results are stored in the report directory as ``profile.json`` and, in the Chrome trace event format, as ``profile_trace.json``.
+    cprofile : bool, optional (default: False)
+        In addition to ``profile``, store cProfile statistics for each phase of the toolchain in the report directory.
     """
     args = list()
     args.append(qualifier_input_path_arg)
@@ -188,6 +194,12 @@ def generate_target(input_path: Union[str, Sequence[str]], target_platform: str,
     if dev:
         args.append(qualifier_dev_arg)
 
+    if profile:
+        args.append(qualifier_profile_arg)
+
+    if cprofile:
+        args.append(qualifier_cprofile_arg)
+
     FrontendConfiguration.parse_config(args)
 
     if codegen_opts:
@@ -200,7 +212,8 @@ def generate_target(input_path: Union[str, Sequence[str]], target_platform: str,
 def generate_nest_target(input_path: Union[str, Sequence[str]], target_path: Optional[str] = None,
                          install_path: Optional[str] = None, logging_level="ERROR",
                          module_name=None, store_log: bool = False, suffix: str = "",
-                         dev: bool = False, codegen_opts: Optional[Mapping[str, Any]] = None):
+                         dev: bool = False, codegen_opts: Optional[Mapping[str, Any]] = None, profile: bool = False,
+                         cprofile: bool = False):
     r"""Generate and build code for NEST Simulator.
 
     Parameters
@@ -223,15 +236,20 @@ def generate_nest_target(input_path: Union[str, Sequence[str]], target_path: Opt
         Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.
     codegen_opts : Optional[Mapping[str, Any]]
         A dictionary containing additional options for the target code generator.
+    profile : bool, optional (default: False)
+        Record the wall-clock and CPU time spent in each phase of the toolchain, for each model, context condition and template. The results are stored in the report directory as ``profile.json`` and, in the Chrome trace event format, as ``profile_trace.json``.
+    cprofile : bool, optional (default: False)
+        In addition to ``profile``, store cProfile statistics for each phase of the toolchain in the report directory.
     """
     generate_target(input_path, target_platform="NEST", target_path=target_path, logging_level=logging_level,
                     module_name=module_name, store_log=store_log, suffix=suffix, install_path=install_path,
-                    dev=dev, codegen_opts=codegen_opts)
+                    dev=dev, codegen_opts=codegen_opts, profile=profile, cprofile=cprofile)
 
 
 def generate_python_standalone_target(input_path: Union[str, Sequence[str]], target_path: Optional[str] = None,
                                       logging_level="ERROR", module_name: str = "nestmlmodule", store_log: bool=False,
-                                      suffix: str="", dev: bool=False, codegen_opts: Optional[Mapping[str, Any]]=None):
+                                      suffix: str="", dev: bool=False, codegen_opts: Optional[Mapping[str, Any]]=None,
+                                      profile: bool = False, cprofile: bool = False):
     r"""Generate and build code for the standalone Python target.
 
     Parameters
@@ -252,10 +270,14 @@ def generate_python_standalone_target(input_path: Union[str, Sequence[str]], tar
         Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.
     codegen_opts : Optional[Mapping[str, Any]]
         A dictionary containing additional options for the target code generator.
+    profile : bool, optional (default: False)
+        Record the wall-clock and CPU time spent in each phase of the toolchain, for each model, context condition and template. The results are stored in the report directory as ``profile.json`` and, in the Chrome trace event format, as ``profile_trace.json``.
+    cprofile : bool, optional (default: False)
+        In addition to ``profile``, store cProfile statistics for each phase of the toolchain in the report directory.
     """
     generate_target(input_path, target_platform="python_standalone", target_path=target_path,
                     logging_level=logging_level, store_log=store_log, suffix=suffix, dev=dev,
-                    codegen_opts=codegen_opts)
+                    codegen_opts=codegen_opts, profile=profile, cprofile=cprofile)
 
 
 def main() -> int:
@@ -289,6 +311,17 @@ def process():
     # init log dir
     create_report_dir()
 
+    # record the time spent in each phase of the toolchain, if requested
+    Profiler.init_profiler(FrontendConfiguration.get_profile(),
+                           cprofile_dir=get_report_dir() if FrontendConfiguration.get_cprofile() else None)
+    try:
+        return _process()
+    finally:
+        if Profiler.is_enabled():
+            store_profile_to_file()
+
+
+def _process():
     # The handed over parameters seem to be correct, proceed with the main routine
     init_predefined()
 
@@ -342,14 +375,16 @@ def process():
 
         # run transformers
         for transformer in transformers:
-            models = transformer.transform(models)
+            with Profiler.timer(type(transformer).__name__, category="transformer"):
+                models = transformer.transform(models)
 
         # perform code generation
         _codeGenerator.generate_code(models)
 
     # perform build
     if _builder is not None:
-        _builder.build()
+        with Profiler.timer("build", model=FrontendConfiguration.get_module_name()):
+            _builder.build()
 
     if FrontendConfiguration.store_log:
         store_log_to_file()
@@ -366,12 +401,22 @@ def init_predefined():
     PredefinedVariables.register_variables()
 
 
+def get_report_dir() -> str:
+    return os.path.join(FrontendConfiguration.get_target_path(), os.pardir, "report")
+
+
 def create_report_dir():
-    if not os.path.isdir(os.path.join(FrontendConfiguration.get_target_path(), os.pardir, "report")):
-        os.makedirs(os.path.join(FrontendConfiguration.get_target_path(), os.pardir, "report"))
+    if not os.path.isdir(get_report_dir()):
+        os.makedirs(get_report_dir())
 
 
 def store_log_to_file():
     with open(str(os.path.join(FrontendConfiguration.get_target_path(), os.pardir, "report",
                                "log")) + ".txt", "w+") as f:
-        f.write(str(Logger.get_json_format()))
+        Logger.write_json_format(f)
+
+
+def store_profile_to_file():
+    Profiler.store(get_report_dir())
+    code, message = Messages.get_profile_stored(os.path.realpath(get_report_dir()))
+    Logger.log_message(None, code, message, None, LoggingLevel.INFO)
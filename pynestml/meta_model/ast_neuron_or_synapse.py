@@ -288,7 +288,7 @@ class ASTNeuronOrSynapse(ASTNode):
         symbols = self.get_scope().get_symbols_in_this_scope()
         ret = list()
         for symbol in symbols:
-            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.INTERNALS and \
+            if isinstance(symbol, VariableSymbol) and symbol.block_type in [BlockType.INTERNALS, BlockType.COMMON_INTERNALS] and \
                     not symbol.is_predefined:
                 ret.append(symbol)
         return ret
@@ -42,8 +42,12 @@ class ASTNode(metaclass=ABCMeta):
         post_comments = list()
         #
         implicit_conversion_factor = None
+
+    The class keeps a version counter, which is incremented each time an attribute of any node is assigned a different value after it was first set, for example when a child node is replaced. Caches of values derived from the AST, like the printed code for an expression, are valid for as long as the version is unchanged.
     """
 
+    _version = 0
+
     def __init__(self, source_position=None, scope=None, comment=None, pre_comments=None, in_comment=None, post_comments=None, implicit_conversion_factor=None):
         """
         The standard constructor.
@@ -74,6 +78,19 @@ class ASTNode(metaclass=ABCMeta):
         self.post_comments = post_comments
         self.implicit_conversion_factor = implicit_conversion_factor
 
+    def __setattr__(self, name, value):
+        if name in self.__dict__ and self.__dict__[name] is not value:
+            ASTNode._version += 1
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def get_version(cls) -> int:
+        """
+        Returns the version of the AST, which changes whenever any node is modified.
+        :return: the version counter
+        """
+        return ASTNode._version
+
     @abstractmethod
     def clone(self):
         """
@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from enum import Enum
 
@@ -51,6 +51,8 @@ class Scope:
         declared_elements Elements declared in this scope, i.e., scopes and symbols. Type: list(Scope,Symbol)
         scope_type The type of this scope. Type: ScopeType
         source_position The position in the source file this scope spans over.
+
+    The symbols are also indexed by name, so that resolving a name does not require a search over all the elements of the scope, and the lists of symbols and sub-scopes are cached. ``declared_elements`` should therefore only be modified through the methods of this class.
     """
 
     def __init__(self, scope_type: ScopeType, enclosing_scope: Scope = None, source_position: ASTSourceLocation = None):
@@ -64,6 +66,23 @@ class Scope:
         self.scope_type = scope_type
         self.enclosing_scope = enclosing_scope
         self.source_location = source_position
+        self._symbols_by_name: Dict[str, List[Symbol]] = {}
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        r"""
+        Invalidate the cached lists of symbols and sub-scopes; to be called whenever ``declared_elements`` is modified.
+        """
+        self._symbols: Optional[List[Symbol]] = None
+        self._scopes: Optional[List[Scope]] = None
+
+    def _get_symbols_by_name(self, name: str) -> List[Symbol]:
+        r"""
+        Returns the symbols with the given name that are defined in this scope, in the order in which they were declared.
+        :param name: the name of the symbols.
+        :return: a list of symbols.
+        """
+        return self._symbols_by_name.get(name, [])
 
     def add_symbol(self, symbol: Symbol) -> None:
         r"""
@@ -72,11 +91,13 @@ class Scope:
         """
         self.delete_symbol(symbol)
         self.declared_elements.append(symbol)
+        self._symbols_by_name.setdefault(symbol.get_symbol_name(), []).append(symbol)
+        self._invalidate_cache()
 
     def update_variable_symbol(self, _symbol: Symbol) -> None:
-        for symbol in self.get_symbols_in_this_scope():
-            if (symbol.get_symbol_kind() == SymbolKind.VARIABLE and symbol.get_symbol_name() == _symbol.get_symbol_name()):
-                self.declared_elements.remove(symbol)
+        for symbol in self._get_symbols_by_name(_symbol.get_symbol_name()):
+            if symbol.get_symbol_kind() == SymbolKind.VARIABLE:
+                self.delete_symbol(symbol)
                 self.add_symbol(_symbol)
                 break
 
@@ -86,6 +107,7 @@ class Scope:
         :param scope: a single scope object.
         """
         self.declared_elements.append(scope)
+        self._invalidate_cache()
 
     def delete_symbol(self, symbol: Symbol) -> bool:
         r"""
@@ -94,8 +116,11 @@ class Scope:
         :type symbol: Symbol
         :return: True, if the element has been deleted, otherwise False.
         """
-        if symbol in self.declared_elements:
+        symbols = self._get_symbols_by_name(symbol.get_symbol_name())
+        if symbol in symbols:
+            symbols.remove(symbol)
             self.declared_elements.remove(symbol)
+            self._invalidate_cache()
             return True
 
         return False
@@ -108,6 +133,7 @@ class Scope:
         """
         if scope in self.declared_elements:
             self.declared_elements.remove(scope)
+            self._invalidate_cache()
             return True
 
         return False
@@ -117,11 +143,10 @@ class Scope:
         Returns the set of elements as defined in this scope, but not in the corresponding super scope.
         :return: a list of symbols defined only in this scope, but not in the upper scopes.
         """
-        ret = list()
-        for elem in self.declared_elements:
-            if isinstance(elem, Symbol):
-                ret.append(elem)
-        return ret
+        if self._symbols is None:
+            self._symbols = [elem for elem in self.declared_elements if isinstance(elem, Symbol)]
+
+        return list(self._symbols)
 
     def get_symbols_in_complete_scope(self) -> List[Symbol]:
         r"""
@@ -140,11 +165,10 @@ class Scope:
         :return: a list of scope objects
         :rtype: list
         """
-        ret = list()
-        for elem in self.declared_elements:
-            if isinstance(elem, Scope):
-                ret.append(elem)
-        return ret
+        if self._scopes is None:
+            self._scopes = [elem for elem in self.declared_elements if isinstance(elem, Scope)]
+
+        return list(self._scopes)
 
     def resolve_to_all_scopes(self, name: str, kind: SymbolKind) -> Optional[Scope]:
         r"""
@@ -173,8 +197,8 @@ class Scope:
         :return: the corresponding scope object.
         """
         ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
+        for sim in self._get_symbols_by_name(name):
+            if sim.get_symbol_kind() == kind:
                 ret.append(self)
         for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
             temp = elem.__resolve_to_scope_in_spanned_scope(name, kind)
@@ -212,8 +236,8 @@ class Scope:
         :return: the corresponding symbol object.
         """
         ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
+        for sim in self._get_symbols_by_name(name):
+            if sim.get_symbol_kind() == kind:
                 ret.append(sim)
 
         for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
@@ -231,8 +255,8 @@ class Scope:
         :param kind: the type of the symbol, i.e., Variable,function or type.
         :return: the first matching scope.
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
+        for sim in self._get_symbols_by_name(name):
+            if sim.get_symbol_kind() == kind:
                 return self
 
         if self.has_enclosing_scope():
@@ -248,8 +272,8 @@ class Scope:
         :param kind: the type of the symbol, i.e., Variable,function or type.
         :return: the first matching symbol.
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
+        for sim in self._get_symbols_by_name(name):
+            if sim.get_symbol_kind() == kind:
                 return sim
 
         if self.has_enclosing_scope():
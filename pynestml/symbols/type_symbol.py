@@ -22,7 +22,7 @@ from abc import ABCMeta, abstractmethod
 
 from pynestml.symbols.symbol import Symbol
 from pynestml.utils.logger import Logger, LoggingLevel
-from pynestml.utils.messages import Messages
+from pynestml.utils.messages import Messages, MessageCode
 
 
 class TypeSymbol(Symbol):
@@ -226,8 +226,8 @@ class TypeSymbol(Symbol):
         return result
 
     def warn_implicit_cast_from_to(self, _from, _to):
-        code, message = Messages.get_implicit_cast_rhs_to_lhs(_to.print_symbol(), _from.print_symbol())
-        Logger.log_message(code=code, message=message,
+        Logger.log_message(code=MessageCode.IMPLICIT_CAST,
+                           message=lambda: Messages.get_implicit_cast_rhs_to_lhs(_to.print_symbol(), _from.print_symbol())[1],
                            error_position=self.get_referenced_object().get_source_position(),
                            log_level=LoggingLevel.WARNING)
         return _to
@@ -61,6 +61,7 @@ class BlockType(Enum):
     INPUT = 7
     OUTPUT = 8
     PREDEFINED = 9
+    COMMON_INTERNALS = 10
 
 
 class VariableSymbol(Symbol):
@@ -256,7 +257,7 @@ class VariableSymbol(Symbol):
         :return: True if declared in a internals block, otherwise False.
         :rtype: bool
         """
-        return self.block_type == BlockType.INTERNALS
+        return self.block_type in [BlockType.INTERNALS, BlockType.COMMON_INTERNALS]
 
     def is_equation(self) -> bool:
         """
@@ -595,8 +595,9 @@ class ASTUtils:
             ast_ext_var.accept(ASTSymbolTableVisitor())
 
             if isinstance(_expr, ASTSimpleExpression) and _expr.is_variable():
-                Logger.log_message(None, -1, "ASTSimpleExpression replacement made (var = " + str(
-                    ast_ext_var.get_name()) + ") in expression: " + str(node.get_parent(_expr)), None, LoggingLevel.INFO)
+                if Logger.is_enabled(LoggingLevel.INFO):
+                    Logger.log_message(None, -1, "ASTSimpleExpression replacement made (var = " + str(
+                        ast_ext_var.get_name()) + ") in expression: " + str(node.get_parent(_expr)), None, LoggingLevel.INFO)
                 _expr.set_variable(ast_ext_var)
                 return
 
@@ -1847,7 +1848,7 @@ class ASTUtils:
         For every occurrence of a convolution of the form `convolve(var, spike_buf)`: add the element `(kernel, spike_buf)` to the set, with `kernel` being the kernel that contains variable `var`.
         """
 
-        kernel_buffers = set()
+        kernel_buffers = []
         convolve_calls = ASTUtils.get_convolve_function_calls(equations_block)
         for convolve in convolve_calls:
             el = (convolve.get_args()[0], convolve.get_args()[1])
@@ -1868,7 +1869,9 @@ class ASTUtils:
                 el[1]) + ")\": no kernel by name \"" + var.get_name() + "\" found in neuron."
 
             el = (kernel, el[1])
-            kernel_buffers.add(el)
+            if el not in kernel_buffers:
+                # use a list rather than a set, so that the order (and thus the generated code) does not depend on the memory addresses of the AST nodes
+                kernel_buffers.append(el)
 
         return kernel_buffers
 
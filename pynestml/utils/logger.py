@@ -19,11 +19,13 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Mapping, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Mapping, Optional, TextIO, Tuple, Union
 
-from collections import OrderedDict
+from collections import Counter, OrderedDict, defaultdict, deque
 from enum import Enum
+import io
 import json
+import textwrap
 
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.utils.ast_source_location import ASTSourceLocation
@@ -57,11 +59,16 @@ class Logger:
     level is set to WARNING, only warnings and errors are printed. Only if level is set to DEBUG, all messages
     are printed.
 
+    Messages can be handed over as a callable returning the message string, in which case the message is only formatted if it is printed or queried; for messages that are expensive to construct even this way, ``is_enabled()`` can be used to check beforehand whether a message of a given level would be printed.
+
+    Messages are indexed by artifact name, node and level as they arrive, so that the queries below take time proportional to the number of messages returned, and ``has_errors()`` takes constant time. If a maximum number of messages is given, only the most recent messages are kept (the message counts used by ``has_errors()`` are not affected by this).
+
     Attributes:
         log       Stores all messages as received during the execution. Map from id (int) to node,type,message
         curr_message A counter indicating the current message, this enables a sorting by the number of message
         logging_level Indicates messages of which level shall be printed to the screen.
         current_node The currently processed model. This enables to retrieve all messages belonging to a certain model
+        max_messages The maximum number of messages kept in the log, or None to keep all messages
     """
     log = {}
     curr_message = None
@@ -69,20 +76,71 @@ class Logger:
     logging_level = None
     current_node = None
     no_print = False
+    max_messages = None
+    _messages_by_artifact_and_level: Dict[Tuple[str, LoggingLevel], Deque[int]] = defaultdict(deque)
+    _messages_by_artifact: Dict[str, Deque[int]] = defaultdict(deque)
+    _messages_by_level: Dict[LoggingLevel, Deque[int]] = defaultdict(deque)
+    _messages_by_node: Dict[int, Deque[int]] = defaultdict(deque)
+    _message_counts: Counter = Counter()
 
     @classmethod
-    def init_logger(cls, logging_level: LoggingLevel):
+    def init_logger(cls, logging_level: LoggingLevel, max_messages: Optional[int] = None):
         """
         Initializes the logger.
         :param logging_level: the logging level as required
         :type logging_level: LoggingLevel
+        :param max_messages: the maximum number of messages to keep in the log; if the log is full, the oldest message is discarded for each new one. If None, all messages are kept.
         """
+        assert max_messages is None or max_messages > 0, '(PyNestML.Logger) The maximum number of messages has to be positive!'
         cls.logging_level = logging_level
         cls.curr_message = 0
-        cls.log = {}
+        cls.max_messages = max_messages
+        cls._set_log({})
         cls.log_frozen = False
         return
 
+    @classmethod
+    def _set_log(cls, log: Mapping[int, Tuple]) -> None:
+        """
+        Replaces the log by the handed over one, and rebuilds the indexes and message counts from it.
+        :param log: the log
+        """
+        cls.log = {}
+        cls._messages_by_artifact_and_level = defaultdict(deque)
+        cls._messages_by_artifact = defaultdict(deque)
+        cls._messages_by_level = defaultdict(deque)
+        cls._messages_by_node = defaultdict(deque)
+        cls._message_counts = Counter()
+        for message_nr, entry in log.items():
+            cls._add_to_log(message_nr, entry)
+
+    @classmethod
+    def _add_to_log(cls, message_nr: int, entry: Tuple) -> None:
+        """
+        Stores a message in the log and in the indexes, discarding the oldest message if the log is full.
+        :param message_nr: the number of the message
+        :param entry: the message as a tuple (artifact name, node, level, code, error position, message)
+        """
+        artifact_name, node, log_level = entry[:3]
+        cls.log[message_nr] = entry
+        cls._messages_by_artifact_and_level[(artifact_name, log_level)].append(message_nr)
+        cls._messages_by_artifact[artifact_name].append(message_nr)
+        cls._messages_by_level[log_level].append(message_nr)
+        cls._messages_by_node[id(node)].append(message_nr)
+        cls._message_counts[(artifact_name, log_level)] += 1
+
+        if cls.max_messages is not None and len(cls.log) > cls.max_messages:
+            # the oldest message is the first one in the log, and also the first one in each of its indexes
+            oldest_message_nr = next(iter(cls.log))
+            artifact_name, node, log_level = cls.log.pop(oldest_message_nr)[:3]
+            for index, key in [(cls._messages_by_artifact_and_level, (artifact_name, log_level)),
+                               (cls._messages_by_artifact, artifact_name),
+                               (cls._messages_by_level, log_level),
+                               (cls._messages_by_node, id(node))]:
+                index[key].popleft()
+                if not index[key]:
+                    del index[key]
+
     @classmethod
     def freeze_log(cls, do_freeze: bool = True):
         """
@@ -96,8 +154,24 @@ class Logger:
         Returns the overall log of messages. The structure of the log is: (NODE, LEVEL, MESSAGE)
         :return: mapping from id to ASTNode, log level and message.
         """
+        for message_nr in cls.log.keys():
+            cls._get_message(message_nr)
         return cls.log
 
+    @classmethod
+    def _get_message(cls, message_nr: int) -> str:
+        """
+        Returns the message string of a logged message, formatting it first if it was logged as a callable.
+        :param message_nr: the number of the message
+        :return: the message string
+        """
+        entry = cls.log[message_nr]
+        message = entry[5]
+        if callable(message):
+            message = message()
+            cls.log[message_nr] = entry[:5] + (message,)
+        return message
+
     @classmethod
     def set_log(cls, log, counter):
         """
@@ -105,11 +179,25 @@ class Logger:
         :param log: the log
         :param counter: the counter
         """
-        cls.log = log
+        cls._set_log(log)
         cls.curr_message = counter
 
     @classmethod
-    def log_message(cls, node: ASTNode = None, code: MessageCode = None, message: str = None, error_position: ASTSourceLocation = None, log_level: LoggingLevel = None):
+    def is_enabled(cls, log_level: LoggingLevel) -> bool:
+        """
+        Indicates whether a message of the handed over level would currently be printed.
+        :param log_level: a logging level
+        :return: True if a message of this level would be printed, otherwise False
+        """
+        if cls.log_frozen or cls.no_print:
+            return False
+        if cls.logging_level is None:
+            # the logger will be initialized with the INFO level when the first message is logged
+            return LoggingLevel.INFO.value <= log_level.value
+        return cls.logging_level.value <= log_level.value
+
+    @classmethod
+    def log_message(cls, node: ASTNode = None, code: MessageCode = None, message: Union[str, Callable[[], str]] = None, error_position: ASTSourceLocation = None, log_level: LoggingLevel = None):
         """
         Logs the handed over message on the handed over node. If the current logging is appropriate, the message is also printed.
         :param node: the node in which the error occurred
@@ -117,8 +205,7 @@ class Logger:
         :type code: ErrorCode
         :param error_position: the position on which the error occurred.
         :type error_position: SourcePosition
-        :param message: a message.
-        :type message: str
+        :param message: a message, or a callable without arguments that returns the message; the callable is only called when the message is printed or queried.
         :param log_level: the corresponding log level.
         :type log_level: LoggingLevel
         """
@@ -126,23 +213,23 @@ class Logger:
             return
         if cls.curr_message is None:
             cls.init_logger(LoggingLevel.INFO)
-        from pynestml.meta_model.ast_node import ASTNode
-        from pynestml.utils.ast_source_location import ASTSourceLocation
         assert (node is None or isinstance(node, ASTNode)), \
             '(PyNestML.Logger) Wrong type of node provided (%s)!' % type(node)
         assert (error_position is None or isinstance(error_position, ASTSourceLocation)), \
             '(PyNestML.Logger) Wrong type of error position provided (%s)!' % type(error_position)
         from pynestml.meta_model.ast_neuron_or_synapse import ASTNeuronOrSynapse
+        message_nr = cls.curr_message
         if isinstance(node, ASTNeuronOrSynapse):
-            cls.log[cls.curr_message] = (
-                node.get_artifact_name(), node, log_level, code, error_position, message)
+            cls._add_to_log(message_nr, (node.get_artifact_name(), node, log_level, code, error_position, message))
         elif cls.current_node is not None:
-            cls.log[cls.curr_message] = (cls.current_node.get_artifact_name(), cls.current_node,
-                                         log_level, code, error_position, message)
+            cls._add_to_log(message_nr, (cls.current_node.get_artifact_name(), cls.current_node,
+                                         log_level, code, error_position, message))
         cls.curr_message += 1
         if cls.no_print:
             return
         if cls.logging_level.value <= log_level.value:
+            if callable(message):
+                message = cls._get_message(message_nr) if message_nr in cls.log else message()
             to_print = '[' + str(cls.curr_message) + ','
             to_print = (to_print + (node.get_name() + ', ' if node is not None else
                                     cls.current_node.get_name() + ', ' if cls.current_node is not None else 'GLOBAL, '))
@@ -234,13 +321,13 @@ class Logger:
         """
         if level is None and node is None:
             return cls.get_log()
-        ret = list()
-        for (artifactName, node_i, logLevel, code, errorPosition, message) in cls.log.values():
-            if (level == logLevel if level is not None else True) and (
-                    node if node is not None else True) and (
-                    node.get_artifact_name() == artifactName if node is not None else True):
-                ret.append((node, logLevel, message))
-        return ret
+        if node is None:
+            message_nrs = cls._messages_by_level.get(level, ())
+        elif level is None:
+            message_nrs = cls._messages_by_artifact.get(node.get_artifact_name(), ())
+        else:
+            message_nrs = cls._messages_by_artifact_and_level.get((node.get_artifact_name(), level), ())
+        return [(node, cls.log[message_nr][2], cls._get_message(message_nr)) for message_nr in message_nrs]
 
     @classmethod
     def get_all_messages_of_level(cls, level: LoggingLevel) -> List[Tuple[ASTNode, LoggingLevel, str]]:
@@ -253,11 +340,7 @@ class Logger:
         """
         if level is None:
             return cls.get_log()
-        ret = list()
-        for (artifactName, node, logLevel, code, errorPosition, message) in cls.log.values():
-            if level == logLevel:
-                ret.append((node, logLevel, message))
-        return ret
+        return [(cls.log[message_nr][1], level, cls._get_message(message_nr)) for message_nr in cls._messages_by_level.get(level, ())]
 
     @classmethod
     def get_all_messages_of_node(cls, node: ASTNode) -> List[Tuple[ASTNode, LoggingLevel, str]]:
@@ -269,12 +352,8 @@ class Logger:
         """
         if node is None:
             return cls.get_log()
-        ret = list()
-        for (artifactName, node_i, logLevel, code, errorPosition, message) in cls.log.values():
-            if (node_i == node if node is not None else True) and \
-                    (node.get_artifact_name() == artifactName if node is not None else True):
-                ret.append((node, logLevel, message))
-        return ret
+        return [(node, cls.log[message_nr][2], cls._get_message(message_nr)) for message_nr in cls._messages_by_node.get(id(node), ())
+                if cls.log[message_nr][0] == node.get_artifact_name()]
 
     @classmethod
     def has_errors(cls, node: ASTNode) -> bool:
@@ -284,7 +363,28 @@ class Logger:
         :return: True if errors detected, otherwise False
         :rtype: bool
         """
-        return len(cls.get_all_messages_of_level_and_or_node(node, LoggingLevel.ERROR)) > 0
+        return cls._message_counts[(node.get_artifact_name(), LoggingLevel.ERROR)] > 0
+
+    @classmethod
+    def write_json_format(cls, stream: TextIO) -> None:
+        """
+        Writes the log as a JSON list to the handed over stream, one message at a time.
+        :param stream: a text stream, for instance a file opened for writing
+        """
+        stream.write('[')
+        for i, message_nr in enumerate(cls.log.keys()):
+            (artifact_name, node, log_level, code, error_position, _) = cls.log[message_nr]
+            entry = OrderedDict()
+            entry['filename'] = artifact_name
+            entry['nodeName'] = node.get_name() if node is not None else 'GLOBAL'
+            entry['severity'] = str(log_level.name)
+            if code is not None:
+                entry['code'] = code.name if isinstance(code, MessageCode) else str(code)
+            entry['row'] = str(error_position.get_start_line()) if error_position is not None else ''
+            entry['col'] = str(error_position.get_start_column()) if error_position is not None else ''
+            entry['message'] = str(cls._get_message(message_nr))
+            stream.write((',' if i > 0 else '') + '\n' + textwrap.indent(json.dumps(entry, indent=2), '  '))
+        stream.write('\n]' if cls.log else ']')
 
     @classmethod
     def get_json_format(cls) -> str:
@@ -292,33 +392,6 @@ class Logger:
         Returns the log in a format which can be used to be stored to a file.
         :return: a string containing the log
         """
-        ret = '['
-        for messageNr in cls.log.keys():
-            (artifactName, node, logLevel, code, errorPosition, message) = cls.log[messageNr]
-            ret += '{' + \
-                   '"filename":"' + \
-                   artifactName + \
-                   '", ' + \
-                   '"nodeName":"' + \
-                   (node.get_name() if node is not None else 'GLOBAL') + '", ' + \
-                   '"severity":"' \
-                   + str(logLevel.name) + '", '
-            if code is not None:
-                ret += '"code":"' + \
-                       code.name + \
-                       '", '
-            ret += '"row":"' + \
-                   (str(errorPosition.get_start_line()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"col":"' \
-                   + (str(errorPosition.get_start_column()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"message":"' + str(message).replace('"', "'") + '"}'
-            ret += ','
-        if len(cls.log.keys()) == 0:
-            parsed = json.loads('[]', object_pairs_hook=OrderedDict)
-        else:
-            ret = ret[:-1]  # delete the last ","
-            ret += ']'
-            parsed = json.loads(ret, object_pairs_hook=OrderedDict)
-        return json.dumps(parsed, indent=2, sort_keys=False)
+        stream = io.StringIO()
+        cls.write_json_format(stream)
+        return stream.getvalue()
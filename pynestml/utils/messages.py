@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from enum import Enum
-from typing import Tuple
+from typing import List, Tuple
 
 
 class MessageCode(Enum):
@@ -117,6 +117,14 @@ class MessageCode(Enum):
     INSTALL_PATH_INFO = 88
     CREATING_INSTALL_PATH = 89
     CREATING_TARGET_PATH = 90
+    JIT_NOT_AVAILABLE = 91
+    JIT_NOT_SUPPORTED_FOR_MODEL = 92
+    SYNAPSE_MEMORY_FOOTPRINT = 93
+    EXPONENTIAL_EULER_NOT_LINEAR = 94
+    ANALYTIC_JACOBIAN_NOT_AVAILABLE = 95
+    POPULATION_NODE_NOT_SUPPORTED = 96
+    PROFILE_STORED = 97
+    STATE_EXPORT_NOT_SUPPORTED_FOR_MODEL = 98
 
 
 class Messages:
@@ -1220,3 +1228,47 @@ class Messages:
     def get_creating_install_path(cls, install_path: str):
         message = "Creating installation directory: '" + install_path + "'"
         return MessageCode.CREATING_INSTALL_PATH, message
+
+    @classmethod
+    def get_jit_not_available(cls, jit: str):
+        message = "Just-in-time compilation with '" + jit + "' was requested, but the package could not be imported. The generated code will run without just-in-time compilation until '" + jit + "' is installed."
+        return MessageCode.JIT_NOT_AVAILABLE, message
+
+    @classmethod
+    def get_jit_not_supported_for_model(cls, model_name: str, reason: str):
+        message = "Just-in-time compilation is not supported for model '" + model_name + "' (" + reason + "); falling back to plain Python code for this model."
+        return MessageCode.JIT_NOT_SUPPORTED_FOR_MODEL, message
+
+    @classmethod
+    def get_synapse_memory_footprint(cls, synapse_name: str, connection_size: int, common_size: int, common_variable_names: List[str], single_precision_variable_names: List[str]):
+        message = "Synapse '" + synapse_name + "': approximately " + str(connection_size) + " bytes per connection"
+        if common_variable_names:
+            message += "; " + str(common_size) + " bytes are shared by all connections in the common properties (" + ", ".join(common_variable_names) + ")"
+        if single_precision_variable_names:
+            message += "; stored in single precision: " + ", ".join(single_precision_variable_names)
+        return MessageCode.SYNAPSE_MEMORY_FOOTPRINT, message
+
+    @classmethod
+    def get_exponential_euler_not_linear(cls, neuron_name: str, variable_names: List[str]):
+        message = "Neuron '" + neuron_name + "': the right-hand side of the ODEs for the state variable(s) " + ", ".join(variable_names) + " is not linear in the variable itself; the exponential Euler solver falls back to the (less accurate) forward Euler method for these variables"
+        return MessageCode.EXPONENTIAL_EULER_NOT_LINEAR, message
+
+    @classmethod
+    def get_analytic_jacobian_not_available(cls, neuron_name: str, variable_name: str):
+        message = "Neuron '" + neuron_name + "': could not differentiate the right-hand side of the ODE for the state variable " + variable_name + " symbolically; the Jacobian of the system of ODEs will be approximated by finite differences"
+        return MessageCode.ANALYTIC_JACOBIAN_NOT_AVAILABLE, message
+
+    @classmethod
+    def get_population_node_not_supported(cls, neuron_name: str, reason: str):
+        message = "Neuron '" + neuron_name + "' cannot be generated as a population node: " + reason
+        return MessageCode.POPULATION_NODE_NOT_SUPPORTED, message
+
+    @classmethod
+    def get_profile_stored(cls, report_dir: str):
+        message = "Time spent in each phase of the toolchain stored in '" + report_dir + "' (profile.json, and profile_trace.json in the Chrome trace event format)"
+        return MessageCode.PROFILE_STORED, message
+
+    @classmethod
+    def get_state_export_not_supported_for_model(cls, model_name: str, reason: str):
+        message = "Exporting and importing the state is not supported for model '" + model_name + "' (" + reason + "); the state of this model is stored in member variables."
+        return MessageCode.STATE_EXPORT_NOT_SUPPORTED_FOR_MODEL, message
@@ -21,6 +21,8 @@
 
 from typing import Tuple
 
+import os
+
 from antlr4 import CommonTokenStream, FileStream, InputStream
 from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
 from antlr4.error.ErrorListener import ConsoleErrorListener
@@ -71,6 +73,7 @@ from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.utils.error_listener import NestMLErrorListener
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
+from pynestml.utils.profiler import Profiler
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
@@ -96,50 +99,53 @@ class ModelParser:
         code, message = Messages.get_start_processing_file(file_path)
         Logger.log_message(node=None, code=code, message=message, error_position=None, log_level=LoggingLevel.INFO)
 
-        # create a lexer and hand over the input
-        lexer = PyNestMLLexer()
-        lexer.removeErrorListeners()
-        lexer.addErrorListener(ConsoleErrorListener())
-        lexerErrorListener = NestMLErrorListener()
-        lexer.addErrorListener(lexerErrorListener)
-        # lexer._errHandler = BailErrorStrategy()  # N.B. uncomment this line and the next to halt immediately on lexer errors
-        # lexer._errHandler.reset(lexer)
-        lexer.inputStream = input_file
-        # create a token stream
-        stream = CommonTokenStream(lexer)
-        stream.fill()
-        if lexerErrorListener._error_occurred:
-            code, message = Messages.get_lexer_error()
-            Logger.log_message(node=None, code=None, message=message,
-                               error_position=None, log_level=LoggingLevel.ERROR)
-            return
-        # parse the file
-        parser = PyNestMLParser(None)
-        parser.removeErrorListeners()
-        parser.addErrorListener(ConsoleErrorListener())
-        parserErrorListener = NestMLErrorListener()
-        parser.addErrorListener(parserErrorListener)
-        # parser._errHandler = BailErrorStrategy()	# N.B. uncomment this line and the next to halt immediately on parse errors
-        # parser._errHandler.reset(parser)
-        parser.setTokenStream(stream)
-        compilation_unit = parser.nestMLCompilationUnit()
-        if parserErrorListener._error_occurred:
-            code, message = Messages.get_parser_error()
-            Logger.log_message(node=None, code=None, message=message,
-                               error_position=None, log_level=LoggingLevel.ERROR)
-            return
-
-        # create a new visitor and return the new AST
-        ast_builder_visitor = ASTBuilderVisitor(stream.tokens)
-        ast = ast_builder_visitor.visit(compilation_unit)
+        with Profiler.timer("parse", model=os.path.basename(file_path)):
+            # create a lexer and hand over the input
+            lexer = PyNestMLLexer()
+            lexer.removeErrorListeners()
+            lexer.addErrorListener(ConsoleErrorListener())
+            lexerErrorListener = NestMLErrorListener()
+            lexer.addErrorListener(lexerErrorListener)
+            # lexer._errHandler = BailErrorStrategy()  # N.B. uncomment this line and the next to halt immediately on lexer errors
+            # lexer._errHandler.reset(lexer)
+            lexer.inputStream = input_file
+            # create a token stream
+            stream = CommonTokenStream(lexer)
+            stream.fill()
+            if lexerErrorListener._error_occurred:
+                code, message = Messages.get_lexer_error()
+                Logger.log_message(node=None, code=None, message=message,
+                                   error_position=None, log_level=LoggingLevel.ERROR)
+                return
+            # parse the file
+            parser = PyNestMLParser(None)
+            parser.removeErrorListeners()
+            parser.addErrorListener(ConsoleErrorListener())
+            parserErrorListener = NestMLErrorListener()
+            parser.addErrorListener(parserErrorListener)
+            # parser._errHandler = BailErrorStrategy()	# N.B. uncomment this line and the next to halt immediately on parse errors
+            # parser._errHandler.reset(parser)
+            parser.setTokenStream(stream)
+            compilation_unit = parser.nestMLCompilationUnit()
+            if parserErrorListener._error_occurred:
+                code, message = Messages.get_parser_error()
+                Logger.log_message(node=None, code=None, message=message,
+                                   error_position=None, log_level=LoggingLevel.ERROR)
+                return
+
+            # create a new visitor and return the new AST
+            ast_builder_visitor = ASTBuilderVisitor(stream.tokens)
+            ast = ast_builder_visitor.visit(compilation_unit)
 
         # create and update the corresponding symbol tables
         SymbolTable.initialize_symbol_table(ast.get_source_position())
         for neuron in ast.get_neuron_list():
-            neuron.accept(ASTSymbolTableVisitor())
+            with Profiler.timer("symbol_table", model=neuron.get_name()):
+                neuron.accept(ASTSymbolTableVisitor())
             SymbolTable.add_neuron_scope(neuron.get_name(), neuron.get_scope())
         for synapse in ast.get_synapse_list():
-            synapse.accept(ASTSymbolTableVisitor())
+            with Profiler.timer("symbol_table", model=synapse.get_name()):
+                synapse.accept(ASTSymbolTableVisitor())
             SymbolTable.add_synapse_scope(synapse.get_name(), synapse.get_scope())
 
         # store source paths
@@ -21,6 +21,54 @@
 
 import re
 
+import sympy
+from sympy.printing.str import StrPrinter
+
+
+class _NESTMLSympyPrinter(StrPrinter):
+    r"""
+    Prints sympy expressions in NESTML syntax, including functions that ODE-toolbox does not produce itself, but that can appear when further processing its output with sympy (for instance, the derivative of ``min()``).
+
+    This does not derive from the ODE-toolbox printer, as that is not part of the public API of ODE-toolbox; the methods needed here are reproduced instead.
+    """
+
+    def _print_Exp1(self, expr):
+        return "e"
+
+    def _print_Function(self, expr):
+        return expr.func.__name__ + "(" + self.stringify(expr.args, ", ") + ")"
+
+    def _print_Min(self, expr):
+        return "min(" + self.stringify(expr.args, ", ") + ")"
+
+    def _print_Max(self, expr):
+        return "max(" + self.stringify(expr.args, ", ") + ")"
+
+    def _print_Heaviside(self, expr):
+        return "((" + self._print(expr.args[0]) + " > 0) ? (1) : (0))"
+
+    def _print_Piecewise(self, expr):
+        # ``Piecewise((expr_1, cond_1), (expr_2, cond_2), ..., (expr_n, True))`` is written as nested ternary operators ``((cond_1) ? (expr_1) : (((cond_2) ? (expr_2) : (...))))``
+        assert expr.args[-1].cond == sympy.true, "Can only handle piecewise conditional functions with a default (\"otherwise\") case"
+        s = self._print(expr.args[-1].expr)
+        for piece in reversed(expr.args[:-1]):
+            s = "((" + self._print(piece.cond) + ") ? (" + self._print(piece.expr) + ") : (" + s + "))"
+
+        return s
+
+    def _print_And(self, expr):
+        return "(" + ") and (".join(self._print(arg) for arg in expr.args) + ")"
+
+    def _print_Or(self, expr):
+        return "(" + ") or (".join(self._print(arg) for arg in expr.args) + ")"
+
+    def _print_Not(self, expr):
+        return "not (" + self._print(expr.args[0]) + ")"
+
+    def _print_Rational(self, expr):
+        # avoid integer division in the generated code
+        return repr(float(expr))
+
 
 class ODEToolboxUtils:
     r"""
@@ -42,3 +90,9 @@ class ODEToolboxUtils:
             s = s.replace("Piecewise(" + match + ")", "((" + cond + ") ? (" + expr_if_true + ") : (" + str(expr_if_false) + "))")
 
         return s
+
+    @classmethod
+    def _print_sympy_expression(cls, expr: sympy.Expr) -> str:
+        r"""Print a sympy expression as a string in NESTML syntax.
+        """
+        return _NESTMLSympyPrinter().doprint(expr)
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# profiler.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import cProfile
+import json
+import os
+import re
+import time
+
+
+class Profiler:
+    """
+    This class records the wall-clock and CPU time spent in each phase of the toolchain, like parsing, building the symbol table, checking the context conditions, transformations, ODE-toolbox analysis, building the template namespace, rendering and building the generated code.
+
+    Each timed interval is recorded as an event with a name, a category and (where applicable) the name of the model or file it belongs to. The categories used are:
+
+        phase       A phase of the toolchain for one model, file or module, or the toolchain as a whole.
+        coco        A single context condition check for one model.
+        template    Rendering a single template for one model.
+        transformer Running a single transformer on all models.
+
+    Events can be nested; for example, the context conditions are checked while the symbol table is built. The CPU time includes the time spent in child processes, like cmake and make. If a directory for cProfile statistics is given, the outermost timed interval (typically a phase) is run under cProfile, and the statistics are stored in that directory, one file per event.
+
+    The profiler is disabled by default, in which case timing an interval has negligible overhead.
+
+    Attributes:
+        enabled       Indicates whether events are recorded.
+        events        The recorded events, in the order in which they ended.
+        cprofile_dir  The directory where cProfile statistics are stored, or None if cProfile is not used.
+    """
+    enabled = False
+    events: List[Dict[str, Any]] = []
+    cprofile_dir: Optional[str] = None
+    _start_time = 0.
+    _depth = 0
+
+    @classmethod
+    def init_profiler(cls, enabled: bool = False, cprofile_dir: Optional[str] = None) -> None:
+        """
+        Initializes the profiler, discarding any previously recorded events.
+        :param enabled: whether to record events
+        :param cprofile_dir: the directory where cProfile statistics are stored for each outermost event, or None to not use cProfile
+        """
+        cls.enabled = enabled
+        cls.events = []
+        cls.cprofile_dir = cprofile_dir
+        cls._start_time = time.perf_counter()
+        cls._depth = 0
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """
+        Returns whether events are being recorded.
+        :return: True if the profiler is enabled
+        """
+        return cls.enabled
+
+    @staticmethod
+    def _cpu_time() -> float:
+        # the CPU time of this process is measured with a higher resolution than that of the child processes
+        t = os.times()
+        return time.process_time() + t.children_user + t.children_system
+
+    @classmethod
+    @contextmanager
+    def timer(cls, name: str, category: str = "phase", model: Optional[str] = None) -> Iterator[None]:
+        """
+        Records the wall-clock and CPU time spent in the body of the ``with`` statement as an event.
+        :param name: the name of the event, for example the name of the phase
+        :param category: the category of the event
+        :param model: the name of the model or file the event belongs to, if any
+        """
+        if not cls.enabled:
+            yield
+            return
+
+        profile = None
+        if cls.cprofile_dir is not None and cls._depth == 0:
+            profile = cProfile.Profile()
+
+        cls._depth += 1
+        start_time = time.perf_counter()
+        start_cpu_time = cls._cpu_time()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            wall_time = time.perf_counter() - start_time
+            cpu_time = cls._cpu_time() - start_cpu_time
+            cls._depth -= 1
+            cls.events.append({"name": name,
+                               "category": category,
+                               "model": model,
+                               "start": start_time - cls._start_time,
+                               "wall_time": wall_time,
+                               "cpu_time": cpu_time,
+                               "depth": cls._depth})
+            if profile is not None:
+                cls._dump_cprofile(profile, name, model)
+
+    @classmethod
+    def _dump_cprofile(cls, profile: cProfile.Profile, name: str, model: Optional[str]) -> None:
+        file_name = name if model is None else name + "_" + model
+        file_name = re.sub(r"[^a-zA-Z0-9_.-]", "_", file_name)
+        file_name = "profile_" + str(len(cls.events)) + "_" + file_name + ".prof"
+        if not os.path.isdir(cls.cprofile_dir):
+            os.makedirs(cls.cprofile_dir)
+        profile.dump_stats(os.path.join(cls.cprofile_dir, file_name))
+
+    @classmethod
+    def get_events(cls, category: Optional[str] = None, model: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the recorded events, optionally only those of a given category and/or model.
+        :param category: the category, or None for all categories
+        :param model: the name of the model, or None for all models
+        :return: a list of events, in the order in which they ended
+        """
+        return [event for event in cls.events
+                if (category is None or event["category"] == category) and (model is None or event["model"] == model)]
+
+    @classmethod
+    def get_summary(cls) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Returns the total wall-clock and CPU time and the number of events for each event name, per category.
+        :return: a dictionary mapping each category to a dictionary from event name to totals
+        """
+        summary: Dict[str, Dict[str, Dict[str, float]]] = OrderedDict()
+        for event in cls.events:
+            totals = summary.setdefault(event["category"], OrderedDict()).setdefault(event["name"], {"wall_time": 0., "cpu_time": 0., "count": 0})
+            totals["wall_time"] += event["wall_time"]
+            totals["cpu_time"] += event["cpu_time"]
+            totals["count"] += 1
+        return summary
+
+    @classmethod
+    def write_json(cls, stream: TextIO) -> None:
+        """
+        Writes the recorded events and the summary (see ``get_summary()``) to a stream, in JSON format. Times are given in seconds, relative to the initialisation of the profiler.
+        :param stream: a text stream, for instance an open file
+        """
+        json.dump({"events": cls.events, "summary": cls.get_summary()}, stream, indent=2)
+
+    @classmethod
+    def write_chrome_trace(cls, stream: TextIO) -> None:
+        """
+        Writes the recorded events to a stream in the Chrome trace event format, which can be viewed for instance in ``chrome://tracing`` or Perfetto. Times are given in microseconds.
+        :param stream: a text stream, for instance an open file
+        """
+        trace_events = []
+        for event in sorted(cls.events, key=lambda event: (event["start"], event["depth"])):
+            args = {"cpu_time": event["cpu_time"]}
+            if event["model"] is not None:
+                args["model"] = event["model"]
+            trace_events.append({"name": event["name"] if event["model"] is None else event["name"] + " (" + event["model"] + ")",
+                                 "cat": event["category"],
+                                 "ph": "X",
+                                 "ts": 1E6 * event["start"],
+                                 "dur": 1E6 * event["wall_time"],
+                                 "pid": os.getpid(),
+                                 "tid": 0,
+                                 "args": args})
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, stream)
+
+    @classmethod
+    def store(cls, report_dir: str) -> None:
+        """
+        Stores the recorded events in a report directory, as ``profile.json`` (see ``write_json()``) and ``profile_trace.json`` (see ``write_chrome_trace()``).
+        :param report_dir: the report directory
+        """
+        with open(os.path.join(report_dir, "profile.json"), "w") as f:
+            cls.write_json(f)
+        with open(os.path.join(report_dir, "profile_trace.json"), "w") as f:
+            cls.write_chrome_trace(f)
@@ -21,7 +21,7 @@
 
 from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
 from pynestml.utils.logger import Logger, LoggingLevel
-from pynestml.utils.messages import Messages
+from pynestml.utils.messages import Messages, MessageCode
 
 
 class TypeCaster:
@@ -52,10 +52,11 @@ class TypeCaster:
                     TypeCaster.do_magnitude_conversion_rhs_to_lhs(
                         _rhs_type_symbol, _lhs_type_symbol, _containing_expression)
             # the units are mutually convertible (e.g. V and A*Ohm)
-            code, message = Messages.get_implicit_cast_rhs_to_lhs(_rhs_type_symbol.print_symbol(),
-                                                                  _lhs_type_symbol.print_symbol())
             Logger.log_message(error_position=_containing_expression.get_source_position(),
-                               code=code, message=message, log_level=LoggingLevel.INFO)
+                               code=MessageCode.IMPLICIT_CAST,
+                               message=lambda: Messages.get_implicit_cast_rhs_to_lhs(_rhs_type_symbol.print_symbol(),
+                                                                                     _lhs_type_symbol.print_symbol())[1],
+                               log_level=LoggingLevel.INFO)
         else:
             code, message = Messages.get_type_different_from_expected(_lhs_type_symbol, _rhs_type_symbol)
             Logger.log_message(error_position=_containing_expression.get_source_position(),
@@ -57,6 +57,7 @@ setup(
     entry_points={
         "console_scripts": [
             "nestml = pynestml.frontend.pynestml_frontend:main",
+            "nestml-bench = pynestml.codegeneration.nest_benchmark:main",
         ],
     },
 
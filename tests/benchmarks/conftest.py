@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# conftest.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, Optional
+
+import datetime
+import json
+import os
+import platform
+
+import pytest
+
+import pynestml
+
+
+class BenchmarkResults:
+    r"""
+    Collects the results of the benchmarks in this directory, and stores them in JSON format when the test session ends.
+
+    The results are stored in the file given by the ``NESTML_BENCHMARK_RESULTS`` environment variable (default: ``nestml_benchmark_results.json`` in the current working directory). If the ``NESTML_BENCHMARK_BASELINE`` environment variable gives the name of a results file from an earlier run, each result is compared to the baseline, and the benchmark fails if the result is worse than the baseline by more than a relative tolerance, given by the ``NESTML_BENCHMARK_TOLERANCE`` environment variable (default: 0.5, that is, 50 %).
+    """
+
+    def __init__(self):
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.baseline: Optional[Dict[str, Dict[str, Any]]] = None
+        self.tolerance = float(os.environ.get("NESTML_BENCHMARK_TOLERANCE", .5))
+        baseline_fn = os.environ.get("NESTML_BENCHMARK_BASELINE")
+        if baseline_fn:
+            with open(baseline_fn) as f:
+                self.baseline = json.load(f)["results"]
+
+    def record(self, name: str, value: float, unit: str, higher_is_better: bool = False) -> None:
+        r"""
+        Record a result, and compare it to the baseline, if any.
+
+        Parameters
+        ----------
+        name
+            Unique name of the result, for example ``"parse/iaf_psc_exp"``.
+        value
+            The measured value.
+        unit
+            The unit of the value, for example ``"s"``.
+        higher_is_better
+            Whether higher values are better (like for a throughput) or worse (like for a wall-clock time).
+        """
+        self.results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+        print(name + ": " + str(value) + " " + unit)
+
+        if self.baseline is None or name not in self.baseline:
+            return
+
+        baseline_value = self.baseline[name]["value"]
+        if higher_is_better:
+            assert value >= baseline_value / (1 + self.tolerance), name + ": " + str(value) + " " + unit + " is worse than the baseline (" + str(baseline_value) + " " + unit + ")"
+        else:
+            assert value <= baseline_value * (1 + self.tolerance), name + ": " + str(value) + " " + unit + " is worse than the baseline (" + str(baseline_value) + " " + unit + ")"
+
+    def store(self, fn: str) -> None:
+        r"""
+        Store the results, together with a description of the machine they were obtained on, in JSON format.
+        """
+        with open(fn, "w") as f:
+            json.dump({"date": datetime.datetime.utcnow().isoformat(),
+                       "machine": {"platform": platform.platform(),
+                                   "processor": platform.processor(),
+                                   "cpu_count": os.cpu_count(),
+                                   "python": platform.python_version()},
+                       "pynestml_version": pynestml.__version__,
+                       "results": self.results}, f, indent=2)
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    results = BenchmarkResults()
+    yield results
+    if results.results:
+        results.store(os.environ.get("NESTML_BENCHMARK_RESULTS", "nestml_benchmark_results.json"))
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# nest_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import json
+import os
+import pytest
+
+from pynestml.codegeneration.nest_benchmark import NESTBenchmark, main
+from pynestml.codegeneration.nest_tools import NESTTools
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+pytest.importorskip("nest")
+
+
+@pytest.mark.skipif(NESTTools.detect_nest_version().startswith("v2"),
+                    reason="The benchmarks require NEST 3")
+class TestNESTBenchmark:
+    r"""
+    Run the ``nestml-bench`` scenarios on a small network of neurons with STDP synapses that were generated together.
+    """
+
+    module_name = "nestml_benchmark_module"
+    neuron_model_name = "iaf_psc_exp_nestml__with_stdp_nestml"
+    synapse_model_name = "stdp_nestml__with_iaf_psc_exp_nestml"
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        files = [os.path.join("models", "neurons", "iaf_psc_exp.nestml"),
+                 os.path.join("models", "synapses", "stdp_synapse.nestml")]
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(
+            os.pardir, os.pardir, s))) for s in files]
+        generate_nest_target(input_path=input_path,
+                             target_path="/tmp/nestml-benchmark",
+                             logging_level="INFO",
+                             module_name=self.module_name,
+                             suffix="_nestml",
+                             codegen_opts={"neuron_parent_class": "StructuralPlasticityNode",
+                                           "neuron_parent_class_include": "structural_plasticity_node.h",
+                                           "neuron_synapse_pairs": [{"neuron": "iaf_psc_exp",
+                                                                     "synapse": "stdp",
+                                                                     "post_ports": ["post_spikes"]}]})
+
+    @pytest.mark.parametrize("scenario", NESTBenchmark.scenarios)
+    def test_nest_benchmark(self, scenario):
+        results = NESTBenchmark.run_scenario(scenario, self.module_name, self.neuron_model_name, self.synapse_model_name,
+                                             n_neurons=100, sim_time=100., warmup_time=10.)
+        print(NESTBenchmark.format_results(results))
+
+        assert results["n_spikes"] > 0
+        assert results["real_time_factor"] > 0.
+        assert results["ns_per_neuron_update"] > 0.
+        if scenario == "population":
+            assert results["n_synapses"] == 0
+            assert results["ns_per_synaptic_event"] is None
+        else:
+            assert results["n_synapses"] == 100 * (8 + 2)
+            assert results["n_synaptic_events"] > 0
+            assert results["ns_per_synaptic_event"] > 0.
+
+    def test_nest_benchmark_main(self, tmp_path):
+        output_fn = str(tmp_path / "results.json")
+        assert main(["--module_name", self.module_name,
+                     "--neuron_model", self.neuron_model_name,
+                     "--synapse_model", self.synapse_model_name,
+                     "--n_neurons", "100",
+                     "--sim_time", "100.",
+                     "--output", output_fn]) == 0
+
+        with open(output_fn) as f:
+            results = json.load(f)["results"]
+        assert [r["scenario"] for r in results] == NESTBenchmark.scenarios
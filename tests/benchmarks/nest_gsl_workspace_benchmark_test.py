@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# nest_gsl_workspace_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pytest
+import resource
+import time
+
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+nest = pytest.importorskip("nest")
+
+
+class TestNESTGSLWorkspaceBenchmark:
+    r"""
+    Benchmark of the memory footprint and the time to create and initialise a neuron of a numerically integrated model, which shares its GSL workspace with all other neurons that are updated by the same thread.
+
+    The results for ``hh_psc_alpha_nestml`` are recorded alongside those of the NEST built-in ``hh_psc_alpha``, which allocates a GSL workspace for each neuron.
+    """
+
+    module_name = "nestml_gsl_workspace_benchmark_module"
+    n_neurons = 100000
+    resolution = .1    # [ms]
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "hh_psc_alpha.nestml"))
+        generate_nest_target(input_path=input_path,
+                             target_path="/tmp/nestml-gsl-workspace-benchmark",
+                             logging_level="INFO",
+                             module_name=self.module_name,
+                             suffix="_nestml")
+
+    def _get_resident_memory(self) -> int:
+        """Return the current resident set size of the process in bytes"""
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+
+    @pytest.mark.parametrize("neuron_model_name", ["hh_psc_alpha", "hh_psc_alpha_nestml"])
+    def test_nest_gsl_workspace_benchmark(self, neuron_model_name, benchmark_results):
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(self.module_name)
+
+        memory_before = self._get_resident_memory()
+        start_time = time.perf_counter()
+        nest.Create(neuron_model_name, self.n_neurons)
+        nest.Simulate(self.resolution)    # initialise the buffers of all neurons
+        wall_time = time.perf_counter() - start_time
+        memory = self._get_resident_memory() - memory_before
+
+        benchmark_results.record("gsl_workspace/" + neuron_model_name + "/memory", memory / self.n_neurons, unit="bytes/neuron")
+        benchmark_results.record("gsl_workspace/" + neuron_model_name + "/creation", 1E6 * wall_time / self.n_neurons, unit="us/neuron")
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# nest_numeric_solver_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+import pytest
+import time
+
+from pynestml.codegeneration.nest_tools import NESTTools
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+nest = pytest.importorskip("nest")
+
+
+class TestNESTNumericSolverBenchmark:
+    r"""
+    Benchmark of runtime versus accuracy for each value of the ``numeric_solver`` code generator option, on Hodgkin-Huxley type neurons.
+
+    A population of neurons, each driven by a different constant current, is simulated once for each solver. The wall-clock time and the accuracy are recorded as benchmark results. The accuracy is measured against a reference simulation with the default adaptive ``rkf45`` solver and a tight error tolerance: the root-mean-square error of the membrane potential, and the difference in the number of spikes fired. All solvers should reproduce the firing rates of the reference.
+    """
+
+    neuron_model_names = ["hh_cond_exp_traub_nestml", "wb_cond_multisyn_nestml"]
+    numeric_solvers = ["rkf45", "rk4", "rk4imp", "bsimp", "exponential_euler"]
+    n_neurons = 100
+    resolution = .01    # [ms]
+    sim_time = 1000.    # [ms]
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        """Generate the model code once for each solver"""
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", s))
+                      for s in ["hh_cond_exp_traub.nestml", "wb_cond_multisyn.nestml"]]
+
+        for numeric_solver in self.numeric_solvers:
+            generate_nest_target(input_path=input_path,
+                                 target_path="/tmp/nestml-numeric-solver-benchmark-" + numeric_solver,
+                                 logging_level="INFO",
+                                 module_name=self._get_module_name(numeric_solver),
+                                 suffix="_nestml",
+                                 codegen_opts={"numeric_solver": numeric_solver})
+
+    def _get_module_name(self, numeric_solver: str) -> str:
+        return "nestml_numeric_solver_benchmark_" + numeric_solver + "_module"
+
+    def run_simulation(self, numeric_solver: str, neuron_model_name: str, gsl_error_tol: float = 1E-3):
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(self._get_module_name(numeric_solver))
+        nest.SetKernelStatus({"resolution": self.resolution})
+
+        neurons = nest.Create(neuron_model_name, self.n_neurons)
+        nest.SetStatus(neurons, [{"I_e": I_e, "gsl_error_tol": gsl_error_tol} for I_e in np.linspace(0., 200., self.n_neurons)])
+
+        vm = nest.Create("voltmeter", params={"interval": 1.})
+        nest.Connect(vm, neurons)
+        if NESTTools.detect_nest_version().startswith("v2"):
+            sr = nest.Create("spike_detector")
+        else:
+            sr = nest.Create("spike_recorder")
+        nest.Connect(neurons, sr)
+
+        start_time = time.perf_counter()
+        nest.Simulate(self.sim_time)
+        wall_time = time.perf_counter() - start_time
+
+        events = nest.GetStatus(vm)[0]["events"]
+        idx = np.lexsort((events["times"], events["senders"]))
+        senders = nest.GetStatus(sr)[0]["events"]["senders"]
+        spike_counts = np.array([np.sum(senders == gid) for gid in nest.GetStatus(neurons, "global_id")])
+
+        return events["V_m"][idx], spike_counts, wall_time
+
+    def test_nest_numeric_solver_benchmark(self, benchmark_results):
+        for neuron_model_name in self.neuron_model_names:
+            V_m_ref, spike_counts_ref, _ = self.run_simulation("rkf45", neuron_model_name, gsl_error_tol=1E-9)
+            assert np.sum(spike_counts_ref) > 0
+
+            for numeric_solver in self.numeric_solvers:
+                V_m, spike_counts, wall_time = self.run_simulation(numeric_solver, neuron_model_name)
+                assert np.all(np.isfinite(V_m))
+
+                rmse = float(np.sqrt(np.mean((V_m - V_m_ref)**2)))
+                benchmark_results.record("numeric_solver/" + neuron_model_name + "/" + numeric_solver + "/wall_time", wall_time, unit="s")
+                benchmark_results.record("numeric_solver/" + neuron_model_name + "/" + numeric_solver + "/V_m_rmse", rmse, unit="mV")
+
+                np.testing.assert_allclose(spike_counts, spike_counts_ref, rtol=.05, atol=1)
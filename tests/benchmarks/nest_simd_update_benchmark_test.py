@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# nest_simd_update_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+import pytest
+import time
+
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+nest = pytest.importorskip("nest")
+
+
+class TestNESTSIMDUpdateBenchmark:
+    r"""
+    Microbenchmark of the update of multisynapse neurons, with and without the ``simd_update`` code generator option.
+
+    A population of neurons, each receiving Poisson spike trains on all of its receptors, is simulated once for each variant of the generated code. As the kernel is reset with the same random seed before each simulation, the spike trains are the same for both variants. The wall-clock time is recorded in nanoseconds per neuron per simulation step; both variants should produce identical membrane potential traces.
+    """
+
+    neuron_model_names = ["iaf_psc_exp_multisynapse_neuron_nestml", "iaf_psc_alpha_multisynapse_neuron_nestml"]
+    n_neurons = 1000
+    n_receptors = 3
+    resolution = .1    # [ms]
+    sim_time = 1000.    # [ms]
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        """Generate the model code, once without and once with the ``simd_update`` option"""
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "nest_tests", "resources", s))
+                      for s in ["iaf_psc_exp_multisynapse.nestml", "iaf_psc_alpha_multisynapse.nestml"]]
+
+        for simd_update in [False, True]:
+            generate_nest_target(input_path=input_path,
+                                 target_path="/tmp/nestml-simd-update-benchmark-" + str(simd_update).lower(),
+                                 logging_level="INFO",
+                                 module_name=self._get_module_name(simd_update),
+                                 suffix="_nestml",
+                                 codegen_opts={"simd_update": simd_update})
+
+    def _get_module_name(self, simd_update: bool) -> str:
+        return "nestml_simd_update_benchmark_" + str(simd_update).lower() + "_module"
+
+    def run_simulation(self, module_name: str, neuron_model_name: str):
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(module_name)
+        nest.SetKernelStatus({"resolution": self.resolution})
+
+        neurons = nest.Create(neuron_model_name, self.n_neurons)
+        for receptor_type in range(1, self.n_receptors + 1):
+            pg = nest.Create("poisson_generator", params={"rate": 20000.})
+            nest.Connect(pg, neurons, syn_spec={"receptor_type": receptor_type,
+                                                "weight": 50.,
+                                                "delay": 1.})
+
+        vm = nest.Create("voltmeter", params={"interval": self.resolution})
+        nest.Connect(vm, neurons[:10])
+
+        # the first call to Simulate() includes the preparation of the network, which is not timed
+        nest.Simulate(self.resolution)
+        start_time = time.perf_counter()
+        nest.Simulate(self.sim_time)
+        wall_time = time.perf_counter() - start_time
+
+        n_steps = int(round(self.sim_time / self.resolution))
+        ns_per_neuron_per_step = 1E9 * wall_time / (self.n_neurons * n_steps)
+
+        events = nest.GetStatus(vm)[0]["events"]
+        idx = np.lexsort((events["times"], events["senders"]))
+
+        return events["V_m"][idx], ns_per_neuron_per_step
+
+    def test_nest_simd_update_benchmark(self, benchmark_results):
+        for neuron_model_name in self.neuron_model_names:
+            V_m, ns_per_neuron_per_step = self.run_simulation(self._get_module_name(False), neuron_model_name)
+            V_m_simd, ns_per_neuron_per_step_simd = self.run_simulation(self._get_module_name(True), neuron_model_name)
+
+            benchmark_results.record("simd_update/" + neuron_model_name + "/false", ns_per_neuron_per_step, unit="ns/neuron/step")
+            benchmark_results.record("simd_update/" + neuron_model_name + "/true", ns_per_neuron_per_step_simd, unit="ns/neuron/step")
+
+            assert len(V_m) > 0
+            np.testing.assert_array_equal(V_m_simd, V_m)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# nest_state_dependent_propagators_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+import pytest
+import time
+
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+nest = pytest.importorskip("nest")
+
+
+class TestNESTStateDependentPropagatorsBenchmark:
+    r"""
+    Benchmark of the cost of recomputing the propagators in each simulation step, for a neuron whose propagators depend on a state variable.
+
+    The model ``iaf_psc_exp_state_dependent_propagators`` is ``iaf_psc_exp`` with the membrane time constant declared as a state variable; the wall-clock times of both models are recorded.
+    """
+
+    module_name = "nestml_state_dependent_propagators_benchmark_module"
+    n_neurons = 100
+    resolution = .1    # [ms]
+    sim_time = 1000.    # [ms]
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "iaf_psc_exp.nestml")),
+                      os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "nest_tests", "resources", "iaf_psc_exp_state_dependent_propagators.nestml"))]
+        generate_nest_target(input_path=input_path,
+                             target_path="/tmp/nestml-state-dependent-propagators-benchmark",
+                             logging_level="INFO",
+                             module_name=self.module_name,
+                             suffix="_nestml")
+
+    @pytest.mark.parametrize("neuron_model_name", ["iaf_psc_exp_nestml", "iaf_psc_exp_state_dependent_propagators_nestml"])
+    def test_nest_state_dependent_propagators_benchmark(self, neuron_model_name, benchmark_results):
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(self.module_name)
+        nest.SetKernelStatus({"resolution": self.resolution})
+
+        neurons = nest.Create(neuron_model_name, self.n_neurons, params={"I_e": 200.})
+        sg = nest.Create("spike_generator", params={"spike_times": np.arange(10., self.sim_time, 10.)})
+        nest.Connect(sg, neurons, syn_spec={"weight": 1000.})
+
+        start_time = time.perf_counter()
+        nest.Simulate(self.sim_time)
+        wall_time = time.perf_counter() - start_time
+
+        benchmark_results.record("state_dependent_propagators/" + neuron_model_name, wall_time, unit="s")
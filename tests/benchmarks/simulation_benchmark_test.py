@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# simulation_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import importlib
+import os
+import time
+
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_nest_target, generate_python_standalone_target
+
+
+class TestSimulationBenchmark:
+    r"""
+    Benchmark of the simulation throughput of the generated code, in neuron updates (number of neurons times number of simulation steps) per second of wall-clock time.
+
+    A population of unconnected neurons, each driven by excitatory spikes, is simulated with the Python-standalone target (with and without JIT compilation), and with NEST if it is installed.
+    """
+
+    neuron_models = ["iaf_psc_exp", "aeif_cond_exp"]
+    n_neurons = 100
+    t_stop = 100.    # [ms]
+
+    def _get_input_path(self, neuron_model):
+        return os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", neuron_model + ".nestml"))
+
+    def _run_python_standalone(self, module_name, neuron_model, t_stop):
+        r"""Simulate the population with the generated Python-standalone module and return the number of neuron updates per second."""
+        simulator_module = importlib.import_module(module_name + ".simulator")
+        spike_generator_module = importlib.import_module(module_name + ".spike_generator")
+        neuron_module = importlib.import_module(module_name + "." + neuron_model)
+        neuron_class = getattr(neuron_module, "Neuron_" + neuron_model)
+
+        simulator = simulator_module.Simulator()
+        sg_exc = simulator.add_neuron(spike_generator_module.SpikeGenerator(interval=10.))
+        for _ in range(self.n_neurons):
+            neuron = simulator.add_neuron(neuron_class(timestep=simulator.timestep))
+            simulator.connect(sg_exc, neuron, "exc_spikes", w=1000.)
+
+        start_time = time.perf_counter()
+        simulator.run(t_stop)
+        wall_time = time.perf_counter() - start_time
+
+        n_steps = len(simulator.log["t"])
+        assert n_steps > 0
+        return self.n_neurons * n_steps / wall_time
+
+    @pytest.mark.parametrize("neuron_model", neuron_models)
+    def test_python_standalone_simulation_benchmark(self, neuron_model, benchmark_results):
+        module_name = "nestmlmodule_benchmark_" + neuron_model
+        generate_python_standalone_target(self._get_input_path(neuron_model), module_name,
+                                          module_name=module_name,
+                                          logging_level="ERROR")
+
+        benchmark_results.record("simulation/python_standalone/" + neuron_model, self._run_python_standalone(module_name, neuron_model, self.t_stop),
+                                 unit="neuron updates/s", higher_is_better=True)
+
+    @pytest.mark.parametrize("neuron_model", neuron_models)
+    def test_python_standalone_jit_simulation_benchmark(self, neuron_model, benchmark_results):
+        pytest.importorskip("numba")
+
+        module_name = "nestmlmodule_benchmark_jit_" + neuron_model
+        generate_python_standalone_target(self._get_input_path(neuron_model), module_name,
+                                          module_name=module_name,
+                                          logging_level="ERROR",
+                                          codegen_opts={"jit": "numba"})
+
+        self._run_python_standalone(module_name, neuron_model, t_stop=1.)   # warm-up run: trigger JIT compilation
+        benchmark_results.record("simulation/python_standalone_jit/" + neuron_model, self._run_python_standalone(module_name, neuron_model, self.t_stop),
+                                 unit="neuron updates/s", higher_is_better=True)
+
+    @pytest.mark.parametrize("neuron_model", neuron_models)
+    def test_nest_simulation_benchmark(self, neuron_model, benchmark_results):
+        nest = pytest.importorskip("nest")
+
+        module_name = "nestml_benchmark_" + neuron_model + "_module"
+        generate_nest_target(self._get_input_path(neuron_model),
+                             target_path="/tmp/nestml-benchmark-" + neuron_model,
+                             logging_level="ERROR",
+                             module_name=module_name,
+                             suffix="_nestml")
+
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(module_name)
+
+        neurons = nest.Create(neuron_model + "_nestml", self.n_neurons)
+        sg = nest.Create("spike_generator", params={"spike_times": [10. * (i + 1) for i in range(int(self.t_stop / 10.))]})
+        nest.Connect(sg, neurons, syn_spec={"weight": 1000.})
+
+        start_time = time.perf_counter()
+        nest.Simulate(self.t_stop)
+        wall_time = time.perf_counter() - start_time
+
+        n_steps = int(round(self.t_stop / nest.GetKernelStatus("resolution")))
+        benchmark_results.record("simulation/nest/" + neuron_model, self.n_neurons * n_steps / wall_time,
+                                 unit="neuron updates/s", higher_is_better=True)
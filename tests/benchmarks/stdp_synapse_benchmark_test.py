@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# stdp_synapse_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+import pytest
+import time
+
+from pynestml.codegeneration.nest_tools import NESTTools
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+nest = pytest.importorskip("nest")
+
+
+class TestNESTSTDPSynapseBenchmark:
+    r"""
+    Benchmark the lookup of postsynaptic trace values in a neuron that has a large number of incoming STDP synapses.
+
+    All presynaptic neurons spike at the same times, so that all synapses request the trace value at the same times and should end up with identical weights.
+    """
+
+    neuron_model_name = "iaf_psc_exp_nestml__with_stdp_nestml"
+    synapse_model_name = "stdp_nestml__with_iaf_psc_exp_nestml"
+    n_connections = 10000
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        """Generate the model code"""
+        codegen_opts = {"neuron_synapse_pairs": [{"neuron": "iaf_psc_exp",
+                                                  "synapse": "stdp",
+                                                  "post_ports": ["post_spikes"]}]}
+        if not NESTTools.detect_nest_version().startswith("v2"):
+            codegen_opts["neuron_parent_class"] = "StructuralPlasticityNode"
+            codegen_opts["neuron_parent_class_include"] = "structural_plasticity_node.h"
+
+        files = [os.path.join("models", "neurons", "iaf_psc_exp.nestml"),
+                 os.path.join("models", "synapses", "stdp_synapse.nestml")]
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(
+            os.pardir, os.pardir, s))) for s in files]
+        generate_nest_target(input_path=input_path,
+                             target_path="/tmp/nestml-stdp-benchmark",
+                             logging_level="INFO",
+                             module_name="nestml_stdp_benchmark_module",
+                             suffix="_nestml",
+                             codegen_opts=codegen_opts)
+
+    def test_nest_stdp_synapse_benchmark(self, benchmark_results):
+        resolution = .1    # [ms]
+        sim_time = 1000.    # [ms]
+
+        np.random.seed(123)
+        pre_spike_times = np.unique(np.round(np.sort(np.random.uniform(1., sim_time, 100)), decimals=1))
+        post_spike_times = np.unique(np.round(np.sort(np.random.uniform(1., sim_time, 100)), decimals=1))
+
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install("nestml_stdp_benchmark_module")
+        nest.SetKernelStatus({"resolution": resolution})
+
+        pre_sg = nest.Create("spike_generator", params={"spike_times": pre_spike_times})
+        post_sg = nest.Create("spike_generator", params={"spike_times": post_spike_times})
+        pre_neurons = nest.Create("parrot_neuron", self.n_connections)
+        post_neuron = nest.Create(self.neuron_model_name)
+
+        nest.Connect(pre_sg, pre_neurons, "all_to_all", syn_spec={"delay": 1.})
+        nest.Connect(post_sg, post_neuron, "one_to_one", syn_spec={"delay": 1., "weight": 9999.})
+        if NESTTools.detect_nest_version().startswith("v2"):
+            nest.Connect(pre_neurons, post_neuron, "all_to_all", syn_spec={"model": self.synapse_model_name})
+        else:
+            nest.Connect(pre_neurons, post_neuron, "all_to_all", syn_spec={"synapse_model": self.synapse_model_name, "w": 1.})
+
+        start_time = time.perf_counter()
+        nest.Simulate(sim_time)
+        wall_time = time.perf_counter() - start_time
+        benchmark_results.record("stdp_synapse/" + str(self.n_connections) + "_connections", wall_time, unit="s")
+
+        conns = nest.GetConnections(source=pre_neurons, synapse_model=self.synapse_model_name)
+        weights = np.array(nest.GetStatus(conns, "w"))
+        assert len(weights) == self.n_connections
+        assert not np.all(weights == 1.), "Weights did not change during the simulation"
+        np.testing.assert_allclose(weights, weights[0])
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# stdp_triplet_synapse_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+import pytest
+import time
+
+from pynestml.codegeneration.nest_tools import NESTTools
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+nest = pytest.importorskip("nest")
+
+
+class TestNESTSTDPTripletSynapseBenchmark:
+    r"""
+    Benchmark the update of a large number of triplet STDP synapses, with and without the ``synapse_propagator_table_size`` code generator option.
+
+    Presynaptic spike times are random multiples of the simulation resolution, so that the propagators of the presynaptic traces have to be evaluated for many different intervals. Both variants of the synapse should end up with the same weights, up to the error bound of the propagator table.
+    """
+
+    neuron_model_name = "iaf_psc_delta_nestml__with_stdp_triplet_nestml"
+    synapse_model_name = "stdp_triplet_nestml__with_iaf_psc_delta_nestml"
+    n_connections = 10000
+    propagator_table_size = 10000
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        """Generate the model code, once without and once with a propagator table"""
+        files = [os.path.join("models", "neurons", "iaf_psc_delta.nestml"),
+                 os.path.join("models", "synapses", "stdp_triplet_naive.nestml")]
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(
+            os.pardir, os.pardir, s))) for s in files]
+
+        for propagator_table_size in [0, self.propagator_table_size]:
+            codegen_opts = {"neuron_synapse_pairs": [{"neuron": "iaf_psc_delta",
+                                                      "synapse": "stdp_triplet",
+                                                      "post_ports": ["post_spikes"]}],
+                            "synapse_propagator_table_size": propagator_table_size}
+            if not NESTTools.detect_nest_version().startswith("v2"):
+                codegen_opts["neuron_parent_class"] = "StructuralPlasticityNode"
+                codegen_opts["neuron_parent_class_include"] = "structural_plasticity_node.h"
+
+            generate_nest_target(input_path=input_path,
+                                 target_path="/tmp/nestml-stdp-triplet-benchmark-" + str(propagator_table_size),
+                                 logging_level="INFO",
+                                 module_name="nestml_stdp_triplet_benchmark_" + str(propagator_table_size) + "_module",
+                                 suffix="_nestml",
+                                 codegen_opts=codegen_opts)
+
+    def run_simulation(self, module_name: str):
+        resolution = .1    # [ms]
+        sim_time = 1000.    # [ms]
+
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(module_name)
+        nest.SetKernelStatus({"resolution": resolution})
+
+        np.random.seed(123)
+        pre_neurons = nest.Create("parrot_neuron", self.n_connections)
+        for pre_neuron in pre_neurons:
+            pre_spike_times = np.unique(np.round(np.sort(np.random.uniform(1., sim_time, 20)), decimals=1))
+            pre_sg = nest.Create("spike_generator", params={"spike_times": pre_spike_times})
+            nest.Connect(pre_sg, pre_neuron, syn_spec={"delay": 1.})
+
+        post_spike_times = np.unique(np.round(np.sort(np.random.uniform(1., sim_time, 100)), decimals=1))
+        post_sg = nest.Create("spike_generator", params={"spike_times": post_spike_times})
+        post_neuron = nest.Create(self.neuron_model_name)
+        nest.Connect(post_sg, post_neuron, "one_to_one", syn_spec={"delay": 1., "weight": 9999.})
+        if NESTTools.detect_nest_version().startswith("v2"):
+            nest.Connect(pre_neurons, post_neuron, "all_to_all", syn_spec={"model": self.synapse_model_name})
+        else:
+            nest.Connect(pre_neurons, post_neuron, "all_to_all", syn_spec={"synapse_model": self.synapse_model_name, "w": 1.})
+
+        start_time = time.perf_counter()
+        nest.Simulate(sim_time)
+        wall_time = time.perf_counter() - start_time
+
+        conns = nest.GetConnections(source=pre_neurons, synapse_model=self.synapse_model_name)
+        weights = np.array(nest.GetStatus(conns, "w"))
+        assert len(weights) == self.n_connections
+        assert not np.all(weights == 1.), "Weights did not change during the simulation"
+
+        return weights, wall_time
+
+    def test_nest_stdp_triplet_synapse_benchmark(self, benchmark_results):
+        weights, wall_time = self.run_simulation("nestml_stdp_triplet_benchmark_0_module")
+        weights_table, wall_time_table = self.run_simulation("nestml_stdp_triplet_benchmark_" + str(self.propagator_table_size) + "_module")
+
+        benchmark_results.record("stdp_triplet_synapse/" + str(self.n_connections) + "_connections", wall_time, unit="s")
+        benchmark_results.record("stdp_triplet_synapse/" + str(self.n_connections) + "_connections/propagator_table", wall_time_table, unit="s")
+
+        np.testing.assert_allclose(weights_table, weights, rtol=1E-6)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# toolchain_benchmark_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import time
+
+import pytest
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import code_generator_from_target_name, init_predefined, transformers_from_target_name
+from pynestml.utils.logger import Logger
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.profiler import Profiler
+
+
+models_dir = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models"))
+model_fns = sorted(glob.glob(os.path.join(models_dir, "neurons", "*.nestml"))) + sorted(glob.glob(os.path.join(models_dir, "synapses", "*.nestml")))
+
+# synapses with postsynaptic ports can only be generated together with a postsynaptic neuron (see ``nest_integration_test.py``)
+neuron_synapse_pairs = {"neuromodulated_stdp.nestml": {"neuron": "iaf_psc_exp", "synapse": "neuromodulated_stdp", "post_ports": ["post_spikes"], "vt_ports": ["mod_spikes"]},
+                        "stdp_synapse.nestml": {"neuron": "iaf_psc_exp", "synapse": "stdp", "post_ports": ["post_spikes"]},
+                        "stdp_triplet_naive.nestml": {"neuron": "iaf_psc_delta", "synapse": "stdp_triplet", "post_ports": ["post_spikes"]},
+                        "triplet_stdp_synapse.nestml": {"neuron": "iaf_psc_delta", "synapse": "stdp_triplet_nn", "post_ports": ["post_spikes"]},
+                        "stdp_nn_symm.nestml": {"neuron": "iaf_psc_exp", "synapse": "stdp_nn_symm", "post_ports": ["post_spikes"]},
+                        "stdp_nn_restr_symm.nestml": {"neuron": "iaf_psc_exp", "synapse": "stdp_nn_restr_symm", "post_ports": ["post_spikes"]},
+                        "third_factor_stdp_synapse.nestml": {"neuron": "iaf_psc_exp_dend", "synapse": "third_factor_stdp", "post_ports": ["post_spikes", ["I_post_dend", "I_dend"]]},
+                        "stdp_nn_pre_centered.nestml": {"neuron": "iaf_psc_exp", "synapse": "stdp_nn_pre_centered", "post_ports": ["post_spikes"]}}
+
+
+class TestToolchainBenchmark:
+    r"""
+    Benchmark of the time spent in the phases of the toolchain, for each model in the model library: parsing, checking the context conditions (including the checks after the model has been transformed), the ODE-toolbox analysis and rendering the templates. The NEST code generator is used, but the generated code is not built, so that NEST does not need to be installed.
+
+    The times are measured with the profiler of the toolchain (see :class:`pynestml.utils.profiler.Profiler`), and summed over all the models in a file. Synapses that have postsynaptic ports are generated together with their postsynaptic neuron, so that their times include those of the neuron.
+    """
+
+    @pytest.mark.parametrize("model_fn", model_fns, ids=[os.path.basename(fn) for fn in model_fns])
+    def test_toolchain_benchmark(self, model_fn, benchmark_results, tmp_path):
+        input_fns = [model_fn]
+        codegen_opts = {"nest_version": "v3.5"}
+        if os.path.basename(model_fn) in neuron_synapse_pairs.keys():
+            neuron_synapse_pair = neuron_synapse_pairs[os.path.basename(model_fn)]
+            input_fns.append(os.path.join(models_dir, "neurons", neuron_synapse_pair["neuron"] + ".nestml"))
+            codegen_opts["neuron_synapse_pairs"] = [neuron_synapse_pair]
+
+        FrontendConfiguration.parse_config(["--input_path"] + input_fns
+                                           + ["--target_path", str(tmp_path),
+                                              "--logging_level", "ERROR"])
+        init_predefined()
+
+        Profiler.init_profiler(True)
+        start_time = time.perf_counter()
+        try:
+            models = []
+            for input_fn in input_fns:
+                compilation_unit = ModelParser.parse_model(input_fn)
+                models.extend(compilation_unit.get_neuron_list() + compilation_unit.get_synapse_list())
+            assert not any([Logger.has_errors(model) for model in models])
+
+            transformers, options = transformers_from_target_name("NEST", options=codegen_opts)
+            code_generator = code_generator_from_target_name("NEST", options)
+
+            for transformer in transformers:
+                models = transformer.transform(models)
+            code_generator.generate_code(models)
+        finally:
+            wall_time = time.perf_counter() - start_time
+            summary = Profiler.get_summary().get("phase", {})
+            Profiler.init_profiler(False)
+
+        model_name = os.path.splitext(os.path.basename(model_fn))[0]
+        for phase_name in ["parse", "cocos", "ode_toolbox", "render"]:
+            benchmark_results.record("toolchain/" + model_name + "/" + phase_name,
+                                     summary[phase_name]["wall_time"] if phase_name in summary else 0.,
+                                     unit="s")
+        benchmark_results.record("toolchain/" + model_name + "/total", wall_time, unit="s")
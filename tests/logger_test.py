@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# logger_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import unittest
+
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import LoggingLevel, Logger
+from pynestml.utils.model_parser import ModelParser
+
+
+class LoggerTest(unittest.TestCase):
+    """
+    Test the indexed queries of the logger, and the maximum number of messages kept in the log.
+    """
+
+    def setUp(self):
+        PredefinedUnits.register_units()
+        PredefinedTypes.register_types()
+        PredefinedVariables.register_variables()
+        PredefinedFunctions.register_functions()
+        SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+        Logger.init_logger(LoggingLevel.NO)
+
+        self.neurons = []
+        for model_name in ["iaf_psc_exp", "iaf_psc_delta"]:
+            model = ModelParser.parse_model(os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", model_name + ".nestml")))
+            self.neurons.append(model.get_neuron_list()[0])
+
+    def _log_messages(self, max_messages=None):
+        Logger.init_logger(LoggingLevel.NO, max_messages=max_messages)
+        Logger.log_message(node=self.neurons[0], message="error 0", log_level=LoggingLevel.ERROR)
+        Logger.log_message(node=self.neurons[1], message="info 1", log_level=LoggingLevel.INFO)
+        Logger.log_message(node=self.neurons[0], message="warning 2", log_level=LoggingLevel.WARNING)
+        Logger.log_message(node=self.neurons[1], message="warning 3", log_level=LoggingLevel.WARNING)
+        Logger.log_message(node=self.neurons[0], message="info 4", log_level=LoggingLevel.INFO)
+
+    def test_queries(self):
+        self._log_messages()
+
+        assert Logger.has_errors(self.neurons[0])
+        assert not Logger.has_errors(self.neurons[1])
+        assert len(Logger.get_log()) == 5
+
+        assert [msg for _, _, msg in Logger.get_all_messages_of_level(LoggingLevel.WARNING)] == ["warning 2", "warning 3"]
+        assert [msg for _, _, msg in Logger.get_all_messages_of_node(self.neurons[0])] == ["error 0", "warning 2", "info 4"]
+        assert [msg for _, _, msg in Logger.get_all_messages_of_level_and_or_node(self.neurons[1], None)] == ["info 1", "warning 3"]
+        assert [msg for _, _, msg in Logger.get_all_messages_of_level_and_or_node(self.neurons[0], LoggingLevel.INFO)] == ["info 4"]
+        assert [msg for _, _, msg in Logger.get_all_messages_of_level_and_or_node(None, LoggingLevel.ERROR)] == ["error 0"]
+
+    def test_max_messages(self):
+        self._log_messages(max_messages=3)
+
+        assert list(Logger.get_log().keys()) == [2, 3, 4]
+        assert [msg for _, _, msg in Logger.get_all_messages_of_node(self.neurons[0])] == ["warning 2", "info 4"]
+        assert Logger.get_all_messages_of_level(LoggingLevel.ERROR) == []
+
+        # errors are still counted after they have been discarded from the log
+        assert Logger.has_errors(self.neurons[0])
+        assert not Logger.has_errors(self.neurons[1])
+
+    def test_lazy_messages(self):
+        calls = []
+
+        def format_message():
+            calls.append(None)
+            return "deferred"
+
+        Logger.init_logger(LoggingLevel.WARNING)
+        assert Logger.is_enabled(LoggingLevel.ERROR)
+        assert not Logger.is_enabled(LoggingLevel.INFO)
+
+        # the message is neither printed nor queried, so it is not formatted
+        Logger.log_message(node=self.neurons[0], message=format_message, log_level=LoggingLevel.INFO)
+        assert len(calls) == 0
+
+        # the message is formatted once, when it is first queried
+        assert [msg for _, _, msg in Logger.get_all_messages_of_node(self.neurons[0])] == ["deferred"]
+        assert [msg for _, _, msg in Logger.get_all_messages_of_level(LoggingLevel.INFO)] == ["deferred"]
+        assert len(calls) == 1
+
+    def test_json_format(self):
+        self._log_messages()
+        log = json.loads(Logger.get_json_format())
+        assert [entry["message"] for entry in log] == ["error 0", "info 1", "warning 2", "warning 3", "info 4"]
+        assert [entry["severity"] for entry in log] == ["ERROR", "INFO", "WARNING", "WARNING", "INFO"]
+
+        Logger.init_logger(LoggingLevel.NO)
+        assert json.loads(Logger.get_json_format()) == []
+
+    def tearDown(self):
+        Logger.init_logger(LoggingLevel.INFO)
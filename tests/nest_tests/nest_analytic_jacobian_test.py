@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# nest_analytic_jacobian_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+import time
+import unittest
+
+import nest
+
+from pynestml.codegeneration.nest_tools import NESTTools
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+
+class NestAnalyticJacobianTest(unittest.TestCase):
+    r"""
+    Test the implicit ``bsimp`` solver, which uses the Jacobian of the system of ODEs derived symbolically during code generation, on stiff neuron models.
+
+    Each model is driven by a constant current and simulated with the default ``rkf45`` solver and with ``bsimp``; the spike trains should agree. The wall-clock times of both simulations are reported.
+    """
+
+    neuron_model_names = ["terub_stn_nestml", "terub_gpe_nestml"]
+    numeric_solvers = ["rkf45", "bsimp"]
+    resolution = .1    # [ms]
+    sim_time = 1000.    # [ms]
+
+    def setUp(self):
+        """Generate the model code once for each solver"""
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", s))
+                      for s in ["terub_stn.nestml", "terub_gpe.nestml"]]
+
+        for numeric_solver in self.numeric_solvers:
+            generate_nest_target(input_path=input_path,
+                                 target_path="/tmp/nestml-analytic-jacobian-" + numeric_solver,
+                                 logging_level="INFO",
+                                 module_name=self._get_module_name(numeric_solver),
+                                 suffix="_nestml",
+                                 codegen_opts={"numeric_solver": numeric_solver})
+
+    def _get_module_name(self, numeric_solver: str) -> str:
+        return "nestml_analytic_jacobian_" + numeric_solver + "_module"
+
+    def run_simulation(self, numeric_solver: str, neuron_model_name: str):
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(self._get_module_name(numeric_solver))
+        nest.SetKernelStatus({"resolution": self.resolution})
+
+        neuron = nest.Create(neuron_model_name, params={"I_e": 10.})
+        if NESTTools.detect_nest_version().startswith("v2"):
+            sr = nest.Create("spike_detector")
+        else:
+            sr = nest.Create("spike_recorder")
+        nest.Connect(neuron, sr)
+
+        start_time = time.perf_counter()
+        nest.Simulate(self.sim_time)
+        wall_time = time.perf_counter() - start_time
+
+        return nest.GetStatus(sr)[0]["events"]["times"], wall_time
+
+    def test_nest_analytic_jacobian(self):
+        for neuron_model_name in self.neuron_model_names:
+            spike_times, wall_time = self.run_simulation("rkf45", neuron_model_name)
+            spike_times_bsimp, wall_time_bsimp = self.run_simulation("bsimp", neuron_model_name)
+
+            print(neuron_model_name + ": " + str(wall_time) + " s with rkf45 and " + str(wall_time_bsimp) + " s with bsimp")
+
+            assert len(spike_times) > 0
+            assert len(spike_times_bsimp) == len(spike_times)
+            np.testing.assert_allclose(spike_times_bsimp, spike_times, atol=2 * self.resolution)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# nest_gsl_workspace_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+import unittest
+
+import nest
+
+from pynestml.codegeneration.nest_tools import NESTTools
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+
+class NestGSLWorkspaceTest(unittest.TestCase):
+    r"""
+    Test the GSL workspace (stepping, control and evolution functions) that is shared by all neurons of a numerically integrated model that are updated by the same thread.
+
+    A population of ``hh_psc_alpha`` neurons, each driven by a different constant current and with alternating error tolerances, is simulated with one and with two threads; the spike trains should be the same.
+    """
+
+    module_name = "nestml_gsl_workspace_module"
+    resolution = .1    # [ms]
+    sim_time = 100.    # [ms]
+
+    def setUp(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "hh_psc_alpha.nestml"))
+        generate_nest_target(input_path=input_path,
+                             target_path="/tmp/nestml-gsl-workspace",
+                             logging_level="INFO",
+                             module_name=self.module_name,
+                             suffix="_nestml")
+
+    def run_simulation(self, local_num_threads: int, n_neurons: int = 100):
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(self.module_name)
+        nest.SetKernelStatus({"resolution": self.resolution, "local_num_threads": local_num_threads})
+
+        neurons = nest.Create("hh_psc_alpha_nestml", n_neurons)
+        nest.SetStatus(neurons, [{"I_e": I_e, "gsl_error_tol": 1E-3 if i % 2 else 1E-6}
+                                 for i, I_e in enumerate(np.linspace(0., 1000., n_neurons))])
+        if NESTTools.detect_nest_version().startswith("v2"):
+            sr = nest.Create("spike_detector")
+        else:
+            sr = nest.Create("spike_recorder")
+        nest.Connect(neurons, sr)
+
+        nest.Simulate(self.sim_time)
+
+        events = nest.GetStatus(sr)[0]["events"]
+        idx = np.lexsort((events["times"], events["senders"]))
+
+        return events["senders"][idx], events["times"][idx]
+
+    def test_nest_gsl_workspace(self):
+        senders_ref, times_ref = self.run_simulation(local_num_threads=1)
+        senders, times = self.run_simulation(local_num_threads=2)
+
+        assert len(times_ref) > 0
+        np.testing.assert_array_equal(senders, senders_ref)
+        np.testing.assert_allclose(times, times_ref)
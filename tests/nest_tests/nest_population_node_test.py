@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# nest_population_node_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+import pytest
+import time
+import unittest
+
+import nest
+
+from pynestml.codegeneration.nest_tools import NESTTools
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+
+@pytest.mark.skipif(NESTTools.detect_nest_version().startswith("v2"),
+                    reason="Population nodes are not supported for NEST 2")
+class NestPopulationNodeTest(unittest.TestCase):
+    r"""
+    Test the ``population_node`` code generator option, which stores the variables of all neurons of a model that are simulated by the same thread as one array per variable, and updates them in a single loop.
+
+    A population of ``iaf_psc_exp`` neurons, each with a different constant current and receiving the same spike train, is simulated with and without the option, using two threads; the membrane potential traces and the spike times should be identical. The wall-clock times of both simulations are reported.
+    """
+
+    resolution = .1    # [ms]
+    sim_time = 1000.    # [ms]
+
+    def setUp(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "iaf_psc_exp.nestml"))
+        generate_nest_target(input_path=input_path,
+                             target_path="/tmp/nestml-population-node-ref",
+                             logging_level="INFO",
+                             module_name="nestml_population_node_ref_module",
+                             suffix="_nestml")
+        generate_nest_target(input_path=input_path,
+                             target_path="/tmp/nestml-population-node",
+                             logging_level="INFO",
+                             module_name="nestml_population_node_module",
+                             suffix="_population_nestml",
+                             codegen_opts={"population_node": True})
+
+    def run_simulation(self, module_name: str, neuron_model_name: str, n_neurons: int = 1000):
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(module_name)
+        nest.SetKernelStatus({"resolution": self.resolution, "local_num_threads": 2})
+
+        neurons = nest.Create(neuron_model_name, n_neurons)
+        nest.SetStatus(neurons, [{"I_e": I_e} for I_e in np.linspace(0., 500., n_neurons)])
+        neurons[0].V_m = -60.
+        sg = nest.Create("spike_generator", params={"spike_times": np.arange(10., self.sim_time, 10.)})
+        nest.Connect(sg, neurons, syn_spec={"weight": 100.})
+        vm = nest.Create("voltmeter", params={"interval": 1.})
+        nest.Connect(vm, neurons)
+        sr = nest.Create("spike_recorder")
+        nest.Connect(neurons, sr)
+
+        start_time = time.perf_counter()
+        nest.Simulate(self.sim_time)
+        wall_time = time.perf_counter() - start_time
+
+        vm_events = nest.GetStatus(vm)[0]["events"]
+        vm_idx = np.lexsort((vm_events["times"], vm_events["senders"]))
+        sr_events = nest.GetStatus(sr)[0]["events"]
+        sr_idx = np.lexsort((sr_events["times"], sr_events["senders"]))
+
+        return vm_events["V_m"][vm_idx], sr_events["senders"][sr_idx], sr_events["times"][sr_idx], wall_time
+
+    def test_nest_population_node(self):
+        V_m_ref, senders_ref, times_ref, wall_time_ref = self.run_simulation("nestml_population_node_ref_module", "iaf_psc_exp_nestml")
+        V_m, senders, times, wall_time = self.run_simulation("nestml_population_node_module", "iaf_psc_exp_population_nestml")
+
+        print("iaf_psc_exp: " + str(wall_time_ref) + " s without and " + str(wall_time) + " s with population node")
+
+        assert len(times_ref) > 0
+        np.testing.assert_allclose(V_m, V_m_ref)
+        np.testing.assert_array_equal(senders, senders_ref)
+        np.testing.assert_allclose(times, times_ref)
+
+
+@pytest.mark.parametrize("codegen_opts", [{"simd_update": True}, {"numeric_solver": "rk4"}])
+def test_nest_population_node_unsupported_options(codegen_opts):
+    r"""
+    Population nodes cannot be combined with the ``simd_update`` and ``numeric_solver`` code generator options; an error should be issued during code generation.
+    """
+    input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "iaf_psc_exp.nestml"))
+    with pytest.raises(Exception):
+        generate_nest_target(input_path=input_path,
+                             target_path="/tmp/nestml-population-node-unsupported",
+                             logging_level="INFO",
+                             module_name="nestml_population_node_unsupported_module",
+                             suffix="_population_nestml",
+                             codegen_opts={"population_node": True, **codegen_opts})
+
+
+@pytest.mark.skipif(NESTTools.detect_nest_version().startswith("v2"),
+                    reason="Population nodes are not supported for NEST 2")
+def test_nest_population_node_without_odes():
+    r"""
+    Generate a neuron without an equations block as a population node. Its membrane potential jumps by the weight of each incoming spike, so after the simulation it should equal the number of spikes times the weight.
+    """
+    input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), "resources", "no_odes_neuron.nestml"))
+    generate_nest_target(input_path=input_path,
+                         target_path="/tmp/nestml-population-node-no-odes",
+                         logging_level="INFO",
+                         module_name="nestml_population_node_no_odes_module",
+                         suffix="_population_nestml",
+                         codegen_opts={"population_node": True})
+
+    nest.set_verbosity("M_ERROR")
+    nest.ResetKernel()
+    nest.Install("nestml_population_node_no_odes_module")
+
+    spike_times = [10., 20., 30.]
+    neurons = nest.Create("no_odes_neuron_population_nestml", 10)
+    sg = nest.Create("spike_generator", params={"spike_times": spike_times})
+    nest.Connect(sg, neurons, syn_spec={"weight": 2.})
+    nest.Simulate(50.)
+
+    np.testing.assert_allclose(nest.GetStatus(neurons, "V_m"), 2. * len(spike_times))
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# nest_simd_update_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+
+import nest
+
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+
+def test_nest_simd_update_without_odes():
+    r"""
+    Generate a neuron without an equations block with the ``simd_update`` code generator option. Its membrane potential jumps by the weight of each incoming spike, so after the simulation it should equal the number of spikes times the weight.
+    """
+    input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), "resources", "no_odes_neuron.nestml"))
+    generate_nest_target(input_path=input_path,
+                         target_path="/tmp/nestml-simd-update-no-odes",
+                         logging_level="INFO",
+                         module_name="nestml_simd_update_no_odes_module",
+                         suffix="_nestml",
+                         codegen_opts={"simd_update": True})
+
+    nest.set_verbosity("M_ERROR")
+    nest.ResetKernel()
+    nest.Install("nestml_simd_update_no_odes_module")
+
+    spike_times = [10., 20., 30.]
+    neurons = nest.Create("no_odes_neuron_nestml", 10)
+    sg = nest.Create("spike_generator", params={"spike_times": spike_times})
+    nest.Connect(sg, neurons, syn_spec={"weight": 2.})
+    nest.Simulate(50.)
+
+    np.testing.assert_allclose(nest.GetStatus(neurons, "V_m"), 2. * len(spike_times))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# nest_state_dependent_propagators_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import os
+import unittest
+
+import nest
+
+from pynestml.frontend.pynestml_frontend import generate_nest_target
+
+
+class NestStateDependentPropagatorsTest(unittest.TestCase):
+    r"""
+    Test a neuron whose propagators depend on a state variable, and which therefore recomputes (part of) its internals in each simulation step.
+
+    The model ``iaf_psc_exp_state_dependent_propagators`` is ``iaf_psc_exp`` with the membrane time constant declared as a state variable, so both models should produce the same membrane potential trace.
+    """
+
+    module_name = "nestml_state_dependent_propagators_module"
+    resolution = .1    # [ms]
+    sim_time = 1000.    # [ms]
+
+    def setUp(self):
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "iaf_psc_exp.nestml")),
+                      os.path.realpath(os.path.join(os.path.dirname(__file__), "resources", "iaf_psc_exp_state_dependent_propagators.nestml"))]
+        generate_nest_target(input_path=input_path,
+                             target_path="/tmp/nestml-state-dependent-propagators",
+                             logging_level="INFO",
+                             module_name=self.module_name,
+                             suffix="_nestml")
+
+    def run_simulation(self, neuron_model_name: str, n_neurons: int = 100):
+        nest.set_verbosity("M_ERROR")
+        nest.ResetKernel()
+        nest.Install(self.module_name)
+        nest.SetKernelStatus({"resolution": self.resolution})
+
+        neurons = nest.Create(neuron_model_name, n_neurons, params={"I_e": 200.})
+        sg = nest.Create("spike_generator", params={"spike_times": np.arange(10., self.sim_time, 10.)})
+        nest.Connect(sg, neurons, syn_spec={"weight": 1000.})
+        vm = nest.Create("voltmeter")
+        nest.Connect(vm, neurons[0])
+
+        nest.Simulate(self.sim_time)
+
+        return nest.GetStatus(vm)[0]["events"]["V_m"]
+
+    def test_nest_state_dependent_propagators(self):
+        V_m_ref = self.run_simulation("iaf_psc_exp_nestml")
+        V_m = self.run_simulation("iaf_psc_exp_state_dependent_propagators_nestml")
+
+        np.testing.assert_allclose(V_m, V_m_ref)
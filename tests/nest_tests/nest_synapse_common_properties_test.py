@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# nest_synapse_common_properties_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import re
+import unittest
+
+from pynestml.codegeneration.nest_code_generator import NESTCodeGenerator
+from pynestml.exceptions.code_generator_options_exception import CodeGeneratorOptionsException
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+
+class NESTSynapseCommonPropertiesTest(unittest.TestCase):
+    """
+    Tests that homogeneous parameters, and the internals that are derived only from them, are stored once in the common properties of a synapse rather than in each connection, and that the state of a synapse can be stored in single precision.
+
+    Only the generated code is checked, so NEST Simulator does not need to be installed to run this test.
+    """
+
+    def setUp(self):
+        PredefinedUnits.register_units()
+        PredefinedTypes.register_types()
+        PredefinedFunctions.register_functions()
+        PredefinedVariables.register_variables()
+        SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+        Logger.init_logger(LoggingLevel.INFO)
+
+        self.input_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), "resources", "homogeneous_parameters_synapse.nestml")))
+        self.target_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(
+            os.pardir, os.pardir, "target"))))
+
+        FrontendConfiguration.parse_config(["--input_path", self.input_path,
+                                            "--logging_level", "INFO",
+                                            "--target_path", self.target_path])
+
+    def _generate_synapse_header(self, codegen_opts) -> str:
+        compilation_unit = ModelParser.parse_model(self.input_path)
+        code_generator = NESTCodeGenerator(codegen_opts)
+        code_generator.generate_code(compilation_unit.get_synapse_list())
+
+        with open(os.path.join(self.target_path, "homogeneous_parameters.h")) as f:
+            return f.read()
+
+    def _get_struct(self, code: str, struct_name: str) -> str:
+        return re.search(r"struct " + struct_name + r"\s*\{(.*?)\n  \};", code, re.DOTALL).group(1)
+
+    def test_common_properties(self):
+        code = self._generate_synapse_header({"nest_version": "v3.5"})
+
+        common_properties = code[code.index("class homogeneous_parametersCommonSynapseProperties"):code.index("class homogeneous_parameters :")]
+        for decl in ["double Wmin;", "double Wmax;", "double W_range;", "double W_range_inv;"]:
+            assert decl in common_properties
+        assert "W_range_inv = 1 / W_range;" in common_properties
+        assert "eta_half" not in common_properties
+
+        # the connection only stores the heterogeneous parameters and the internals that depend on them
+        internals = self._get_struct(code, "Variables_")
+        assert "double eta_half;" in internals
+        assert "W_range" not in internals
+        parameters = self._get_struct(code, "Parameters_")
+        assert "double eta;" in parameters
+        assert "double Wmax;" not in parameters
+
+        assert "S_.w += V_.eta_half * cp.W_range * (1 - (S_.w - cp.Wmin) * cp.W_range_inv);" in code
+        assert "double w;" in self._get_struct(code, "State_")
+
+    def test_single_precision_state(self):
+        code = self._generate_synapse_header({"nest_version": "v3.5", "synapse_state_type": "float"})
+        assert re.search(r"^\s*float w;", self._get_struct(code, "State_"), re.MULTILINE)
+
+    def test_unknown_state_type(self):
+        with self.assertRaises(CodeGeneratorOptionsException):
+            NESTCodeGenerator({"nest_version": "v3.5", "synapse_state_type": "half"})
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# printer_cache_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import time
+import unittest
+
+from pynestml.codegeneration.nest_code_generator import NESTCodeGenerator
+from pynestml.codegeneration.printers.ast_printer import ASTPrinter
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+# minor setup steps required
+SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+PredefinedUnits.register_units()
+PredefinedTypes.register_types()
+PredefinedVariables.register_variables()
+PredefinedFunctions.register_functions()
+
+
+class PrinterCacheTest(unittest.TestCase):
+    """
+    Check that the print cache, which is enabled while the templates are rendered, returns the same code as printing without the cache, and that cached code is invalidated when the AST is modified. The time taken to print the right-hand sides of the ODEs of a model repeatedly is printed with and without the cache.
+    """
+
+    def setUp(self):
+        Logger.init_logger(LoggingLevel.ERROR)
+        model = ModelParser.parse_model(os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp.nestml")))
+        self.neuron = model.get_neuron_list()[0]
+        self.printer = NESTCodeGenerator(options={"nest_version": "v3.5"})._printer
+        self.odes = [ode for equations_block in self.neuron.get_equations_blocks() for ode in equations_block.get_ode_equations()]
+
+    def tearDown(self):
+        ASTPrinter.disable_print_cache()
+
+    def _time_printing(self, n_repetitions: int = 100) -> float:
+        start_time = time.perf_counter()
+        for _ in range(n_repetitions):
+            for ode in self.odes:
+                self.printer.print(ode.get_rhs())
+        return time.perf_counter() - start_time
+
+    def test_printer_cache(self):
+        expr = [ode.get_rhs() for ode in self.odes if ode.get_lhs().get_name() == "V_m"][0]
+        s = self.printer.print(expr)
+
+        ASTPrinter.enable_print_cache()
+        s_cached = self.printer.print(expr)
+        assert s_cached == s
+        assert self.printer.print(expr) is s_cached
+
+        # modifying a node invalidates the cached code for the expressions that contain it
+        expr.lhs, expr.rhs = expr.rhs, expr.lhs
+        s_modified = self.printer.print(expr)
+        ASTPrinter.disable_print_cache()
+        assert s_modified != s
+        assert s_modified == self.printer.print(expr)
+
+    def test_printer_cache_timing(self):
+        wall_time = self._time_printing()
+        ASTPrinter.enable_print_cache()
+        wall_time_cached = self._time_printing()
+        ASTPrinter.disable_print_cache()
+        print("Printing the ODEs: " + str(wall_time) + " s without and " + str(wall_time_cached) + " s with the print cache")
@@ -36,10 +36,10 @@ class TestPythonStandaloneNeuronBuildAndSimAnalytic(unittest.TestCase):
     def test_python_standalone_neuron_build_and_sim_analytic(self):
         input_path = os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(
             os.pardir, os.pardir, "models", "neurons", "iaf_psc_exp.nestml"))))
-        target_path = "nestmlmodule"
+        target_path = "nestmlmodule_analytic"
         logging_level = "INFO"
         suffix = ""
-        module_name = "nestmlmodule"
+        module_name = "nestmlmodule_analytic"
         codegen_opts = {}
 
         generate_python_standalone_target(input_path, target_path,
@@ -48,6 +48,6 @@ class TestPythonStandaloneNeuronBuildAndSimAnalytic(unittest.TestCase):
                                           suffix=suffix,
                                           codegen_opts=codegen_opts)
 
-        from nestmlmodule.test_python_standalone_module import TestSimulator
+        from nestmlmodule_analytic.test_python_standalone_module import TestSimulator
         neuron_log = TestSimulator().test_simulator()
-        np.testing.assert_allclose(neuron_log["V_abs"][-1], 11.192718053106296)
+        np.testing.assert_allclose(neuron_log["V_m"][-1], -64.41857140420623)
@@ -34,10 +34,10 @@ class TestPythonStandaloneNeuronBuildAndSimNumeric(unittest.TestCase):
     def test_python_standalone_neuron_build_and_sim_numeric(self):
         input_path = os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(
             os.pardir, os.pardir, "models", "neurons", "aeif_cond_exp.nestml"))))
-        target_path = "nestmlmodule"
+        target_path = "nestmlmodule_numeric"
         logging_level = "INFO"
         suffix = ""
-        module_name = "nestmlmodule"
+        module_name = "nestmlmodule_numeric"
         codegen_opts = {}
 
         generate_python_standalone_target(input_path, target_path,
@@ -46,6 +46,6 @@ class TestPythonStandaloneNeuronBuildAndSimNumeric(unittest.TestCase):
                                           suffix=suffix,
                                           codegen_opts=codegen_opts)
 
-        from nestmlmodule.test_python_standalone_module import TestSimulator
+        from nestmlmodule_numeric.test_python_standalone_module import TestSimulator
         neuron_log = TestSimulator().test_simulator()
-        np.testing.assert_allclose(neuron_log["V_m"][-1], -66.53925432719718)
+        np.testing.assert_allclose(neuron_log["V_m"][-1], -75.96351293729619)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# test_python_standalone_cse.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib
+import os
+import time
+
+import numpy as np
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_python_standalone_target
+
+
+class TestPythonStandaloneCSE:
+    r"""
+    Generate the same models with and without the ``common_subexpression_elimination`` code generator option, and check that the right-hand side of the ODEs and the recorded traces are the same. The time taken per evaluation of the right-hand side is printed for reference.
+    """
+
+    neuron_models = ["aeif_cond_exp", "aeif_cond_alpha"]
+
+    def _generate(self, module_name, codegen_opts):
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", neuron_model + ".nestml"))
+                      for neuron_model in self.neuron_models]
+        generate_python_standalone_target(input_path, module_name,
+                                          module_name=module_name,
+                                          logging_level="INFO",
+                                          codegen_opts=codegen_opts)
+
+    def _simulate(self, module_name, neuron_model, t_stop=100.):
+        simulator_module = importlib.import_module(module_name + ".simulator")
+        spike_generator_module = importlib.import_module(module_name + ".spike_generator")
+        neuron_module = importlib.import_module(module_name + "." + neuron_model)
+
+        simulator = simulator_module.Simulator()
+        sg_exc = simulator.add_neuron(spike_generator_module.SpikeGenerator(interval=10.))
+        neuron = simulator.add_neuron(getattr(neuron_module, "Neuron_" + neuron_model)(timestep=simulator.timestep))
+        simulator.connect(sg_exc, neuron, "exc_spikes", w=1000.)
+        simulator.run(t_stop)
+
+        return simulator.neurons[neuron], simulator.log[neuron]
+
+    def _time_dynamics(self, neuron, n_evaluations=10000):
+        ode_state = np.array(neuron.S_.ode_state)
+        start_time = time.perf_counter()
+        for _ in range(n_evaluations):
+            f = neuron.dynamics(0., ode_state, neuron)
+        wall_time = time.perf_counter() - start_time
+
+        return f, 1E6 * wall_time / n_evaluations
+
+    @pytest.mark.parametrize("neuron_model", neuron_models)
+    def test_python_standalone_cse(self, neuron_model):
+        self._generate("nestmlmodule_nocse", {})
+        self._generate("nestmlmodule_cse", {"common_subexpression_elimination": True})
+
+        neuron_ref, neuron_log_ref = self._simulate("nestmlmodule_nocse", neuron_model)
+        neuron, neuron_log = self._simulate("nestmlmodule_cse", neuron_model)
+
+        f_ref, us_per_evaluation_ref = self._time_dynamics(neuron_ref)
+        f, us_per_evaluation = self._time_dynamics(neuron)
+        print("Right-hand side evaluation for " + neuron_model + ": " + str(us_per_evaluation_ref) + " us without and "
+              + str(us_per_evaluation) + " us with common subexpression elimination")
+
+        # the order of the variables in the ODE state vector can differ between the two modules
+        for var_name, idx in neuron.S_.ode_state_variable_name_to_index.items():
+            np.testing.assert_allclose(f[idx], f_ref[neuron_ref.S_.ode_state_variable_name_to_index[var_name]], atol=1E-12)
+
+        assert neuron_log.keys() == neuron_log_ref.keys()
+        for var_name in neuron_log_ref.keys():
+            np.testing.assert_allclose(neuron_log[var_name], neuron_log_ref[var_name])
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# test_python_standalone_delays.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib
+import os
+
+import numpy as np
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_python_standalone_target
+
+
+class TestPythonStandaloneDelays:
+    r"""
+    Check that spikes are delivered after the transmission delay of their connection, and that spikes can be passed through a synapse instance.
+    """
+
+    module_name = "nestmlmodule_delays"
+    neuron_model = "iaf_psc_exp"
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", self.neuron_model + ".nestml"))
+        generate_python_standalone_target(input_path, self.module_name,
+                                          module_name=self.module_name,
+                                          logging_level="INFO")
+
+    def _simulate(self, delay=None, w=1000., synapse=None, t_stop=50.):
+        simulator_module = importlib.import_module(self.module_name + ".simulator")
+        spike_generator_module = importlib.import_module(self.module_name + ".spike_generator")
+        neuron_module = importlib.import_module(self.module_name + "." + self.neuron_model)
+
+        simulator = simulator_module.Simulator()
+        sg = simulator.add_neuron(spike_generator_module.SpikeGenerator(interval=10.))
+        neuron = simulator.add_neuron(getattr(neuron_module, "Neuron_" + self.neuron_model)(timestep=simulator.timestep))
+        simulator.connect(sg, neuron, "exc_spikes", w=w, delay=delay, synapse=synapse)
+        simulator.run(t_stop)
+
+        return np.array(simulator.log[neuron]["V_m"])
+
+    def test_delay(self):
+        V_m_ref = self._simulate()
+        V_m_min_delay = self._simulate(delay=.1)
+        V_m_delayed = self._simulate(delay=2.)
+
+        np.testing.assert_allclose(V_m_min_delay, V_m_ref)
+
+        # the response is shifted by the difference between the delays, in simulation steps
+        shift = 19
+        assert not np.allclose(V_m_delayed, V_m_ref)
+        np.testing.assert_allclose(V_m_delayed[shift:], V_m_ref[:-shift])
+
+    def test_synapse(self):
+        synapse_module = importlib.import_module(self.module_name + ".synapse")
+
+        class DoublingSynapse(synapse_module.Synapse):
+            def get_model(self) -> str:
+                return "doubling_synapse"
+
+            def handle(self, t_spike: float, port_name: str) -> None:
+                self.deliver_spike(t_spike)
+
+            def get_weight(self) -> float:
+                return 2.
+
+        V_m_ref = self._simulate(delay=1., w=1000.)
+        V_m = self._simulate(delay=1., w=500., synapse=DoublingSynapse())
+
+        np.testing.assert_allclose(V_m, V_m_ref)
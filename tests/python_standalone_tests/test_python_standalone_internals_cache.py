@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# test_python_standalone_internals_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib
+import os
+
+import numpy as np
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_python_standalone_target
+
+
+class TestPythonStandaloneInternalsCache:
+    r"""
+    Check that internals that only depend on parameters are computed once per unique set of values of the parameters they depend on and timestep, and are updated when one of these parameters is changed.
+    """
+
+    module_name = "nestmlmodule_internals_cache"
+    neuron_model = "aeif_cond_exp"
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", self.neuron_model + ".nestml"))
+        generate_python_standalone_target(input_path, self.module_name,
+                                          module_name=self.module_name,
+                                          logging_level="INFO")
+
+    def test_internals_cache(self):
+        neuron_module = importlib.import_module(self.module_name + "." + self.neuron_model)
+        neuron_class = getattr(neuron_module, "Neuron_" + self.neuron_model)
+        neuron_class._internals_cache.clear()
+
+        neurons = [neuron_class(timestep=.1) for _ in range(100)]
+        assert len(neuron_class._internals_cache) == 1
+
+        neurons[0].set_tau_syn_exc(5.)
+        assert len(neuron_class._internals_cache) == 2
+
+        # parameters that no cached internal depends on are not part of the cache key
+        neurons[1].set_V_peak(10.)
+        assert len(neuron_class._internals_cache) == 2
+
+        np.testing.assert_allclose(neurons[0].V_._Neuron_aeif_cond_exp__P__g_exc__X__exc_spikes__g_exc__X__exc_spikes, np.exp(-.1 / 5.))
+        np.testing.assert_allclose(neurons[1].V_._Neuron_aeif_cond_exp__P__g_exc__X__exc_spikes__g_exc__X__exc_spikes, np.exp(-.1 / neurons[1].get_tau_syn_exc()))
+
+        # internals that are modified at runtime are not cached, and not reset when a parameter changes
+        neurons[0].V_.r = 3
+        neurons[0].set_t_ref(5.)
+        assert neurons[0].V_.r == 3
+        assert neurons[0].V_.RefractoryCounts == 50
+
+        # a neuron with a different timestep has its own cache entry
+        neuron_class(timestep=.05)
+        assert len(neuron_class._internals_cache) == 4
+
+    def test_internals_cache_max_size(self, monkeypatch):
+        neuron_module = importlib.import_module(self.module_name + "." + self.neuron_model)
+        neuron_class = getattr(neuron_module, "Neuron_" + self.neuron_model)
+        neuron_class._internals_cache.clear()
+        monkeypatch.setattr(neuron_class, "_internals_cache_max_size", 3)
+
+        neurons = [neuron_class(timestep=.1) for _ in range(5)]
+        for i, neuron in enumerate(neurons):
+            neuron.set_tau_syn_exc(1. + i)
+
+        # the least recently used entries are evicted
+        assert len(neuron_class._internals_cache) == 3
+        assert [key[2] for key in neuron_class._internals_cache.keys()] == [3., 4., 5.]    # the key is (timestep, t_ref, tau_syn_exc, tau_syn_inh)
+
+        # evicted entries are recomputed when they are needed again
+        neuron = neuron_class(timestep=.1)
+        neuron.set_tau_syn_exc(1.)
+        assert len(neuron_class._internals_cache) == 3
+        np.testing.assert_allclose(neuron.V_._Neuron_aeif_cond_exp__P__g_exc__X__exc_spikes__g_exc__X__exc_spikes, np.exp(-.1 / 1.))
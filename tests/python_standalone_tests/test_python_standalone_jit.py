@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# test_python_standalone_jit.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_python_standalone_target
+
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+neuron_models = ["iaf_psc_exp", "aeif_cond_exp"]
+
+
+@pytest.fixture(scope="module")
+def generated_modules(tmp_path_factory):
+    r"""
+    Generate the models once without and once with the ``jit`` option, into a temporary directory that is added to ``sys.path``.
+    """
+    target_dir = tmp_path_factory.mktemp("nestml_jit")
+    input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", neuron_model + ".nestml"))
+                  for neuron_model in neuron_models]
+    for module_name, codegen_opts in [("nestmlmodule_nojit", {}), ("nestmlmodule_jit", {"jit": "numba"})]:
+        generate_python_standalone_target(input_path, str(target_dir / module_name),
+                                          module_name=module_name,
+                                          logging_level="INFO",
+                                          codegen_opts=codegen_opts)
+
+    sys.path.insert(0, str(target_dir))
+    importlib.invalidate_caches()
+    yield
+    sys.path.remove(str(target_dir))
+
+
+class TestPythonStandaloneJIT:
+    r"""
+    Generate the same models with and without the ``jit`` code generator option, run an identical little network with both and check that the recorded traces are the same. The speed-up of the JIT-compiled code is measured in ``tests/benchmarks``.
+    """
+
+    def _simulate(self, module_name, neuron_model, t_stop=100.):
+        simulator_module = importlib.import_module(module_name + ".simulator")
+        spike_generator_module = importlib.import_module(module_name + ".spike_generator")
+        neuron_module = importlib.import_module(module_name + "." + neuron_model)
+
+        simulator = simulator_module.Simulator()
+        sg_exc = simulator.add_neuron(spike_generator_module.SpikeGenerator(interval=10.))
+        sg_inh = simulator.add_neuron(spike_generator_module.SpikeGenerator(interval=50.))
+        neuron = simulator.add_neuron(getattr(neuron_module, "Neuron_" + neuron_model)(timestep=simulator.timestep))
+        simulator.connect(sg_exc, neuron, "exc_spikes", w=1000.)
+        simulator.connect(sg_inh, neuron, "inh_spikes", w=4000.)
+
+        simulator.run(t_stop)
+
+        return simulator.log[neuron]
+
+    @pytest.mark.skipif(not HAVE_NUMBA, reason="Numba is not installed")
+    @pytest.mark.parametrize("neuron_model", neuron_models)
+    def test_python_standalone_jit(self, neuron_model, generated_modules):
+        neuron_log_ref = self._simulate("nestmlmodule_nojit", neuron_model)
+        neuron_log = self._simulate("nestmlmodule_jit", neuron_model)
+
+        assert neuron_log.keys() == neuron_log_ref.keys()
+        for var_name in neuron_log_ref.keys():
+            np.testing.assert_allclose(neuron_log[var_name], neuron_log_ref[var_name])
+
+    def test_python_standalone_jit_unknown_value(self):
+        from pynestml.codegeneration.python_standalone_code_generator import PythonStandaloneCodeGenerator
+        from pynestml.exceptions.code_generator_options_exception import CodeGeneratorOptionsException
+
+        with pytest.raises(CodeGeneratorOptionsException):
+            PythonStandaloneCodeGenerator().set_options({"jit": "cython"})
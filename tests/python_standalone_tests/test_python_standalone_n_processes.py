@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# test_python_standalone_n_processes.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib
+import os
+
+import numpy as np
+import pytest
+
+from pynestml.exceptions.code_generator_options_exception import CodeGeneratorOptionsException
+from pynestml.frontend.pynestml_frontend import generate_python_standalone_target
+
+
+class TestPythonStandaloneNProcesses:
+    r"""
+    Generate the same models with the ODE-toolbox analyses run in the current process, and in a pool of processes (``n_processes`` code generator option), and check that the recorded traces are the same.
+    """
+
+    neuron_models = ["iaf_psc_exp", "iaf_psc_alpha", "aeif_cond_exp"]
+
+    def _generate(self, target_dir, module_name, codegen_opts):
+        input_path = [os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", neuron_model + ".nestml"))
+                      for neuron_model in self.neuron_models]
+        generate_python_standalone_target(input_path, str(target_dir / module_name),
+                                          module_name=module_name,
+                                          logging_level="INFO",
+                                          codegen_opts=codegen_opts)
+
+    def _simulate(self, module_name, neuron_model, t_stop=100.):
+        simulator_module = importlib.import_module(module_name + ".simulator")
+        spike_generator_module = importlib.import_module(module_name + ".spike_generator")
+        neuron_module = importlib.import_module(module_name + "." + neuron_model)
+
+        simulator = simulator_module.Simulator()
+        sg_exc = simulator.add_neuron(spike_generator_module.SpikeGenerator(interval=10.))
+        neuron = simulator.add_neuron(getattr(neuron_module, "Neuron_" + neuron_model)(timestep=simulator.timestep))
+        simulator.connect(sg_exc, neuron, "exc_spikes", w=1000.)
+        simulator.run(t_stop)
+
+        return simulator.log[neuron]
+
+    def test_python_standalone_n_processes(self, tmp_path, monkeypatch):
+        self._generate(tmp_path, "nestmlmodule_sequential", {})
+        self._generate(tmp_path, "nestmlmodule_parallel", {"n_processes": 2})
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        for neuron_model in self.neuron_models:
+            neuron_log_ref = self._simulate("nestmlmodule_sequential", neuron_model)
+            neuron_log = self._simulate("nestmlmodule_parallel", neuron_model)
+
+            assert neuron_log.keys() == neuron_log_ref.keys()
+            for var_name in neuron_log_ref.keys():
+                np.testing.assert_allclose(neuron_log[var_name], neuron_log_ref[var_name])
+
+    def test_python_standalone_n_processes_invalid(self, tmp_path):
+        with pytest.raises(CodeGeneratorOptionsException):
+            self._generate(tmp_path, "nestmlmodule_invalid", {"n_processes": 0})
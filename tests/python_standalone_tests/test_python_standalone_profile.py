@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# test_python_standalone_profile.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import json
+import os
+import tempfile
+
+from pynestml.frontend.pynestml_frontend import generate_python_standalone_target
+
+
+class TestPythonStandaloneProfile:
+    r"""
+    Generate code with the ``profile`` and ``cprofile`` options, and check that the time spent in each phase of the toolchain, context condition and template is stored in the report directory, in JSON and in the Chrome trace event format, together with the cProfile statistics.
+    """
+
+    def test_python_standalone_profile(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "iaf_psc_exp.nestml"))
+        target_path = os.path.join(tempfile.mkdtemp(), "target")
+        generate_python_standalone_target(input_path, target_path,
+                                          module_name="nestmlmodule_profile",
+                                          profile=True,
+                                          cprofile=True)
+        report_dir = os.path.join(target_path, os.pardir, "report")
+
+        with open(os.path.join(report_dir, "profile.json")) as f:
+            profile = json.load(f)
+
+        phases = set([event["name"] for event in profile["events"] if event["category"] == "phase" and event["model"] == "iaf_psc_exp"])
+        assert {"symbol_table", "cocos", "analysis", "ode_toolbox", "namespace", "render"} <= phases
+        assert "parse" in profile["summary"]["phase"]
+        assert "check_variables_defined_before_usage" in profile["summary"]["coco"]
+        assert "@NEURON_NAME@.py.jinja2" in profile["summary"]["template"]
+        for event in profile["events"]:
+            assert event["wall_time"] >= 0. and event["cpu_time"] >= 0.
+
+        for phase_name, totals in profile["summary"]["phase"].items():
+            print(phase_name + ": " + str(totals["wall_time"]) + " s wall-clock time, " + str(totals["cpu_time"]) + " s CPU time")
+
+        with open(os.path.join(report_dir, "profile_trace.json")) as f:
+            trace = json.load(f)
+        assert len(trace["traceEvents"]) == len(profile["events"])
+        assert all([trace_event["ph"] == "X" for trace_event in trace["traceEvents"]])
+
+        assert glob.glob(os.path.join(report_dir, "profile_*_parse_iaf_psc_exp.nestml.prof"))
+        assert glob.glob(os.path.join(report_dir, "profile_*_render_iaf_psc_exp.prof"))
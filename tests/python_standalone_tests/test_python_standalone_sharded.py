@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# test_python_standalone_sharded.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_python_standalone_target
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Sharded simulation requires the \"fork\" start method")
+class TestPythonStandaloneSharded:
+    r"""
+    Check that a network that is simulated in several processes gives the same results as the serial simulation.
+    """
+
+    module_name = "nestmlmodule_sharded"
+    neuron_model = "iaf_psc_exp"
+
+    @pytest.fixture(scope="class", autouse=True)
+    def generate_code(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", self.neuron_model + ".nestml"))
+        generate_python_standalone_target(input_path, self.module_name,
+                                          module_name=self.module_name,
+                                          logging_level="INFO")
+
+    def _build_network(self, simulator, n_neurons=20, seed=123):
+        spike_generator_module = importlib.import_module(self.module_name + ".spike_generator")
+        neuron_module = importlib.import_module(self.module_name + "." + self.neuron_model)
+        neuron_class = getattr(neuron_module, "Neuron_" + self.neuron_model)
+
+        rng = np.random.default_rng(seed)
+        sgs = [simulator.add_neuron(spike_generator_module.SpikeGenerator(interval=interval)) for interval in [2., 3., 5.]]
+        neurons = [simulator.add_neuron(neuron_class(timestep=simulator.timestep)) for _ in range(n_neurons)]
+        for neuron in neurons:
+            for sg in sgs:
+                simulator.connect(sg, neuron, "exc_spikes", w=rng.uniform(2000., 4000.), delay=rng.uniform(.5, 3.))
+
+            for source in rng.choice(neurons, size=3, replace=False):
+                if source != neuron:
+                    simulator.connect(int(source), neuron, "inh_spikes", w=rng.uniform(100., 500.), delay=rng.uniform(.5, 3.))
+
+        return neurons
+
+    @pytest.mark.parametrize("n_processes", [1, 3])
+    def test_sharded_simulation(self, n_processes):
+        simulator_module = importlib.import_module(self.module_name + ".simulator")
+        sharded_simulator_module = importlib.import_module(self.module_name + ".sharded_simulator")
+
+        simulator = simulator_module.Simulator()
+        neurons = self._build_network(simulator)
+        simulator.run(50.)
+
+        sharded_simulator = sharded_simulator_module.ShardedSimulator(n_processes=n_processes)
+        sharded_neurons = self._build_network(sharded_simulator)
+        sharded_simulator.run(50.)
+
+        assert sharded_simulator.get_min_delay() == 5
+        np.testing.assert_array_equal(sharded_simulator.log["t"], simulator.log["t"])
+        for neuron, sharded_neuron in zip(neurons, sharded_neurons):
+            for var_name, values in simulator.log[neuron].items():
+                np.testing.assert_array_equal(sharded_simulator.log[sharded_neuron][var_name], values)
+
+            np.testing.assert_array_equal(sharded_simulator.neurons[sharded_neuron].get_V_m(), simulator.neurons[neuron].get_V_m())
+
+        # the network should be active
+        assert any(np.any(np.array(simulator.log[neuron]["V_m"]) == simulator.neurons[neuron].get_V_reset()) for neuron in neurons)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# test_python_standalone_state_io.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib
+import os
+
+import numpy as np
+import pytest
+
+from pynestml.frontend.pynestml_frontend import generate_python_standalone_target
+
+
+@pytest.mark.parametrize("neuron_model", ["iaf_psc_exp", "aeif_cond_exp"])
+class TestPythonStandaloneStateIO:
+    r"""
+    Check that the state of neurons and populations can be exported and imported as structured arrays without copying, and saved to and restored from ``.npz`` files.
+    """
+
+    @pytest.fixture(autouse=True)
+    def generate_code(self, neuron_model):
+        self.module_name = "nestmlmodule_state_io_" + neuron_model
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", neuron_model + ".nestml"))
+        generate_python_standalone_target(input_path, self.module_name,
+                                          module_name=self.module_name,
+                                          logging_level="INFO",
+                                          codegen_opts={"state_export": True})
+        neuron_module = importlib.import_module(self.module_name + "." + neuron_model)
+        self.neuron_class = getattr(neuron_module, "Neuron_" + neuron_model)
+        self.population_class = importlib.import_module(self.module_name + ".population").Population
+
+    def test_neuron_state(self, tmp_path):
+        neuron = self.neuron_class(timestep=.1)
+        state = neuron.get_state()
+        assert state.dtype == self.neuron_class.state_dtype
+        assert "V_m" in state.dtype.names
+        assert np.shares_memory(state, neuron.S_._data)
+
+        state["V_m"] = -42.
+        assert neuron.get_V_m() == -42.
+
+        neuron.save_state(tmp_path / "state.npz")
+        saved_state = neuron.get_state().copy()
+        for i in range(10):
+            neuron.B_.I_stim = 1000.
+            neuron.step(i * .1, .1)
+
+        assert neuron.get_V_m() != -42.
+        neuron.load_state(tmp_path / "state.npz")
+        assert neuron.get_state() == saved_state
+
+    def test_population_state(self, tmp_path):
+        pop = self.population_class(self.neuron_class, 10, timestep=.1)
+        reference_neurons = [self.neuron_class(timestep=.1) for _ in range(10)]
+        state = pop.get_state()
+        assert state.shape == (10,)
+        for i, neuron in enumerate(pop):
+            assert np.shares_memory(state[i:i + 1], neuron.S_._data)
+
+        # the population state is the storage of the neuron state
+        state["V_m"] = np.linspace(-70., -60., 10)
+        for i, (neuron, reference_neuron) in enumerate(zip(pop, reference_neurons)):
+            assert neuron.get_V_m() == state["V_m"][i]
+            reference_neuron.set_V_m(state["V_m"][i])
+
+        pop.save_state(tmp_path / "state.npz")
+        saved_state = state.copy()
+        for i in range(10):
+            for neuron, reference_neuron in zip(pop, reference_neurons):
+                neuron.B_.I_stim = reference_neuron.B_.I_stim = 1000.
+                neuron.step(i * .1, .1)
+                reference_neuron.step(i * .1, .1)
+
+        np.testing.assert_array_equal(state["V_m"], [reference_neuron.get_V_m() for reference_neuron in reference_neurons])
+
+        pop.load_state(tmp_path / "state.npz")
+        np.testing.assert_array_equal(pop.get_state(), saved_state)
+        assert pop[3].get_V_m() == saved_state["V_m"][3]
+
+        with pytest.raises(Exception):
+            pop.set_state(np.zeros(10, dtype=[("foo", np.float64)]))
+
+
+def test_state_export_disabled_by_default():
+    r"""
+    Without the ``state_export`` option, state variables keep their declared type, such as the integer refractory counter of ``iaf_psc_exp``.
+    """
+    module_name = "nestmlmodule_state_io_default"
+    input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "iaf_psc_exp.nestml"))
+    generate_python_standalone_target(input_path, module_name,
+                                      module_name=module_name,
+                                      logging_level="INFO")
+    neuron_class = importlib.import_module(module_name + ".iaf_psc_exp").Neuron_iaf_psc_exp
+
+    neuron = neuron_class(timestep=.1)
+    assert neuron_class.state_dtype is None
+    assert isinstance(neuron.S_.r, int)
+    with pytest.raises(Exception):
+        neuron.get_state()
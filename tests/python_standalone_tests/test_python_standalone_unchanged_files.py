@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# test_python_standalone_unchanged_files.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import time
+
+from pynestml.frontend.pynestml_frontend import generate_python_standalone_target
+
+
+class TestPythonStandaloneUnchangedFiles:
+    r"""
+    Generate the same model twice into the same target directory, and check that the generated files are not written again the second time, so that their modification time is preserved.
+    """
+
+    target_path = "nestmlmodule_unchanged_files"
+
+    def _generate(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "iaf_psc_exp.nestml"))
+        generate_python_standalone_target(input_path, self.target_path,
+                                          module_name=self.target_path,
+                                          logging_level="INFO")
+
+    def _get_modification_times(self):
+        return {fn: os.stat(fn).st_mtime_ns for fn in glob.glob(os.path.join(self.target_path, "*.py"))}
+
+    def test_python_standalone_unchanged_files(self):
+        self._generate()
+        mtimes = self._get_modification_times()
+        assert len(mtimes) > 0
+
+        time.sleep(.1)
+        self._generate()
+        assert self._get_modification_times() == mtimes
@@ -22,13 +22,14 @@ import os
 import unittest
 
 from pynestml.utils.ast_source_location import ASTSourceLocation
-from pynestml.symbol_table.scope import ScopeType
+from pynestml.symbol_table.scope import Scope, ScopeType
 from pynestml.symbol_table.symbol_table import SymbolTable
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.variable_symbol import BlockType, VariableSymbol
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.model_parser import ModelParser
 
@@ -66,6 +67,33 @@ class SymbolTableResolutionTest(unittest.TestCase):
         res7 = scope.resolve_to_all_scopes('test6', SymbolKind.VARIABLE)
         self.assertTrue(res7 is not None and res7.get_scope_type() == ScopeType.UPDATE)
 
+    def test_add_delete_update_symbols(self):
+        """Check that symbols that are added, deleted or replaced in a scope are resolved accordingly"""
+        global_scope = Scope(ScopeType.GLOBAL)
+        update_scope = Scope(ScopeType.UPDATE, enclosing_scope=global_scope)
+        global_scope.add_scope(update_scope)
+
+        symbol_a = VariableSymbol(scope=global_scope, name="a", block_type=BlockType.STATE)
+        symbol_b = VariableSymbol(scope=update_scope, name="b", block_type=BlockType.LOCAL)
+        global_scope.add_symbol(symbol_a)
+        global_scope.add_symbol(symbol_a)
+        update_scope.add_symbol(symbol_b)
+        self.assertEqual(global_scope.get_symbols_in_this_scope(), [symbol_a])
+        self.assertEqual(global_scope.get_scopes(), [update_scope])
+        self.assertIs(update_scope.resolve_to_symbol("a", SymbolKind.VARIABLE), symbol_a)
+        self.assertIs(global_scope.resolve_to_all_symbols("b", SymbolKind.VARIABLE), symbol_b)
+        self.assertIsNone(global_scope.resolve_to_symbol("a", SymbolKind.FUNCTION))
+
+        new_symbol_a = VariableSymbol(scope=global_scope, name="a", block_type=BlockType.PARAMETERS)
+        global_scope.update_variable_symbol(new_symbol_a)
+        self.assertEqual(global_scope.get_symbols_in_this_scope(), [new_symbol_a])
+        self.assertIs(update_scope.resolve_to_symbol("a", SymbolKind.VARIABLE), new_symbol_a)
+
+        self.assertTrue(update_scope.delete_symbol(symbol_b))
+        self.assertFalse(update_scope.delete_symbol(symbol_b))
+        self.assertIsNone(update_scope.resolve_to_symbol("b", SymbolKind.VARIABLE))
+        self.assertEqual(update_scope.get_symbols_in_this_scope(), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# template_env_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+import unittest
+
+from jinja2 import Environment, FileSystemLoader
+
+from pynestml.codegeneration.code_generator import CodeGenerator
+from pynestml.codegeneration.nest_code_generator import NESTCodeGenerator
+from pynestml.utils.logger import LoggingLevel, Logger
+
+
+class TemplateEnvTest(unittest.TestCase):
+    """
+    Check that the jinja2 template environment is shared between code generators, so that each template is compiled only once per process. The time to set up the templates of the NEST code generator, including the large templates that are included by the model templates, is printed for a fresh environment (as before the environment was shared), for the first use of the shared environment (which can use the bytecode cache on disk) and for subsequent uses.
+    """
+
+    nest_templates = ["common/NeuronClass.jinja2", "common/NeuronHeader.jinja2", "common/SynapseHeader.h.jinja2"]
+
+    def setUp(self):
+        Logger.init_logger(LoggingLevel.ERROR)
+
+    def _setup_templates(self, env: Environment = None) -> float:
+        start_time = time.perf_counter()
+        codegen = NESTCodeGenerator(options={"nest_version": "v3.5"})
+        if env is None:
+            env = codegen._model_templates["neuron"][0].environment
+        for template_name in self.nest_templates:
+            env.get_template(template_name)
+        return time.perf_counter() - start_time
+
+    def test_template_env(self):
+        template_dirs = NESTCodeGenerator(options={"nest_version": "v3.5"})._model_templates["neuron"][0].environment.loader.searchpath
+        wall_time_unshared = self._setup_templates(Environment(loader=FileSystemLoader(template_dirs)))
+
+        CodeGenerator._template_envs.clear()
+        wall_time_first = self._setup_templates()
+        wall_time_second = self._setup_templates()
+        print("Template setup: " + str(wall_time_unshared) + " s with a new environment, " + str(wall_time_first)
+              + " s for the first and " + str(wall_time_second) + " s for the second use of the shared environment")
+
+        # both code generators use the same environment, and thus the same compiled templates
+        codegen1 = NESTCodeGenerator(options={"nest_version": "v3.5"})
+        codegen2 = NESTCodeGenerator(options={"nest_version": "v3.5"})
+        assert codegen1._model_templates["neuron"][0].environment is codegen2._model_templates["neuron"][0].environment
+        assert all(t1 is t2 for t1, t2 in zip(codegen1._model_templates["neuron"], codegen2._model_templates["neuron"]))